@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from collections import Counter
+from copy import deepcopy
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 import re
 from typing import Any
@@ -768,6 +770,7 @@ TRACKING_QUERY_PARAMS = {
 }
 
 
+@lru_cache(maxsize=8192)
 def canonicalize_job_url(url: str) -> str:
     """Normalise a job URL for high-confidence URL-level dedupe."""
     raw = str(url or "").strip()
@@ -787,7 +790,21 @@ def canonicalize_job_url(url: str) -> str:
 
 
 def council_job_source_registry_payload(council_master: dict[str, Any] | None = None) -> dict[str, Any]:
-    master = council_master or load_council_master()
+    if not council_master:
+        # Callers edit the rows they get back, so each gets its own copy of
+        # the cached default.
+        return deepcopy(_default_council_job_source_registry_payload())
+    return _build_council_job_source_registry_payload(council_master)
+
+
+@lru_cache(maxsize=1)
+def _default_council_job_source_registry_payload() -> dict[str, Any]:
+    # The default registry is static reference data; build it on first use
+    # rather than on every intake, accumulator and route call.
+    return _build_council_job_source_registry_payload(load_council_master())
+
+
+def _build_council_job_source_registry_payload(master: dict[str, Any]) -> dict[str, Any]:
     rows = [_council_source_row(row) for row in master.get("rows", [])]
     rows = sorted(rows, key=lambda row: (row["poll_tier"], row["council_name"]))
     platform_counts = Counter(row["platform_family"] for row in rows)
@@ -890,6 +907,7 @@ def _council_source_row(master_row: dict[str, Any]) -> dict[str, Any]:
         "company_code": overlay.get("company_code"),
         "embed_url": overlay.get("embed_url"),
         "portal_code": overlay.get("portal_code"),
+        "max_jobs": overlay.get("max_jobs"),
         "endpoint_candidates": endpoint_candidates,
         "robots_status": "not_checked",
         "terms_review_status": "not_checked",
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import json
 from pathlib import Path
 from typing import Any
 
-try:
-    import fitz
-except ModuleNotFoundError:  # pragma: no cover - optional at import time
-    fitz = None  # type: ignore[assignment]
+
+@lru_cache(maxsize=1)
+def _pymupdf_module() -> Any:
+    # Shared with job intake's PDF extraction. Deferred to first use because
+    # PyMuPDF costs ~100ms to import and the workbench loads this module at
+    # startup; cached so a missing install is not re-searched per document.
+    try:
+        import fitz
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+    return fitz
 
 
 class DocumentPageError(Exception):
@@ -40,7 +48,11 @@ class DocumentPageService:
         self.pdf_dir = pdf_dir
         self.cache_dir = cache_dir
         self.page_render_dpi = page_render_dpi
-        self._fitz = fitz if fitz_module is None else fitz_module
+        self._fitz_module = fitz_module
+
+    @property
+    def _fitz(self) -> Any | None:
+        return _pymupdf_module() if self._fitz_module is None else self._fitz_module
 
     def require_fitz(self) -> None:
         if self._fitz is None:
@@ -37,6 +37,15 @@ def load_candidate_rows_from_path(path: Path) -> list[dict[str, Any]]:
     return records
 
 
+def clone_json_value(value: Any) -> Any:
+    """Deep-copy a JSON-shaped value without a dumps/loads round trip."""
+    if isinstance(value, dict):
+        return {key: clone_json_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [clone_json_value(item) for item in value]
+    return value
+
+
 def map_candidate_agreements(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
     mapped: dict[str, dict[str, Any]] = {}
     for record in rows:
@@ -170,7 +179,7 @@ def build_intake_candidate_rows_from_sources(
         if not ae_id:
             continue
 
-        metadata = json.loads(json.dumps(row))
+        metadata = clone_json_value(row)
         matched_lgas = candidate_lgas(row)
         title = str(row.get("Agreement Title") or "").strip()
         pipeline_status = str(row.get("pipeline_status") or "unknown")
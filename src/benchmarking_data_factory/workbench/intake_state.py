@@ -6,6 +6,7 @@ from typing import Any, Callable
 
 from benchmarking_data_factory.workbench.intake_candidates import (
     VALID_INTAKE_DECISIONS,
+    clone_json_value,
     intake_decisions_payload,
     load_candidate_rows_from_path,
     load_intake_decisions_from_path,
@@ -85,7 +86,7 @@ def fetch_metadata_for_ae_id(
     metadata = load_candidate_agreements().get(parent_ae_id)
     if metadata is None:
         return None
-    cloned = json.loads(json.dumps(metadata))
+    cloned = clone_json_value(metadata)
     if split_slug:
         assigned_lga = resolve_assigned_lga(
             ae_id,
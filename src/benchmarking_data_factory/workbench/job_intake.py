@@ -1,8 +1,10 @@
 """Lightweight official-source job intake preview."""
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from html import unescape
 from html.parser import HTMLParser
@@ -12,20 +14,27 @@ import json
 import os
 from pathlib import Path
 import re
+import shutil
 import subprocess
-from threading import Lock
-from typing import Any, Callable
-from urllib.parse import quote_plus, urlencode, urljoin, urlsplit, urlunsplit
-import xml.etree.ElementTree as ET
-import zipfile
+import time
+from types import MappingProxyType
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Iterator
+from urllib.parse import SplitResult, quote_plus, urlencode, urljoin, urlsplit, urlunsplit
 
 # Some local HTTPS inspection tools expose SSLKEYLOGFILE as a named pipe. If that
 # handle goes stale, urllib3 can fail before a request is even issued.
 os.environ.pop("SSLKEYLOGFILE", None)
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
 import urllib3
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional speed-up
+    orjson = None  # type: ignore[assignment]
+
 from benchmarking_data_factory.reference.council_jobs import (
     canonicalize_job_url,
     council_job_source_registry_payload,
@@ -33,7 +42,9 @@ from benchmarking_data_factory.reference.council_jobs import (
     POLL_TIER_EXPLAINER,
     SECONDARY_SOURCES,
 )
+from benchmarking_data_factory.workbench.document_pages import _pymupdf_module
 from benchmarking_data_factory.workbench.job_schema import (
+    HtmlTextExtractor,
     enrich_job_with_pay_rows,
     html_to_text,
     normalize_council_job_record,
@@ -54,10 +65,203 @@ BROWSER_COMPAT_HEADERS = {
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
-JOB_INTAKE_SNAPSHOT_PATH = Path(__file__).resolve().parents[3] / "var" / "job_intake" / "scrape_preview_snapshot.json"
-JOB_INTAKE_SECONDARY_SNAPSHOT_PATH = Path(__file__).resolve().parents[3] / "var" / "job_intake" / "secondary_preview_snapshot.json"
-JOB_INTAKE_ACCUMULATOR_PATH = Path(__file__).resolve().parents[3] / "var" / "job_intake" / "checked_job_accumulator.json"
-JOB_INTAKE_CANDIDATE_LEDGER_PATH = Path(__file__).resolve().parents[3] / "var" / "job_intake" / "observed_job_candidates.json"
+JOB_INTAKE_VAR_DIR = Path(__file__).resolve().parents[3] / "var" / "job_intake"
+JOB_INTAKE_SNAPSHOT_PATH = JOB_INTAKE_VAR_DIR / "scrape_preview_snapshot.json"
+JOB_INTAKE_SECONDARY_SNAPSHOT_PATH = JOB_INTAKE_VAR_DIR / "secondary_preview_snapshot.json"
+JOB_INTAKE_ACCUMULATOR_PATH = JOB_INTAKE_VAR_DIR / "checked_job_accumulator.json"
+JOB_INTAKE_CANDIDATE_LEDGER_PATH = JOB_INTAKE_VAR_DIR / "observed_job_candidates.json"
+JOB_INTAKE_HTTP_CACHE_DIR = JOB_INTAKE_VAR_DIR / "http_cache"
+# Listing pages change at most a few times a day. Within the fresh window a
+# cached body is reused outright; after it, the cache only supplies ETag and
+# Last-Modified validators so unchanged pages come back as a bodyless 304.
+JOB_INTAKE_HTTP_CACHE_FRESH_SECONDS = 900
+# Pages and documents that drop off every listing are never asked for again.
+# Entries not stored, revalidated or reused for this long are deleted, checked
+# at most once per interval while a run is storing new entries.
+JOB_INTAKE_HTTP_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600
+JOB_INTAKE_HTTP_CACHE_PRUNE_INTERVAL_SECONDS = 3600
+# Detail pages usually sit on the same host as their listing, so the detail
+# phase fans out across all workers but caps in-flight requests per host.
+DETAIL_FETCH_PER_HOST_LIMIT = 3
+# Listing pages from shared vendors (Pulse, ApplyNow, Jora, ...) get the same
+# per-host politeness cap when many councils are fetched in one pool.
+LISTING_FETCH_PER_HOST_LIMIT = 2
+# Detail pages for jobs from listings that have already come back are fetched
+# while slower listings are still loading; this many pages at most are held
+# in memory ahead of the detail phase.
+DETAIL_PREFETCH_LIMIT = 100
+# Embedded boards found on one listing page are scraped side by side, at most
+# this many at once, since every listing worker may open such a pool.
+EMBEDDED_SOURCE_WORKERS = 4
+# A 429/503 is retried after the server's Retry-After (in seconds) or an
+# exponential backoff, capped so one overloaded host cannot stall a run.
+HTTP_RETRY_STATUSES = frozenset({429, 503})
+HTTP_RETRY_ATTEMPTS = 2
+HTTP_RETRY_BACKOFF_SECONDS = 1.0
+HTTP_RETRY_MAX_WAIT_SECONDS = 8.0
+# A council host that is down never completes the TCP/TLS handshake; give up
+# on the connection quickly and keep the caller's timeout for reading pages.
+HTTP_CONNECT_TIMEOUT_SECONDS = 3.05
+HTTP_POOL_HOSTS = 64
+HTTP_POOL_CONNECTIONS_PER_HOST = 8
+ATTACHMENT_FETCH_WORKERS = 8
+# Attachment links sometimes resolve to a thumbnail, font or stylesheet rather
+# than the document; those bodies are never downloaded because only text is read.
+NON_DOCUMENT_CONTENT_TYPE_PREFIXES = ("image/", "font/", "audio/", "video/", "text/css")
+NON_DOCUMENT_URL_SUFFIXES = (
+    ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico",
+    ".woff", ".woff2", ".ttf", ".otf", ".css", ".js",
+    ".mp3", ".mp4", ".m4v", ".mov", ".webm",
+)
+# PDF text layers carry stray C0 control characters (NUL, BEL, ESC...) that
+# str.split() does not treat as whitespace; they are dropped in one translate
+# pass rather than leaking into job text, snapshots and exports.
+_PDF_CONTROL_CHARACTERS = dict.fromkeys([*range(0x00, 0x09), *range(0x0E, 0x1C), 0x7F])
+
+_PULSE_WEB_SERVICE_URL_RE = re.compile(r"_webServiceUrl\s*=\s*['\"]([^'\"]+)")
+_PULSE_JOBS_API_PATH = "RCM/Jobs/Jobs?internalOnly=false&workArrangement=&employmentType="
+_PULSE_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+_MONTH_NAME_PATTERN = (
+    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?"
+    r"|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
+)
+_CAREERS_AT_COUNCIL_POSTED_RE = re.compile(
+    rf"\bPosted:\s*((?:\d+\s+days?\s+ago)|(?:\d{{1,2}}\s+{_MONTH_NAME_PATTERN}))\b",
+    re.I,
+)
+_CAREERS_AT_COUNCIL_CLOSES_RE = re.compile(rf"\bCloses:\s*(\d{{1,2}}\s+{_MONTH_NAME_PATTERN})\b", re.I)
+_JORA_POSTED_RE = re.compile(r"\bPosted\s+((?:\d+\s*(?:d|day|days)|\d+\s*(?:mo|month|months))\s+ago)\b", re.I)
+_DAYS_AGO_RE = re.compile(r"(\d+)\s*(?:d|day|days)\s+ago", re.I)
+_MONTHS_AGO_RE = re.compile(r"(\d+)\s*(?:mo|month|months)\s+ago", re.I)
+_JOB_URL_YEAR_RE = re.compile(r"(?<!\d)(20\d{2})(?:[01]\d[0-3]\d)?(?!\d)")
+_YEAR_RE = re.compile(r"\b20\d{2}\b")
+_URL_SLUG_REFERENCE_PREFIX_RE = re.compile(r"^[A-Za-z]{1,6}\d{2,}-")
+_TITLE_IMAGE_PREFIX_RE = re.compile(r"^Image\s+", re.I)
+_TITLE_CALL_TO_ACTION_RE = re.compile(r"\b(Read more|Apply now|View details|View Job|View)\b", re.I)
+_TITLE_CUT_RES = (
+    re.compile(r"\s+Applications?\s+clos(?:e|ing)\s+on\b", re.I),
+    re.compile(r"\s+(?:Are you|We are|Council is seeking)\b"),
+    re.compile(r"\s+(?:Type|Duration|Salary)\s+"),
+)
+_TITLE_EMPLOYER_SUFFIX_RE = re.compile(r"\s+at\s+.+?•")
+_EMBEDDED_DOCUMENT_URL_RE = re.compile(
+    r"""(?P<url>(?:https?:)?//[^\s"'<>]+?(?:\.pdf|\.docx?|\.rtf|TransferFile\.ashx|gf-download=)[^\s"'<>]*)""",
+    re.I,
+)
+_ATTACHMENT_LABEL_RE = re.compile(
+    "|".join(re.escape(token) for token in (
+        "position description",
+        "position profile",
+        "position document",
+        "role description",
+        "job description",
+        "candidate pack",
+        "information pack",
+    ))
+)
+_ATTACHMENT_URL_TOKEN_RE = re.compile(
+    "|".join(re.escape(token) for token in (
+        "position-description",
+        "role-description",
+        "job-description",
+        "candidate-pack",
+        "information-pack",
+        "position_profile",
+        "position-profile",
+        "/pd-",
+        "pd_",
+    ))
+)
+# Share buttons and tag managers often carry a position-description URL in
+# their query string; these hosts never serve the document itself, so their
+# links are dropped before they become attachment fetches.
+_THIRD_PARTY_LINK_HOST_SUFFIXES = (
+    "addthis.com",
+    "doubleclick.net",
+    "facebook.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "hotjar.com",
+    "linkedin.com",
+    "pinterest.com",
+    "reddit.com",
+    "sharethis.com",
+    "twitter.com",
+    "whatsapp.com",
+    "x.com",
+)
+_PD_LABEL_RE = re.compile(r"\bpd\b")
+_PD_URL_WORD_RE = re.compile(r"\b(pd|position|description)\b")
+_POSITION_DESCRIPTION_LABEL_RE = re.compile(r"position description|role description|\bpd\b")
+_POSITION_DESCRIPTION_URL_RE = re.compile(r"position-description|role-description|pd[-_]")
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+_COUNCIL_KEY_NOISE_RE = re.compile(r"\b(city|shire|rural|borough|council|city council|shire council)\b")
+_TRAILING_COUNCIL_RE = re.compile(r"\bCouncil\b$", re.I)
+_PAGEUP_DETAIL_PATH_RE = re.compile(r"/(?:cw/[a-z]{2}/|[a-z]{2}/)job/\d+/")
+_RECRUITMENTHUB_DETAIL_PATH_RE = re.compile(r"/(?:Vacancies|Current-vacancies)/\d+/title/")
+_APPLYNOW_DETAIL_PATH_RE = re.compile(r"/jobs/(?:ni/)?[A-Za-z0-9]+(?:-[^/]+)?$")
+_SMARTRECRUITERS_DETAIL_PATH_RE = re.compile(r"/[^/]+/\d+")
+_ELMO_DETAIL_PATH_RE = re.compile(r"/careers/[^/]+/job/view/[^/]+")
+_AURION_DETAIL_PATH_RE = re.compile(r"/(?:jobs/)?vacancies/[^/]+/edit$")
+_ORACLE_HCM_DETAIL_PATH_RE = re.compile(r"/hcmUI/CandidateExperience/.+/job/[^/]+$")
+_DAYFORCE_DETAIL_PATH_RE = re.compile(r"/jobs/[^/]+$")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_TABLE_CELL_RE = re.compile(r"<td\b[^>]*>(?P<body>.*?)</td>", re.I | re.S)
+_ANCHOR_HREF_TITLE_RE = re.compile(r"<a\s+[^>]*href=[\"'](?P<href>[^\"']+)[\"'][^>]*>(?P<title>.*?)</a>", re.I | re.S)
+_WORK_TYPE_RE = re.compile(r"\b(Full Time|Part Time|Contractual|Casual|Expression of Interest)\b", re.I)
+_SALARY_LABEL_RE = re.compile(r"\bSalary:\s*", re.I)
+_COUNCIL_DIRECT_SALARY_RE = re.compile(r"\bSalary:\s*(?P<salary>.*?)(?:\s+VIC\s+\(Victoria\)|$)", re.I)
+_LGJ_CARD_HREF_RE = re.compile(
+    r'href="(?P<href>https://www\.localgovernmentjobs\.com\.au/job/(?!autocomplete)[^"]+)"',
+    re.I,
+)
+_LGJ_CARD_SALARY_RE = re.compile(
+    r"\b(?:Salary\s+)?((?:Competitive)|(?:\$[\d,]+(?:\s*(?:-|to)\s*\$?[\d,]+)?"
+    r"(?:\s*(?:pa|per annum|p/a|hour|weekly|fortnightly|monthly))?))\b",
+    re.I,
+)
+_JORA_PANEL_METADATA_RE = re.compile(r'data-braze-job-panel-view=["\'](?P<json>[^"\']+)["\']', re.I | re.S)
+_AURION_POSITION_CELL_RE = re.compile(r'data-th="Position"[^>]*>(?P<title>.*?)</td>', re.I | re.S)
+_GF_DOWNLOAD_QUERY_RE = re.compile(r"(?:^|[?&])gf-download=([^&]+)")
+_DOCUMENT_EXTENSION_RE = re.compile(r"\.(?:pdf|docx?|rtf)$", re.I)
+_SLUG_SEPARATOR_RE = re.compile(r"[-_]+")
+_R_NUMBER_JOB_ID_RE = re.compile(r"(R\d+)(?:/?$|[?#])", re.I)
+_SALARY_HINT_RE = re.compile(r"\$|salary|remuneration|per annum|\bpa\b|\bp/a\b", re.I)
+_JORA_SALARY_RE = re.compile(
+    r"\$[\d,]+(?:\.\d{1,2})?(?:\s*(?:-|to|–|—)\s*\$?[\d,]+(?:\.\d{1,2})?)?\s*(?:a year|per annum|pa|p/a|an hour|per hour|hour|weekly|per week)?",
+    re.I,
+)
+_HTML_LIST_ITEM_RE = re.compile(r"<li[^>]*>(?P<body>.*?)</li>", re.I | re.S)
+_ELMO_LIST_GROUP_ITEM_RE = re.compile(r"<li\b(?=[^>]*\blist-group-item\b)[^>]*>(?P<body>.*?)</li>", re.I | re.S)
+_ELMO_SECTION_LIST_RE = re.compile(
+    r"<div[^>]+id=[\"']section-list[\"'][^>]*>(?P<body>.*?)</div>\s*<div[^>]+class=[\"'][^\"']*\belmo-pagination\b",
+    re.I | re.S,
+)
+_ELMO_SUMMARY_COLUMN_RE = re.compile(
+    r"<div[^>]+class=[\"'][^\"']*\bcol-md-8\b[^\"']*\brt-editor\b[^\"']*[\"'][^>]*>(?P<body>.*?)</div>\s*<div[^>]+class=[\"'][^\"']*\bcol-md-4\b",
+    re.I | re.S,
+)
+_ELMO_IFRAME_SRC_RE = re.compile(r"<iframe[^>]+src=[\"'](?P<src>[^\"']*elmotalent\.com\.au[^\"']*)[\"']", re.I)
+_OPENCITIES_ARTICLE_RE = re.compile(
+    r"<article[^>]*>\s*<a\s+href=[\"'](?P<href>[^\"']+)[\"'][^>]*>(?P<body>.*?)</a>\s*</article>",
+    re.I | re.S,
+)
+_OPENCITIES_TITLE_RE = re.compile(
+    r"<h[1-6][^>]*class=[\"'][^\"']*\blist-item-title\b[^\"']*[\"'][^>]*>(?P<body>.*?)</h[1-6]>",
+    re.I | re.S,
+)
+_OPENCITIES_CLOSING_RE = re.compile(
+    r"<p[^>]*class=[\"'][^\"']*\bapplications-closing\b[^\"']*[\"'][^>]*>(?P<body>.*?)</p>",
+    re.I | re.S,
+)
+_OPENCITIES_DESCRIPTION_PARAGRAPH_RE = re.compile(r"<p(?![^>]*\bapplications-closing\b)[^>]*>(.*?)</p>", re.I | re.S)
+_OPENCITIES_CLOSING_PREFIX_RE = re.compile(r"^Applications?\s+clos(?:e|ing)\s+on\s+", re.I)
+_JOB_ID_QUERY_RE = re.compile(r"(?:^|[?&])jobId=([^&]+)")
+_ADVERT_ID_QUERY_RE = re.compile(r"(?:^|[?&])AdvertID=([^&]+)")
+_ELMO_CARD_FIELD_RE = re.compile(
+    r"<div[^>]+class=[\"'][^\"']*\bcol-md-10\b[^\"']*\bcol-sm-10\b[^\"']*\bcol-xs-10\b[^\"']*[\"'][^>]*>(?P<body>.*?)</div>",
+    re.I | re.S,
+)
 
 STAGE1_REQUIRED_FIELDS = [
     {"id": "job_uid", "label": "Job UID", "paths": ("job_uid",)},
@@ -94,7 +298,7 @@ STAGE1_OPTIONAL_FIELDS = [
 ]
 
 
-COMPLETION_ACTION_DEFINITIONS = {
+COMPLETION_ACTION_DEFINITIONS = MappingProxyType({
     "governed": {
         "label": "Governed",
         "description": "Band 1-8 evidence is already available on the canonical job record.",
@@ -130,7 +334,17 @@ COMPLETION_ACTION_DEFINITIONS = {
         "description": "Use sector aggregators to find missing official evidence or alternate application URLs.",
         "priority": 50,
     },
-}
+})
+
+# Read-only templates shared by every worker thread; callers copy before use.
+EMPTY_DETAIL_ENRICHMENT_SUMMARY = MappingProxyType({
+    "attempted": 0,
+    "succeeded": 0,
+    "details_parsed": 0,
+    "document_attempted": 0,
+    "document_succeeded": 0,
+    "documents_parsed": 0,
+})
 
 
 @dataclass(frozen=True)
@@ -168,12 +382,165 @@ class ListingLinkParser(HTMLParser):
         self._current_text = []
 
 
+class DetailPageParser(HTMLParser):
+    """Tokenise a detail page once for both its visible text and its links."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._text = HtmlTextExtractor()
+        self._links = ListingLinkParser()
+
+    @property
+    def links(self) -> list[ListingLink]:
+        return self._links.links
+
+    def text(self) -> str:
+        return self._text.text()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._text.handle_starttag(tag, attrs)
+        self._links.handle_starttag(tag, attrs)
+
+    def handle_data(self, data: str) -> None:
+        self._text.handle_data(data)
+        self._links.handle_data(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._text.handle_endtag(tag)
+        self._links.handle_endtag(tag)
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    # One pooled session keeps keep-alive connections per host across listing,
+    # feed, detail and document fetches instead of a new TLS handshake each.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_CONNECTIONS_PER_HOST)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Hosts whose certificate chain failed verification once this run. Later
+# fetches go straight to the unverified retry instead of re-failing the
+# verified handshake for every detail page and document on that host.
+_TLS_UNVERIFIED_HOSTS: set[str] = set()
+
+
+def _tls_verify_for(url: str) -> bool:
+    return urlsplit(url).netloc.lower() not in _TLS_UNVERIFIED_HOSTS
+
+
+def _remember_tls_unverified(url: str) -> None:
+    _TLS_UNVERIFIED_HOSTS.add(urlsplit(url).netloc.lower())
+
+
+# Hosts that rejected the identified user agent with 403/406 but served the
+# browser-compatible headers; their later fetches skip the rejected attempt.
+_BROWSER_COMPAT_HOSTS: set[str] = set()
+
+
+def _prefers_browser_compat(url: str) -> bool:
+    return urlsplit(url).netloc.lower() in _BROWSER_COMPAT_HOSTS
+
+
+def _remember_browser_compat(url: str) -> None:
+    _BROWSER_COMPAT_HOSTS.add(urlsplit(url).netloc.lower())
+
+
+# Hosts whose challenge page the PowerShell fallback could not get past this
+# run. Each attempt spawns a shell and walks every header set to its timeout,
+# so later pages on the same host fail fast instead of waiting it out again.
+_BROWSER_FALLBACK_FAILED_HOSTS: set[str] = set()
+
+# Hosts whose challenge page only the PowerShell fallback got past this run.
+# Their later pages go to it first rather than being challenged again on the
+# plain and browser-compatible requests attempts.
+_BROWSER_FALLBACK_HOSTS: set[str] = set()
+
+# The workbench process is long-lived, so the host memos above only hold for
+# the outermost preview or refresh in flight: a certificate fixed or a
+# challenge lifted since the last run is tried the normal way again. Previews
+# nested or overlapping inside one refresh share its memos.
+_HOST_MEMO_LOCK = Lock()
+_HOST_MEMO_RUN_DEPTH = 0
+
+
+@contextmanager
+def _host_memo_run() -> Iterator[None]:
+    global _HOST_MEMO_RUN_DEPTH
+    with _HOST_MEMO_LOCK:
+        if _HOST_MEMO_RUN_DEPTH == 0:
+            _reset_host_memos()
+        _HOST_MEMO_RUN_DEPTH += 1
+    try:
+        yield
+    finally:
+        with _HOST_MEMO_LOCK:
+            _HOST_MEMO_RUN_DEPTH -= 1
+
+
+def _reset_host_memos() -> None:
+    _TLS_UNVERIFIED_HOSTS.clear()
+    _BROWSER_COMPAT_HOSTS.clear()
+    _BROWSER_FALLBACK_FAILED_HOSTS.clear()
+    _BROWSER_FALLBACK_HOSTS.clear()
+
+
+# Earliest time each throttled host may be asked again. Shared by every
+# worker, so one 429 pauses the whole pool's traffic to that host rather
+# than each worker discovering the limit on its own.
+_HOST_RETRY_NOT_BEFORE: dict[str, float] = {}
+_HOST_RETRY_LOCK = Lock()
+
+
 def _requests_get(url: str, **kwargs: Any) -> requests.Response:
+    host = urlsplit(url).netloc.lower()
+    for attempt in range(HTTP_RETRY_ATTEMPTS + 1):
+        _wait_for_host_retry_window(host)
+        response = _send_get(url, **kwargs)
+        if response.status_code not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRY_ATTEMPTS:
+            return response
+        delay = _retry_delay_seconds(response, attempt)
+        with _HOST_RETRY_LOCK:
+            _HOST_RETRY_NOT_BEFORE[host] = max(
+                _HOST_RETRY_NOT_BEFORE.get(host, 0.0),
+                time.monotonic() + min(delay, HTTP_RETRY_MAX_WAIT_SECONDS),
+            )
+        if delay > HTTP_RETRY_MAX_WAIT_SECONDS:
+            # The host asked for a longer pause than a run will wait; sleeping
+            # the capped wait would only buy another throttled response.
+            return response
+        response.close()
+    return response
+
+
+def _wait_for_host_retry_window(host: str) -> None:
+    with _HOST_RETRY_LOCK:
+        not_before = _HOST_RETRY_NOT_BEFORE.get(host)
+    if not_before is None:
+        return
+    remaining = not_before - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def _retry_delay_seconds(response: requests.Response, attempt: int) -> float:
+    retry_after = str(response.headers.get("retry-after") or "").strip()
+    if retry_after.isdigit():
+        return float(retry_after)
+    return HTTP_RETRY_BACKOFF_SECONDS * (2 ** attempt)
+
+
+def _send_get(url: str, **kwargs: Any) -> requests.Response:
+    timeout = kwargs.get("timeout")
+    if isinstance(timeout, (int, float)):
+        kwargs["timeout"] = (min(HTTP_CONNECT_TIMEOUT_SECONDS, timeout), timeout)
     try:
-        return requests.get(url, **kwargs)
+        return _http_session().get(url, **kwargs)
     except RequestException as error:
         if _is_permission_denied_network_error(error) and os.environ.pop("SSLKEYLOGFILE", None):
-            return requests.get(url, **kwargs)
+            return _http_session().get(url, **kwargs)
         raise
 
 
@@ -198,23 +565,48 @@ def _is_permission_denied_network_error(error: BaseException) -> bool:
 
 
 def fetch_listing_html(url: str, *, timeout: int = 8) -> tuple[str, dict[str, Any]]:
+    cached = _load_http_cache_entry(url)
+    if cached and time.time() - float(cached.get("stored_at") or 0) < JOB_INTAKE_HTTP_CACHE_FRESH_SECONDS:
+        return cached["text"], {**cached["meta"], "cache_status": "fresh"}
+    if urlsplit(url).netloc.lower() in _BROWSER_FALLBACK_HOSTS:
+        powershell_result = _fetch_with_powershell_browser(url, timeout=timeout)
+        if powershell_result:
+            return powershell_result
     headers = {"User-Agent": JOB_INTAKE_USER_AGENT}
-    verify_used: bool | str = True
+    browser_compat = _prefers_browser_compat(url)
+    conditional_headers = {
+        **(BROWSER_COMPAT_HEADERS if browser_compat else headers),
+        **_http_cache_validators(cached),
+    }
+    verify_used: bool | str = _tls_verify_for(url)
+    # Stream the body so a job link that resolves to an image, font,
+    # stylesheet or media file is dropped after its headers arrive.
     try:
-        response = _requests_get(url, headers=headers, timeout=timeout)
+        response = _requests_get(url, headers=conditional_headers, timeout=timeout, verify=verify_used, stream=True)
     except requests.exceptions.SSLError:
+        _remember_tls_unverified(url)
         verify_used = False
-        response = _requests_get(url, headers=headers, timeout=timeout, verify=False)
-    user_agent_mode = "identified"
-    if response.status_code in {403, 406}:
+        response = _requests_get(url, headers=conditional_headers, timeout=timeout, verify=False, stream=True)
+    if response.status_code == 304 and cached:
+        response.close()
+        _touch_http_cache_entry(url)
+        return cached["text"], {**cached["meta"], "cache_status": "revalidated"}
+    user_agent_mode = "browser_compat" if browser_compat else "identified"
+    if response.status_code in {403, 406} and not browser_compat:
+        response.close()
         try:
-            response = _requests_get(url, headers=BROWSER_COMPAT_HEADERS, timeout=timeout, verify=verify_used)
+            response = _requests_get(url, headers=BROWSER_COMPAT_HEADERS, timeout=timeout, verify=verify_used, stream=True)
             user_agent_mode = "browser_compat"
         except requests.exceptions.SSLError:
             verify_used = False
-            response = _requests_get(url, headers=BROWSER_COMPAT_HEADERS, timeout=timeout, verify=False)
+            response = _requests_get(url, headers=BROWSER_COMPAT_HEADERS, timeout=timeout, verify=False, stream=True)
             user_agent_mode = "browser_compat"
+        if response.status_code not in {403, 406}:
+            _remember_browser_compat(url)
     if response.status_code == 403 and _is_cloudflare_challenge(response):
+        # The challenge body is not needed; release the pooled connection
+        # before the fallback spends its timeout on the same host.
+        response.close()
         powershell_result = _fetch_with_powershell_browser(url, timeout=timeout)
         if powershell_result:
             return powershell_result
@@ -231,7 +623,7 @@ def fetch_listing_html(url: str, *, timeout: int = 8) -> tuple[str, dict[str, An
             if powershell_result:
                 return powershell_result
             raise requests.HTTPError(f"AWS WAF challenge returned for {url}", response=response)
-    response.raise_for_status()
+    _raise_for_status(response)
     if response.status_code == 202 and not response.content:
         headers = {**headers, "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"}
         response = _requests_get(url, headers=headers, timeout=timeout, verify=verify_used)
@@ -241,17 +633,146 @@ def fetch_listing_html(url: str, *, timeout: int = 8) -> tuple[str, dict[str, An
             if powershell_result:
                 return powershell_result
             raise requests.HTTPError(f"AWS WAF challenge returned for {url}", response=response)
-    return response.text, {
+    content_type = response.headers.get("content-type")
+    if str(content_type or "").lower().startswith(NON_DOCUMENT_CONTENT_TYPE_PREFIXES):
+        response.close()
+        return "", {
+            "http_status": response.status_code,
+            "final_url": response.url,
+            "content_type": content_type,
+            "bytes": 0,
+            "ssl_verify": verify_used,
+            "user_agent_mode": user_agent_mode,
+            "skipped_reason": "non_document_content_type",
+        }
+    meta = {
         "http_status": response.status_code,
         "final_url": response.url,
-        "content_type": response.headers.get("content-type"),
+        "content_type": content_type,
         "bytes": len(response.content),
         "ssl_verify": verify_used,
         "user_agent_mode": user_agent_mode,
     }
+    text = response.text
+    if response.status_code == 200:
+        _store_http_cache_entry(url, {
+            "url": url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "text": text,
+            "meta": meta,
+        })
+    return text, meta
+
+
+def _raise_for_status(response: requests.Response) -> None:
+    # An error status on a streamed response leaves its body unread, which
+    # holds the pooled connection until the response is garbage collected.
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+
+
+_HTTP_CACHE_LOCK = Lock()
+
+
+def _http_cache_path(url: str) -> Path:
+    return JOB_INTAKE_HTTP_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+
+def _load_http_cache_entry(url: str) -> dict[str, Any] | None:
+    # Freshness is the file's mtime, so a 304 only has to touch the entry
+    # rather than rewrite the whole cached page body.
+    # A damaged file (non-UTF-8 bytes, or JSON that is not an entry) is a
+    # miss, so the next successful fetch overwrites it.
+    path = _http_cache_path(url)
+    try:
+        entry = _read_json_file(path)
+        stored_at = path.stat().st_mtime
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("url") != url:
+        return None
+    if not isinstance(entry.get("text"), str) or not isinstance(entry.get("meta"), dict):
+        return None
+    entry["stored_at"] = stored_at
+    return entry
+
+
+def _store_http_cache_entry(url: str, entry: dict[str, Any]) -> None:
+    path = _http_cache_path(url)
+    try:
+        with _HTTP_CACHE_LOCK:
+            _prune_http_cache_if_due()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_bytes(_dump_json_bytes({**entry, "stored_at": time.time()}))
+            tmp_path.replace(path)
+    except OSError:
+        return
+
+
+def _touch_http_cache_entry(url: str) -> None:
+    try:
+        os.utime(_http_cache_path(url))
+    except OSError:
+        return
+
+
+_HTTP_CACHE_NEXT_PRUNE_AT = 0.0
+
+
+def _prune_http_cache_if_due() -> None:
+    # Called with _HTTP_CACHE_LOCK held, so no store lands mid-prune.
+    global _HTTP_CACHE_NEXT_PRUNE_AT
+    now = time.monotonic()
+    if now < _HTTP_CACHE_NEXT_PRUNE_AT:
+        return
+    _HTTP_CACHE_NEXT_PRUNE_AT = now + JOB_INTAKE_HTTP_CACHE_PRUNE_INTERVAL_SECONDS
+    _prune_http_cache()
+
+
+def _prune_http_cache() -> None:
+    cutoff = time.time() - JOB_INTAKE_HTTP_CACHE_MAX_AGE_SECONDS
+    try:
+        paths = list(JOB_INTAKE_HTTP_CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for path in paths:
+        # A 304 only touches a document's entry, so its body goes by the
+        # entry's age, or by its own once the entry is gone.
+        age_path = path
+        if path.name.endswith(".document.bin"):
+            entry_path = path.with_suffix(".json")
+            if entry_path.exists():
+                age_path = entry_path
+        try:
+            if age_path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            continue
+
+
+def _http_cache_validators(entry: dict[str, Any] | None) -> dict[str, str]:
+    if not entry:
+        return {}
+    validators: dict[str, str] = {}
+    if entry.get("etag"):
+        validators["If-None-Match"] = str(entry["etag"])
+    if entry.get("last_modified"):
+        validators["If-Modified-Since"] = str(entry["last_modified"])
+    return validators
 
 
 def fetch_binary_content(url: str, *, timeout: int = 8) -> tuple[bytes, dict[str, Any]]:
+    # Position descriptions rarely change between runs, so keep the last body
+    # on disk and only re-download it when the server says it has changed.
+    cached = _load_document_cache_entry(url)
+    if cached and time.time() - float(cached.get("stored_at") or 0) < JOB_INTAKE_HTTP_CACHE_FRESH_SECONDS:
+        return cached["content"], {**cached["meta"], "cache_status": "fresh"}
+    validators = _http_cache_validators(cached)
     headers = {
         "User-Agent": JOB_INTAKE_USER_AGENT,
         "Accept": (
@@ -259,36 +780,109 @@ def fetch_binary_content(url: str, *, timeout: int = 8) -> tuple[bytes, dict[str
             "application/msword,application/octet-stream,*/*;q=0.8"
         ),
     }
-    verify_used: bool | str = True
+    browser_headers = {
+        **BROWSER_COMPAT_HEADERS,
+        "Accept": (
+            "application/pdf,application/vnd.openxmlformats-officedocument.wordprocessingml.document,"
+            "application/msword,application/octet-stream,text/html,*/*;q=0.8"
+        ),
+    }
+    browser_compat = _prefers_browser_compat(url)
+    first_headers = {**(browser_headers if browser_compat else headers), **validators}
+    verify_used: bool | str = _tls_verify_for(url)
     try:
-        response = _requests_get(url, headers=headers, timeout=timeout)
+        response = _requests_get(url, headers=first_headers, timeout=timeout, verify=verify_used, stream=True)
     except requests.exceptions.SSLError:
+        _remember_tls_unverified(url)
         verify_used = False
-        response = _requests_get(url, headers=headers, timeout=timeout, verify=False)
-    user_agent_mode = "identified"
-    if response.status_code in {403, 406}:
-        browser_headers = {
-            **BROWSER_COMPAT_HEADERS,
-            "Accept": (
-                "application/pdf,application/vnd.openxmlformats-officedocument.wordprocessingml.document,"
-                "application/msword,application/octet-stream,text/html,*/*;q=0.8"
-            ),
-        }
+        response = _requests_get(url, headers=first_headers, timeout=timeout, verify=False, stream=True)
+    if response.status_code == 304 and cached:
+        response.close()
+        _touch_document_cache_entry(url)
+        return cached["content"], {**cached["meta"], "cache_status": "revalidated"}
+    user_agent_mode = "browser_compat" if browser_compat else "identified"
+    if response.status_code in {403, 406} and not browser_compat:
+        response.close()
         try:
-            response = _requests_get(url, headers=browser_headers, timeout=timeout, verify=verify_used)
+            response = _requests_get(url, headers=browser_headers, timeout=timeout, verify=verify_used, stream=True)
         except requests.exceptions.SSLError:
             verify_used = False
-            response = _requests_get(url, headers=browser_headers, timeout=timeout, verify=False)
+            response = _requests_get(url, headers=browser_headers, timeout=timeout, verify=False, stream=True)
         user_agent_mode = "browser_compat"
-    response.raise_for_status()
-    return response.content, {
+        if response.status_code not in {403, 406}:
+            _remember_browser_compat(url)
+    _raise_for_status(response)
+    content_type = response.headers.get("content-type")
+    meta: dict[str, Any] = {
         "http_status": response.status_code,
         "final_url": response.url,
-        "content_type": response.headers.get("content-type"),
-        "bytes": len(response.content),
+        "content_type": content_type,
         "ssl_verify": verify_used,
         "user_agent_mode": user_agent_mode,
     }
+    if str(content_type or "").lower().startswith(NON_DOCUMENT_CONTENT_TYPE_PREFIXES):
+        response.close()
+        return b"", {**meta, "bytes": 0, "skipped_reason": "non_document_content_type"}
+    content = response.content
+    meta = {**meta, "bytes": len(content)}
+    if response.status_code == 200 and content:
+        _store_document_cache_entry(url, content, {
+            "url": url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "meta": meta,
+        })
+    return content, meta
+
+
+def _document_cache_paths(url: str) -> tuple[Path, Path]:
+    stem = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return (
+        JOB_INTAKE_HTTP_CACHE_DIR / f"{stem}.document.json",
+        JOB_INTAKE_HTTP_CACHE_DIR / f"{stem}.document.bin",
+    )
+
+
+def _load_document_cache_entry(url: str) -> dict[str, Any] | None:
+    entry_path, body_path = _document_cache_paths(url)
+    try:
+        entry = _read_json_file(entry_path)
+        stored_at = entry_path.stat().st_mtime
+        content = body_path.read_bytes()
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("url") != url or not isinstance(entry.get("meta"), dict):
+        return None
+    if len(content) != entry["meta"].get("bytes"):
+        return None
+    entry["stored_at"] = stored_at
+    entry["content"] = content
+    return entry
+
+
+def _store_document_cache_entry(url: str, content: bytes, entry: dict[str, Any]) -> None:
+    # The body is written before its entry, so a half-finished store is never
+    # trusted: the byte count in the entry has to match the body on load.
+    entry_path, body_path = _document_cache_paths(url)
+    try:
+        with _HTTP_CACHE_LOCK:
+            _prune_http_cache_if_due()
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_body = body_path.with_suffix(body_path.suffix + ".tmp")
+            tmp_body.write_bytes(content)
+            tmp_body.replace(body_path)
+            tmp_entry = entry_path.with_suffix(entry_path.suffix + ".tmp")
+            tmp_entry.write_bytes(_dump_json_bytes(entry))
+            tmp_entry.replace(entry_path)
+    except OSError:
+        return
+
+
+def _touch_document_cache_entry(url: str) -> None:
+    try:
+        os.utime(_document_cache_paths(url)[0])
+    except OSError:
+        return
 
 
 def _is_cloudflare_challenge(response: requests.Response) -> bool:
@@ -299,18 +893,40 @@ def _is_cloudflare_challenge(response: requests.Response) -> bool:
 
 
 def _is_aws_waf_challenge(response: requests.Response) -> bool:
-    body = response.text[:5000] if response.text else ""
+    # Response.text re-decodes (and may re-sniff the charset) on every access,
+    # so only challenge-shaped responses pay for it, once.
+    if response.status_code != 202:
+        return False
+    body = response.text[:5000]
     return (
-        response.status_code == 202
-        and (
-            "window.awsWafCookieDomainList" in body
-            or "window.gokuProps" in body
-            or "aws-waf-token" in body.lower()
-        )
+        "window.awsWafCookieDomainList" in body
+        or "window.gokuProps" in body
+        or "aws-waf-token" in body.lower()
     )
 
 
+@lru_cache(maxsize=1)
+def _powershell_executable() -> str | None:
+    return shutil.which("powershell")
+
+
 def _fetch_with_powershell_browser(url: str, *, timeout: int) -> tuple[str, dict[str, Any]] | None:
+    host = urlsplit(url).netloc.lower()
+    if host in _BROWSER_FALLBACK_FAILED_HOSTS:
+        return None
+    result = _run_powershell_browser_fetch(url, timeout=timeout)
+    if result is None:
+        _BROWSER_FALLBACK_FAILED_HOSTS.add(host)
+        _BROWSER_FALLBACK_HOSTS.discard(host)
+    else:
+        _BROWSER_FALLBACK_HOSTS.add(host)
+    return result
+
+
+def _run_powershell_browser_fetch(url: str, *, timeout: int) -> tuple[str, dict[str, Any]] | None:
+    powershell = _powershell_executable()
+    if not powershell:
+        return None
     safe_url = url.replace("'", "''")
     safe_timeout = max(1, int(timeout))
     script = rf"""
@@ -346,7 +962,7 @@ if ($null -eq $response) {{ exit 1 }}
 """
     try:
         result = subprocess.run(
-            ["powershell", "-NoProfile", "-Command", script],
+            [powershell, "-NoProfile", "-Command", script],
             capture_output=True,
             check=False,
             encoding="utf-8",
@@ -375,10 +991,15 @@ if ($null -eq $response) {{ exit 1 }}
     }
 
 
-def extract_job_summaries_from_listing(source: dict[str, Any], html: str) -> list[dict[str, Any]]:
+def extract_job_summaries_from_listing(
+    source: dict[str, Any],
+    html: str,
+    *,
+    max_jobs: int = 0,
+) -> list[dict[str, Any]]:
     structured_jobs = _extract_opencities_job_list_jobs(source, html)
     if structured_jobs:
-        return structured_jobs
+        return structured_jobs[:max_jobs] if max_jobs > 0 else structured_jobs
     parser = ListingLinkParser()
     parser.feed(html or "")
     listing_url = source.get("listing_url") or source.get("official_careers_entry_url") or ""
@@ -398,6 +1019,8 @@ def extract_job_summaries_from_listing(source: dict[str, Any], html: str) -> lis
                 jobs_by_url[absolute_url]["job_title"] = explicit_title
                 jobs_by_url[absolute_url]["parse_confidence"] = "listing_link"
             continue
+        if max_jobs > 0 and len(jobs_by_url) >= max_jobs:
+            break
         jobs_by_url[absolute_url] = {
             "job_uid": _job_uid(source, absolute_url),
             "job_title": title,
@@ -416,18 +1039,27 @@ def extract_job_summaries_from_listing(source: dict[str, Any], html: str) -> lis
     return list(jobs_by_url.values())
 
 
-def extract_attachment_links_from_html(html: str, base_url: str) -> list[dict[str, Any]]:
-    parser = ListingLinkParser()
-    parser.feed(html or "")
+def extract_attachment_links_from_html(
+    html: str,
+    base_url: str,
+    *,
+    links: list[ListingLink] | None = None,
+) -> list[dict[str, Any]]:
+    if links is None:
+        parser = ListingLinkParser()
+        parser.feed(html or "")
+        links = parser.links
     attachments_by_url: dict[str, dict[str, Any]] = {}
-    for link in parser.links:
+    for link in links:
         absolute_url = _normalize_document_url(urljoin(base_url, unescape(link.href)), base_url)
-        if not _looks_like_job_attachment_link(link.text, absolute_url):
+        # ListingLinkParser already collapses whitespace in link text.
+        label = link.text.lower()
+        if not _looks_like_job_attachment_link(label, absolute_url):
             continue
         attachments_by_url[absolute_url] = {
             "url": absolute_url,
-            "label": normalize_whitespace(link.text) or _attachment_label_from_url(absolute_url),
-            "kind": _attachment_kind(link.text, absolute_url),
+            "label": link.text or _attachment_label_from_url(absolute_url),
+            "kind": _attachment_kind(label, absolute_url),
             "content_type": _document_content_type_hint(absolute_url),
         }
     for document_url in _embedded_document_urls(html, base_url):
@@ -443,9 +1075,8 @@ def extract_attachment_links_from_html(html: str, base_url: str) -> list[dict[st
 def extract_pdf_text(pdf_bytes: bytes, *, max_pages: int = 6, max_chars: int = 20000) -> str:
     if not pdf_bytes:
         return ""
-    try:
-        import fitz  # type: ignore
-    except Exception:
+    fitz = _pymupdf_module()
+    if fitz is None:
         return ""
     try:
         document = fitz.open(stream=pdf_bytes, filetype="pdf")
@@ -453,11 +1084,14 @@ def extract_pdf_text(pdf_bytes: bytes, *, max_pages: int = 6, max_chars: int = 2
         return ""
     try:
         parts: list[str] = []
+        char_count = 0
         for index in range(min(max_pages, document.page_count)):
-            parts.append(document.load_page(index).get_text("text"))
-            if len(" ".join(parts)) >= max_chars:
+            page_text = document.load_page(index).get_text("text")
+            parts.append(page_text)
+            char_count += len(page_text)
+            if char_count + len(parts) - 1 >= max_chars:
                 break
-        return normalize_whitespace(" ".join(parts))[:max_chars]
+        return normalize_whitespace(" ".join(parts).translate(_PDF_CONTROL_CHARACTERS))[:max_chars]
     finally:
         document.close()
 
@@ -465,6 +1099,9 @@ def extract_pdf_text(pdf_bytes: bytes, *, max_pages: int = 6, max_chars: int = 2
 def extract_docx_text(docx_bytes: bytes, *, max_chars: int = 20000) -> str:
     if not docx_bytes:
         return ""
+    import xml.etree.ElementTree as ET
+    import zipfile
+
     try:
         with zipfile.ZipFile(BytesIO(docx_bytes)) as archive:
             xml_names = [
@@ -472,20 +1109,32 @@ def extract_docx_text(docx_bytes: bytes, *, max_chars: int = 20000) -> str:
                 *sorted(name for name in archive.namelist() if re.match(r"word/(?:header|footer)\d*\.xml$", name)),
             ]
             parts: list[str] = []
+            char_count = 0
             for name in xml_names:
+                # Stream the part rather than building its whole tree: text
+                # runs are read as each <w:t> closes, block breaks as each
+                # paragraph or table opens, and parsing stops at max_chars.
+                part_start, part_char_count = len(parts), char_count
                 try:
-                    root = ET.fromstring(archive.read(name))
+                    with archive.open(name) as handle:
+                        for event, node in ET.iterparse(handle, events=("start", "end")):
+                            tag = node.tag.rsplit("}", 1)[-1]
+                            if event == "start":
+                                if tag in {"p", "tr", "tbl"}:
+                                    parts.append(" ")
+                                    char_count += 1
+                            else:
+                                if tag == "t" and node.text:
+                                    parts.append(node.text)
+                                    char_count += len(node.text)
+                                node.clear()
+                            if char_count + len(parts) - 1 >= max_chars:
+                                break
                 except Exception:
+                    del parts[part_start:]
+                    char_count = part_char_count
                     continue
-                for node in root.iter():
-                    tag = node.tag.rsplit("}", 1)[-1]
-                    if tag == "t" and node.text:
-                        parts.append(node.text)
-                    elif tag in {"p", "tr", "tbl"}:
-                        parts.append(" ")
-                    if len(" ".join(parts)) >= max_chars:
-                        break
-                if len(" ".join(parts)) >= max_chars:
+                if char_count + len(parts) - 1 >= max_chars:
                     break
             return normalize_whitespace(" ".join(parts))[:max_chars]
     except Exception:
@@ -514,8 +1163,10 @@ def enrich_job_from_detail_page(
     attachment_limit: int = 2,
 ) -> dict[str, Any]:
     detail_url = job.get("job_url") or source.get("listing_url") or ""
-    detail_text = html_to_text(detail_html)
-    attachments = extract_attachment_links_from_html(detail_html, detail_url)
+    parser = DetailPageParser()
+    parser.feed(detail_html or "")
+    detail_text = parser.text()
+    attachments = extract_attachment_links_from_html(detail_html, detail_url, links=parser.links)
     enriched = dict(job)
     if detail_text:
         enriched["detail_text"] = detail_text
@@ -527,46 +1178,46 @@ def enrich_job_from_detail_page(
 
     if not binary_fetcher or not attachments:
         return enriched
+    return _enrich_job_from_attachments(enriched, attachments, binary_fetcher, attachment_limit=attachment_limit)
 
+
+def _enrich_job_from_attachments(
+    enriched: dict[str, Any],
+    attachments: list[dict[str, Any]],
+    binary_fetcher: Callable[[str], tuple[bytes, dict[str, Any]]],
+    *,
+    attachment_limit: int = 2,
+) -> dict[str, Any]:
     attachment_texts: list[str] = []
     attachment_text_sources: list[str] = []
     attachment_results: list[dict[str, Any]] = []
-    for attachment in attachments[:max(0, attachment_limit)]:
-        attachment_url = str(attachment.get("url") or "")
-        if not attachment_url or not _should_fetch_attachment(attachment):
-            continue
-        result = dict(attachment)
-        try:
-            document_bytes, fetch_meta = binary_fetcher(attachment_url)
-            content_type = str(fetch_meta.get("content_type") or result.get("content_type") or "")
-            final_url = str(fetch_meta.get("final_url") or attachment_url)
-            document_text, document_kind = extract_document_text(
-                document_bytes,
-                content_type=content_type,
-                url=final_url,
-            )
-            text_source = _document_text_source(attachment, document_kind)
-            result.update({
-                "http_status": fetch_meta.get("http_status"),
-                "final_url": final_url,
-                "content_type": content_type or None,
-                "bytes": fetch_meta.get("bytes") or len(document_bytes),
-                "document_kind": document_kind,
-                "text_chars": len(document_text),
-                "parse_status": "parsed" if document_text else "no_text",
-            })
-            if document_text:
-                attachment_texts.append(document_text)
-                attachment_text_sources.append(text_source)
-                if attachment.get("kind") == "position_description" and not enriched.get("position_description_text"):
-                    enriched["position_description_text"] = document_text
-                    enriched["position_description_text_source"] = text_source
-                    enriched["position_description_excerpt"] = document_text[:800]
-        except Exception as error:
-            result.update({
-                "parse_status": "failed",
-                "error": str(error),
-            })
+    selected_attachments = [
+        attachment for attachment in attachments[:max(0, attachment_limit)]
+        if attachment.get("url") and _should_fetch_attachment(attachment)
+    ]
+    # Linked documents are independent downloads; fetch them side by side and
+    # fold the results back in listing order. The first one runs on this
+    # thread, the rest on the shared attachment pool.
+    if len(selected_attachments) > 1:
+        executor = _attachment_executor()
+        futures = [
+            executor.submit(_fetch_attachment_text, attachment, binary_fetcher)
+            for attachment in selected_attachments[1:]
+        ]
+        parsed_attachments = [
+            _fetch_attachment_text(selected_attachments[0], binary_fetcher),
+            *(future.result() for future in futures),
+        ]
+    else:
+        parsed_attachments = [_fetch_attachment_text(attachment, binary_fetcher) for attachment in selected_attachments]
+    for attachment, (result, document_text, text_source) in zip(selected_attachments, parsed_attachments):
+        if document_text:
+            attachment_texts.append(document_text)
+            attachment_text_sources.append(text_source)
+            if attachment.get("kind") == "position_description" and not enriched.get("position_description_text"):
+                enriched["position_description_text"] = document_text
+                enriched["position_description_text_source"] = text_source
+                enriched["position_description_excerpt"] = document_text[:800]
         attachment_results.append(result)
     if attachment_results:
         enriched["attachments"] = attachment_results
@@ -581,6 +1232,47 @@ def enrich_job_from_detail_page(
     return enriched
 
 
+@lru_cache(maxsize=1)
+def _attachment_executor() -> ThreadPoolExecutor:
+    # One long-lived pool instead of a new one per job. It only runs leaf
+    # downloads, so detail workers can wait on it without deadlocking.
+    return ThreadPoolExecutor(max_workers=ATTACHMENT_FETCH_WORKERS, thread_name_prefix="job-attachments")
+
+
+def _fetch_attachment_text(
+    attachment: dict[str, Any],
+    binary_fetcher: Callable[[str], tuple[bytes, dict[str, Any]]],
+) -> tuple[dict[str, Any], str, str]:
+    attachment_url = str(attachment.get("url") or "")
+    result = dict(attachment)
+    try:
+        document_bytes, fetch_meta = binary_fetcher(attachment_url)
+        content_type = str(fetch_meta.get("content_type") or result.get("content_type") or "")
+        final_url = str(fetch_meta.get("final_url") or attachment_url)
+        document_text, document_kind = extract_document_text(
+            document_bytes,
+            content_type=content_type,
+            url=final_url,
+        )
+        result.update({
+            "http_status": fetch_meta.get("http_status"),
+            "final_url": final_url,
+            "content_type": content_type or None,
+            "bytes": fetch_meta.get("bytes") or len(document_bytes),
+            "document_kind": document_kind,
+            "text_chars": len(document_text),
+            "parse_status": "parsed" if document_text else "no_text",
+        })
+        return result, document_text, _document_text_source(attachment, document_kind)
+    except Exception as error:
+        result.update({
+            "parse_status": "failed",
+            "error": str(error),
+        })
+        return result, "", ""
+
+
+@_host_memo_run()
 def job_intake_scrape_preview(
     *,
     source_limit: int = 10,
@@ -596,6 +1288,7 @@ def job_intake_scrape_preview(
     enrich_attachments: bool = False,
     attachment_job_limit: int = 1000,
     resolve_missing_documents: bool = True,
+    max_jobs_per_source: int = 0,
 ) -> dict[str, Any]:
     registry = registry_payload or council_job_source_registry_payload()
     ready_sources = [
@@ -605,43 +1298,64 @@ def job_intake_scrape_preview(
     ready_sources = sorted(ready_sources, key=lambda row: (row.get("poll_tier") or "Z", row.get("council_name") or ""))
     if source_limit > 0:
         ready_sources = ready_sources[:source_limit]
+    if max_jobs_per_source > 0:
+        ready_sources = [
+            {**source, "max_jobs": source.get("max_jobs") or max_jobs_per_source}
+            for source in ready_sources
+        ]
     fetch = fetcher or (lambda url: fetch_listing_html(url, timeout=timeout))
     fetch_binary = binary_fetcher or (lambda url: fetch_binary_content(url, timeout=timeout))
     jobs: list[dict[str, Any]] = []
     source_results: list[dict[str, Any]] = []
     fetched_at = datetime.now(timezone.utc).isoformat()
     workers = max(1, min(max_workers, len(ready_sources) or 1))
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {executor.submit(_scrape_source, source, fetch): source for source in ready_sources}
-        for future in as_completed(futures):
-            result = future.result()
-            source_results.append(result["source_result"])
-            jobs.extend(result["jobs"])
-    jobs = _dedupe_jobs(jobs)
-    jobs = [normalize_council_job_record({**job, "fetched_at": job.get("fetched_at") or fetched_at}) for job in jobs]
-    detail_enrichment = {
-        "attempted": 0,
-        "succeeded": 0,
-        "details_parsed": 0,
-        "document_attempted": 0,
-        "document_succeeded": 0,
-        "documents_parsed": 0,
-    }
-    if enrich_details or enrich_attachments:
-        jobs, detail_enrichment = _enrich_jobs_from_detail_pages(
-            jobs,
-            fetcher=fetch,
-            binary_fetcher=fetch_binary,
-            detail_job_limit=detail_job_limit,
-            attachment_job_limit=attachment_job_limit,
-            max_workers=workers,
-            fetch_linked_documents=enrich_attachments or resolve_missing_documents,
+    listing_slots = _HostSlots(LISTING_FETCH_PER_HOST_LIMIT)
+    listing_fetch = listing_slots.limit(fetch)
+    detail_wanted = enrich_details or enrich_attachments
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as detail_executor:
+        # Detail pages of councils that answered early are fetched while the
+        # slowest listings are still loading instead of after all of them.
+        # They share the listing per-host cap, so a host is not hit harder.
+        detail_prefetch = _DetailPrefetch(
+            fetch,
+            detail_executor,
+            host_slots=listing_slots,
+            limit=min(detail_job_limit, DETAIL_PREFETCH_LIMIT) if detail_job_limit > 0 else DETAIL_PREFETCH_LIMIT,
         )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_scrape_source, source, listing_fetch): source
+                for source in _interleave_by_host(ready_sources, lambda source: source.get("listing_url"))
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                source_results.append(result["source_result"])
+                jobs.extend(result["jobs"])
+                if detail_wanted:
+                    detail_prefetch.start(result["jobs"])
+        jobs = _dedupe_jobs(jobs)
         jobs = [normalize_council_job_record({**job, "fetched_at": job.get("fetched_at") or fetched_at}) for job in jobs]
+        detail_enrichment = dict(EMPTY_DETAIL_ENRICHMENT_SUMMARY)
+        if detail_wanted:
+            detail_prefetch.retain({
+                str(job.get("job_url") or "")
+                for _index, job in _detail_enrichment_candidates(jobs, detail_job_limit)
+            })
+            jobs, detail_enrichment = _enrich_jobs_from_detail_pages(
+                jobs,
+                fetcher=detail_prefetch.fetch,
+                binary_fetcher=fetch_binary,
+                detail_job_limit=detail_job_limit,
+                attachment_job_limit=attachment_job_limit,
+                max_workers=max_workers,
+                fetch_linked_documents=enrich_attachments or resolve_missing_documents,
+            )
+            detail_prefetch.retain(set())
+    # Every job was normalised with the run's fetched_at above, and detail
+    # enrichment normalises each job it touches, so only pay-row enrichment
+    # needs another pass here.
     if pay_table_rows:
         jobs = [enrich_job_with_pay_rows(job, pay_table_rows) for job in jobs]
-    else:
-        jobs = [normalize_council_job_record(job) for job in jobs]
     scoped_jobs = [job for job in jobs if job.get("governance_status") != "auto_excluded"]
     excluded_jobs = len(jobs) - len(scoped_jobs)
     jobs = [
@@ -670,6 +1384,7 @@ def job_intake_scrape_preview(
             "pay_table_enrichment": "enabled" if pay_table_rows else "not_available",
             "source_limit": source_limit,
             "job_limit": job_limit,
+            "max_jobs_per_source": max_jobs_per_source,
             "timeout_seconds": timeout,
             "max_workers": workers,
             "detail_page_enrichment": "enabled" if enrich_details or enrich_attachments else "disabled",
@@ -704,6 +1419,7 @@ def job_intake_scrape_preview(
     }
 
 
+@_host_memo_run()
 def job_intake_wide_fetch_preview(
     *,
     source_limit: int = 0,
@@ -778,7 +1494,7 @@ def load_job_intake_snapshot(
     if not path.exists():
         return _empty_job_intake_snapshot()
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = _read_json_file(path)
     except (OSError, json.JSONDecodeError):
         return {
             **_empty_job_intake_snapshot(),
@@ -794,10 +1510,7 @@ def save_job_intake_snapshot(
 ) -> dict[str, Any]:
     path = snapshot_path or JOB_INTAKE_SNAPSHOT_PATH
     snapshot = _as_job_intake_snapshot(payload, saved_at=datetime.now(timezone.utc).isoformat())
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_text(json.dumps(snapshot, indent=2, sort_keys=True), encoding="utf-8")
-    tmp_path.replace(path)
+    _write_json_atomically(path, snapshot)
     return snapshot
 
 
@@ -810,12 +1523,13 @@ def load_checked_job_accumulator(
     if not path.exists():
         return _empty_checked_job_accumulator(registry_payload=registry_payload)
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = _read_json_file(path)
     except (OSError, json.JSONDecodeError):
         return {
             **_empty_checked_job_accumulator(registry_payload=registry_payload),
             "accumulator_status": "unreadable",
         }
+    payload = _replay_checked_job_accumulator_journal(payload, _checked_job_accumulator_journal_path(path))
     return _as_checked_job_accumulator(payload, registry_payload=registry_payload)
 
 
@@ -828,11 +1542,154 @@ def save_checked_job_accumulator(
     path = accumulator_path or JOB_INTAKE_ACCUMULATOR_PATH
     accumulator = _as_checked_job_accumulator(payload, registry_payload=registry_payload)
     accumulator["saved_at"] = datetime.now(timezone.utc).isoformat()
+    accumulator["journal_generation"] = hashlib.sha1(
+        f"{path}|{accumulator['saved_at']}".encode("utf-8")
+    ).hexdigest()[:16]
+    _write_json_atomically(path, accumulator)
+    _checked_job_accumulator_journal_path(path).unlink(missing_ok=True)
+    return accumulator
+
+
+# Accumulation runs append their changed rows to a JSON-Lines journal beside
+# the accumulator instead of rewriting every row; loads replay it last-write-
+# wins, and a full save folds it back in once it outgrows the base document.
+# Every full save starts a new journal generation and each journal line names
+# the generation it extends, so a journal left behind by a save that stopped
+# before deleting it is ignored rather than replayed over the newer base.
+_ACCUMULATOR_DERIVED_KEYS = frozenset({"rows", "coverage", "summary"})
+
+
+def _checked_job_accumulator_journal_path(path: Path) -> Path:
+    return path.with_suffix(".jsonl")
+
+
+def _replay_checked_job_accumulator_journal(payload: dict[str, Any], journal_path: Path) -> dict[str, Any]:
+    try:
+        lines = journal_path.read_bytes().splitlines()
+    except OSError:
+        return payload
+    header = {key: value for key, value in payload.items() if key not in _ACCUMULATOR_DERIVED_KEYS}
+    generation = payload.get("journal_generation")
+    rows_by_key = {
+        str(row.get("dedupe_key")): row
+        for row in payload.get("rows", [])
+        if isinstance(row, dict) and row.get("dedupe_key")
+    }
+    for line in lines:
+        try:
+            entry = _parse_json_bytes(line)
+        except ValueError:
+            # A run interrupted mid-append leaves a torn final line, which
+            # may also end part-way through a multi-byte character.
+            continue
+        if not isinstance(entry, dict) or entry.get("generation") != generation:
+            continue
+        if isinstance(entry.get("header"), dict):
+            header.update(entry["header"])
+        elif isinstance(entry.get("row"), dict) and entry["row"].get("dedupe_key"):
+            rows_by_key[str(entry["row"]["dedupe_key"])] = entry["row"]
+        elif entry.get("drop"):
+            rows_by_key.pop(str(entry["drop"]), None)
+    return {**header, "rows": list(rows_by_key.values())}
+
+
+def _checked_job_accumulator_journal_fits(path: Path) -> bool:
+    try:
+        base_size = path.stat().st_size
+    except OSError:
+        return False
+    try:
+        journal_size = _checked_job_accumulator_journal_path(path).stat().st_size
+    except OSError:
+        journal_size = 0
+    return journal_size < base_size
+
+
+def _append_checked_job_accumulator_journal(
+    path: Path,
+    accumulator: dict[str, Any],
+    *,
+    changed_keys: set[str],
+    dropped_keys: set[str],
+    rows_by_key: dict[str, dict[str, Any]],
+    registry_payload: dict[str, Any],
+) -> dict[str, Any]:
+    accumulator = _as_checked_job_accumulator(accumulator, registry_payload=registry_payload)
+    accumulator["saved_at"] = datetime.now(timezone.utc).isoformat()
+    encode = _encode_sorted_json
+    header = {key: value for key, value in accumulator.items() if key not in _ACCUMULATOR_DERIVED_KEYS}
+    generation = accumulator.get("journal_generation")
+    with _checked_job_accumulator_journal_path(path).open("ab") as handle:
+        for key in sorted(dropped_keys):
+            handle.write(encode({"generation": generation, "drop": key}) + b"\n")
+        for key in sorted(changed_keys):
+            handle.write(encode({"generation": generation, "row": rows_by_key[key]}) + b"\n")
+        handle.write(encode({"generation": generation, "header": header}) + b"\n")
+    return accumulator
+
+
+_COMPACT_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def _encode_sorted_json(value: Any) -> bytes:
+    # Snapshots and the accumulator stay byte-stable from run to run, so they
+    # always use the stdlib encoder: orjson's raw UTF-8 text and float
+    # formatting would make the saved bytes depend on whether it is installed.
+    return _COMPACT_JSON_ENCODER.encode(value).encode("utf-8")
+
+
+def _read_json_file(path: Path) -> Any:
+    # Snapshots, the accumulator and cached pages are reloaded on every run;
+    # orjson parses them several times faster when it is installed. The
+    # stdlib parser still gets the last word on anything orjson rejects
+    # (NaN, integers wider than 64 bits).
+    return _parse_json_bytes(path.read_bytes())
+
+
+def _parse_json_bytes(data: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data.decode("utf-8"))
+
+
+def _dump_json_bytes(payload: Any) -> bytes:
+    # Cache files are never diffed, so their keys are left unsorted.
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload).encode("utf-8")
+
+
+def _write_json_atomically(path: Path, payload: dict[str, Any]) -> None:
+    # Same document as _encode_sorted_json(payload), but top-level lists are
+    # encoded item by item, so peak memory tracks one row rather than the
+    # whole snapshot or accumulator document.
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_text(json.dumps(accumulator, indent=2, sort_keys=True), encoding="utf-8")
+    encode = _encode_sorted_json
+    with tmp_path.open("wb") as handle:
+        handle.write(b"{")
+        for key_index, key in enumerate(sorted(payload)):
+            if key_index:
+                handle.write(b",")
+            handle.write(encode(key) + b":")
+            value = payload[key]
+            if not isinstance(value, list):
+                handle.write(encode(value))
+                continue
+            handle.write(b"[")
+            for item_index, item in enumerate(value):
+                if item_index:
+                    handle.write(b",")
+                handle.write(encode(item))
+            handle.write(b"]")
+        handle.write(b"}")
     tmp_path.replace(path)
-    return accumulator
 
 
 def accumulate_checked_jobs_from_payload(
@@ -854,6 +1711,8 @@ def accumulate_checked_jobs_from_payload(
         accumulator_path=accumulator_path,
         registry_payload=registry,
     )
+    path = accumulator_path or JOB_INTAKE_ACCUMULATOR_PATH
+    can_append = accumulator.get("accumulator_status") != "unreadable" and _checked_job_accumulator_journal_fits(path)
     rows_by_key = {
         str(row.get("dedupe_key")): dict(row)
         for row in accumulator.get("rows", [])
@@ -867,6 +1726,8 @@ def accumulate_checked_jobs_from_payload(
     reject_summary: dict[str, int] = dict(accumulator.get("reject_summary") or {})
     run_rejects: dict[str, int] = {}
     accepted_keys: set[str] = set()
+    changed_keys: set[str] = set()
+    dropped_keys: set[str] = set()
     new_rows = 0
     updated_rows = 0
     for raw_job in payload_rows:
@@ -911,12 +1772,18 @@ def accumulate_checked_jobs_from_payload(
             merged_key = str(merged.get("dedupe_key") or relaxed_existing_key)
             if merged_key != relaxed_existing_key:
                 rows_by_key.pop(relaxed_existing_key, None)
+                changed_keys.discard(relaxed_existing_key)
+                dropped_keys.add(relaxed_existing_key)
             rows_by_key[merged_key] = merged
+            changed_keys.add(merged_key)
+            dropped_keys.discard(merged_key)
             relaxed_index[relaxed_key] = merged_key
             accepted_keys.add(merged_key)
             updated_rows += 1
             continue
         accepted_keys.add(dedupe_key)
+        changed_keys.add(dedupe_key)
+        dropped_keys.discard(dedupe_key)
         if dedupe_key in rows_by_key:
             rows_by_key[dedupe_key] = _merge_checked_accumulator_row(
                 rows_by_key[dedupe_key],
@@ -930,15 +1797,23 @@ def accumulate_checked_jobs_from_payload(
             if relaxed_key and relaxed_key not in relaxed_index:
                 relaxed_index[relaxed_key] = dedupe_key
             new_rows += 1
-    if mark_missing_historical and source_kind == "official":
+    absence_sweep = mark_missing_historical and source_kind == "official"
+    if absence_sweep:
+        # Only rows that drop out in this run are journalled. Rows already
+        # flagged pick up this run's time as last_absent_at from the header's
+        # latest_absence_sweep_at, so the whole history is not rewritten.
         for key, row in rows_by_key.items():
             if key in accepted_keys:
                 continue
             source_kinds = set(row.get("source_kinds_seen") or [])
             if "official" not in source_kinds:
                 continue
-            row["observed_status"] = "historical_not_seen_latest"
             row["last_absent_at"] = observed_at
+            if row.get("observed_status") == "historical_not_seen_latest":
+                continue
+            row["observed_status"] = "historical_not_seen_latest"
+            row["first_absent_at"] = observed_at
+            changed_keys.add(key)
     run_record = {
         "run_id": run_id,
         "source_payload_set_id": source_payload_set_id,
@@ -959,18 +1834,21 @@ def accumulate_checked_jobs_from_payload(
         "latest_run_id": run_id,
         "latest_official_run_id": run_id if source_kind == "official" else accumulator.get("latest_official_run_id"),
         "latest_secondary_run_id": run_id if source_kind == "secondary" else accumulator.get("latest_secondary_run_id"),
+        "latest_absence_sweep_at": observed_at if absence_sweep else accumulator.get("latest_absence_sweep_at"),
         "reject_summary": reject_summary,
         "runs": [run_record, *(accumulator.get("runs") or [])][:30],
-        "rows": sorted(
-            rows_by_key.values(),
-            key=lambda row: (
-                str(row.get("canonical_reference_month") or ""),
-                str(row.get("council_name") or row.get("short_name") or ""),
-                str(row.get("job_title") or ""),
-            ),
-            reverse=True,
-        ),
+        # Saving or journalling normalises the accumulator, which sorts rows.
+        "rows": list(rows_by_key.values()),
     })
+    if can_append:
+        return _append_checked_job_accumulator_journal(
+            path,
+            accumulator,
+            changed_keys=changed_keys,
+            dropped_keys=dropped_keys,
+            rows_by_key=rows_by_key,
+            registry_payload=registry,
+        )
     return save_checked_job_accumulator(
         accumulator,
         accumulator_path=accumulator_path,
@@ -1002,6 +1880,7 @@ def accumulate_checked_jobs_from_snapshot(
     )
 
 
+@_host_memo_run()
 def refresh_checked_job_accumulator(
     *,
     source_limit: int = 0,
@@ -1024,6 +1903,91 @@ def refresh_checked_job_accumulator(
     registry_payload: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     registry = registry_payload or council_job_source_registry_payload()
+    with ThreadPoolExecutor(max_workers=1) as secondary_executor:
+        # Secondary boards sit on different hosts from the official council
+        # sources, so their scrape overlaps the official one; snapshots and
+        # accumulation below still run in official-then-secondary order.
+        secondary_future = None
+        if include_secondary:
+            secondary_future = secondary_executor.submit(
+                job_intake_secondary_preview,
+                source_limit=0,
+                job_limit=secondary_job_limit,
+                timeout=timeout,
+                max_workers=max(3, min(max_workers, 10)),
+                registry_payload=registry,
+                pay_table_rows=pay_table_rows,
+                enrich_details=enrich_details,
+                detail_job_limit=min(detail_job_limit, 1000),
+                expand_sector_board_council_pages=True,
+            )
+        accumulator, snapshot = _refresh_official_checked_jobs(
+            registry,
+            source_limit=source_limit,
+            job_limit=job_limit,
+            timeout=timeout,
+            max_workers=max_workers,
+            pay_table_rows=pay_table_rows,
+            enrich_details=enrich_details,
+            detail_job_limit=detail_job_limit,
+            enrich_attachments=enrich_attachments,
+            attachment_job_limit=attachment_job_limit,
+            resolve_missing_documents=resolve_missing_documents,
+            wide_fetch=wide_fetch,
+            candidate_limit_per_council=candidate_limit_per_council,
+            candidate_priority_limit=candidate_priority_limit,
+            snapshot_path=snapshot_path,
+            accumulator_path=accumulator_path,
+        )
+        secondary_payload = secondary_future.result() if secondary_future else None
+        if secondary_payload is not None:
+            # The secondary snapshot and the accumulator are separate files, so
+            # the snapshot write runs on the now-idle executor while the merge
+            # below reads and rewrites the accumulator.
+            secondary_payload = _as_job_intake_snapshot(
+                secondary_payload,
+                saved_at=datetime.now(timezone.utc).isoformat(),
+            )
+            snapshot_write = secondary_executor.submit(
+                _write_json_atomically,
+                JOB_INTAKE_SECONDARY_SNAPSHOT_PATH,
+                secondary_payload,
+            )
+            accumulator = accumulate_checked_jobs_from_payload(
+                secondary_payload,
+                accumulator_path=accumulator_path,
+                registry_payload=registry,
+                source_kind="secondary",
+                source_label="secondary_sector_sources",
+                mark_missing_historical=False,
+            )
+            snapshot_write.result()
+    accumulator["refresh_summary"] = {
+        "official": snapshot.get("summary") or {},
+        "secondary": secondary_payload.get("summary") if secondary_payload else None,
+    }
+    return accumulator
+
+
+def _refresh_official_checked_jobs(
+    registry: dict[str, Any],
+    *,
+    source_limit: int,
+    job_limit: int,
+    timeout: int,
+    max_workers: int,
+    pay_table_rows: list[dict[str, Any]] | None,
+    enrich_details: bool,
+    detail_job_limit: int,
+    enrich_attachments: bool,
+    attachment_job_limit: int,
+    resolve_missing_documents: bool,
+    wide_fetch: bool,
+    candidate_limit_per_council: int,
+    candidate_priority_limit: int,
+    snapshot_path: Path | None,
+    accumulator_path: Path | None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
     if wide_fetch:
         snapshot = save_job_intake_snapshot(
             job_intake_wide_fetch_preview(
@@ -1065,36 +2029,7 @@ def refresh_checked_job_accumulator(
         source_label="wide_official_vendor_refresh" if wide_fetch else "aggressive_official_refresh",
         mark_missing_historical=True,
     )
-    secondary_payload: dict[str, Any] | None = None
-    if include_secondary:
-        secondary_payload = job_intake_secondary_preview(
-            source_limit=0,
-            job_limit=secondary_job_limit,
-            timeout=timeout,
-            max_workers=max(3, min(max_workers, 10)),
-            registry_payload=registry,
-            pay_table_rows=pay_table_rows,
-            enrich_details=enrich_details,
-            detail_job_limit=min(detail_job_limit, 1000),
-            expand_sector_board_council_pages=True,
-        )
-        secondary_payload = save_job_intake_snapshot(
-            secondary_payload,
-            snapshot_path=JOB_INTAKE_SECONDARY_SNAPSHOT_PATH,
-        )
-        accumulator = accumulate_checked_jobs_from_payload(
-            secondary_payload,
-            accumulator_path=accumulator_path,
-            registry_payload=registry,
-            source_kind="secondary",
-            source_label="secondary_sector_sources",
-            mark_missing_historical=False,
-        )
-    accumulator["refresh_summary"] = {
-        "official": snapshot.get("summary") or {},
-        "secondary": secondary_payload.get("summary") if secondary_payload else None,
-    }
-    return accumulator
+    return accumulator, snapshot
 
 
 def refresh_job_intake_snapshot(
@@ -1338,26 +2273,22 @@ def _diverse_endpoint_candidates(
         "t1cloud",
         "native_council",
     ]
-    remaining = list(candidates)
+    # Bucket once, then take one candidate per platform per round; unlisted
+    # platforms only fill whatever the rounds leave, in their original order.
+    by_platform: dict[str, list[dict[str, Any]]] = {platform: [] for platform in platform_order}
+    unlisted: list[dict[str, Any]] = []
+    for candidate in candidates:
+        bucket = by_platform.get(candidate.get("platform_family"))
+        (unlisted if bucket is None else bucket).append(candidate)
     selected: list[dict[str, Any]] = []
-    while remaining and len(selected) < limit:
-        added_this_round = False
-        for platform in platform_order:
-            if len(selected) >= limit:
-                break
-            match_index = next(
-                (
-                    index for index, candidate in enumerate(remaining)
-                    if candidate.get("platform_family") == platform
-                ),
-                None,
-            )
-            if match_index is None:
-                continue
-            selected.append(remaining.pop(match_index))
-            added_this_round = True
-        if not added_this_round:
-            selected.append(remaining.pop(0))
+    depth = 0
+    while len(selected) < limit:
+        round_candidates = [bucket[depth] for bucket in by_platform.values() if depth < len(bucket)]
+        if not round_candidates:
+            break
+        selected.extend(round_candidates[:limit - len(selected)])
+        depth += 1
+    selected.extend(unlisted[:limit - len(selected)])
     return selected
 
 
@@ -1393,14 +2324,20 @@ def _as_checked_job_accumulator(
     registry_payload: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     registry = registry_payload or council_job_source_registry_payload()
+    # The collapse pass copies each surviving row, so filter the originals.
     rows = [
-        dict(row)
+        row
         for row in payload.get("rows", [])
         if isinstance(row, dict) and row.get("dedupe_key")
         and not _checked_accumulator_row_rejected(row)
         and _accumulator_council_identity(row, registry).get("is_known_council")
     ]
     rows = _collapse_relaxed_accumulator_duplicates(rows)
+    # Every row still flagged historical was absent from the latest sweep.
+    if latest_absence_sweep_at := payload.get("latest_absence_sweep_at"):
+        for row in rows:
+            if row.get("observed_status") == "historical_not_seen_latest":
+                row["last_absent_at"] = latest_absence_sweep_at
     rows = sorted(
         rows,
         key=lambda row: (
@@ -1474,6 +2411,7 @@ def _checked_accumulator_summary(
 ) -> dict[str, Any]:
     source_kind_sets = [set(row.get("source_kinds_seen") or []) for row in rows]
     current_run_id = accumulator.get("latest_official_run_id") or accumulator.get("latest_run_id")
+    latest_run = (accumulator.get("runs") or [None])[0]
     return {
         "jobs": len(rows),
         "checked_classified_jobs": len(rows),
@@ -1490,13 +2428,13 @@ def _checked_accumulator_summary(
         "secondary_signal_jobs": sum(1 for source_kinds in source_kind_sets if "secondary" in source_kinds),
         "confirmed_band_jobs": sum(1 for row in rows if row.get("classification_confidence") == "confirmed"),
         "inferred_band_jobs": sum(1 for row in rows if row.get("classification_confidence") == "inferred"),
-        "councils_with_jobs": len({row.get("short_name") or row.get("council_name") for row in rows if row.get("short_name") or row.get("council_name")}),
+        "councils_with_jobs": len({council for row in rows if (council := row.get("short_name") or row.get("council_name"))}),
         "reference_months": len({row.get("canonical_reference_month") for row in rows if row.get("canonical_reference_month")}),
         "first_seen_at": min((str(row.get("first_seen_at")) for row in rows if row.get("first_seen_at")), default=None),
         "last_seen_at": max((str(row.get("last_seen_at")) for row in rows if row.get("last_seen_at")), default=None),
-        "latest_run_jobs_seen": (accumulator.get("runs") or [{}])[0].get("jobs_seen") if accumulator.get("runs") else 0,
-        "latest_run_jobs_accumulated": (accumulator.get("runs") or [{}])[0].get("jobs_accumulated") if accumulator.get("runs") else 0,
-        "latest_run_jobs_rejected": (accumulator.get("runs") or [{}])[0].get("jobs_rejected") if accumulator.get("runs") else 0,
+        "latest_run_jobs_seen": latest_run.get("jobs_seen") if latest_run is not None else 0,
+        "latest_run_jobs_accumulated": latest_run.get("jobs_accumulated") if latest_run is not None else 0,
+        "latest_run_jobs_rejected": latest_run.get("jobs_rejected") if latest_run is not None else 0,
     }
 
 
@@ -1505,25 +2443,24 @@ def _checked_accumulator_coverage(
     registry_payload: dict[str, Any],
 ) -> dict[str, Any]:
     registry_rows = registry_payload.get("rows") or []
-    known = [
-        {
-            "short_name": row.get("short_name"),
-            "council_name": row.get("council_name"),
-            "poll_tier": row.get("poll_tier"),
-        }
-        for row in registry_rows
-        if row.get("short_name") or row.get("council_name")
-    ]
     covered_keys = {
-        _normalise_accumulator_key(row.get("short_name") or row.get("council_name"))
+        _normalise_accumulator_key(council)
         for row in rows
-        if row.get("short_name") or row.get("council_name")
+        if (council := row.get("short_name") or row.get("council_name"))
     }
-    missing = [
-        row for row in known
-        if _normalise_accumulator_key(row.get("short_name") or row.get("council_name")) not in covered_keys
-    ]
-    target = len(known)
+    target = 0
+    missing: list[dict[str, Any]] = []
+    for row in registry_rows:
+        council = row.get("short_name") or row.get("council_name")
+        if not council:
+            continue
+        target += 1
+        if _normalise_accumulator_key(council) not in covered_keys:
+            missing.append({
+                "short_name": row.get("short_name"),
+                "council_name": row.get("council_name"),
+                "poll_tier": row.get("poll_tier"),
+            })
     covered = target - len(missing)
     return {
         "target_councils": target,
@@ -1613,7 +2550,7 @@ def _checked_accumulator_row(
 
 def _collapse_relaxed_accumulator_duplicates(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     rows_by_key: dict[str, dict[str, Any]] = {}
-    relaxed_index: dict[str, str] = {}
+    relaxed_index: dict[tuple[str, ...], str] = {}
     for row in rows:
         dedupe_key = str(row.get("dedupe_key") or "")
         if not dedupe_key:
@@ -1639,14 +2576,16 @@ def _collapse_relaxed_accumulator_duplicates(rows: list[dict[str, Any]]) -> list
     return list(rows_by_key.values())
 
 
-def _relaxed_accumulator_key(row: dict[str, Any]) -> str:
+def _relaxed_accumulator_key(row: dict[str, Any]) -> tuple[str, ...]:
+    # Only used as an in-memory index key, so a tuple of the existing strings
+    # stands in for a joined string that would be built and hashed afresh.
     parts = row.get("dedupe_key_parts") if isinstance(row.get("dedupe_key_parts"), dict) else {}
     council = str(parts.get("council") or _normalise_accumulator_key(row.get("short_name") or row.get("council_name"))).strip()
     title = str(parts.get("title") or _normalise_accumulator_key(row.get("job_title"))).strip()
     month = str(parts.get("month") or row.get("canonical_reference_month") or row.get("canonical_reference_yyyy_mm") or "").strip()
     if not (council and title and month):
-        return ""
-    return "|".join((council, title, month))
+        return ()
+    return (council, title, month)
 
 
 def _accumulator_source_kinds(row: dict[str, Any]) -> set[str]:
@@ -1714,13 +2653,11 @@ def _preferred_accumulator_row(
 
 
 def _first_timestamp(*values: Any) -> str | None:
-    timestamps = sorted(str(value) for value in values if value)
-    return timestamps[0] if timestamps else None
+    return min((str(value) for value in values if value), default=None)
 
 
 def _last_timestamp(*values: Any) -> str | None:
-    timestamps = sorted(str(value) for value in values if value)
-    return timestamps[-1] if timestamps else None
+    return max((str(value) for value in values if value), default=None)
 
 
 def _merge_checked_accumulator_row(
@@ -1818,8 +2755,8 @@ def _accumulator_council_lookup(registry_payload: dict[str, Any]) -> dict[str, d
 
 def _normalise_accumulator_key(value: Any) -> str:
     text = normalize_whitespace(str(value or "")).lower()
-    text = re.sub(r"\b(city|shire|rural|borough|council|city council|shire council)\b", " ", text)
-    return re.sub(r"[^a-z0-9]+", " ", text).strip()
+    text = _COUNCIL_KEY_NOISE_RE.sub(" ", text)
+    return _NON_ALNUM_RE.sub(" ", text).strip()
 
 
 def _job_can_enter_stage1(job: dict[str, Any]) -> bool:
@@ -1923,6 +2860,7 @@ def _completion_rate(present: int, total: int) -> int:
     return round((present / total) * 100)
 
 
+@_host_memo_run()
 def job_intake_endpoint_resolution_preview(
     *,
     candidate_limit: int = 20,
@@ -1933,15 +2871,20 @@ def job_intake_endpoint_resolution_preview(
     fetcher: Callable[[str], tuple[str, dict[str, Any]]] | None = None,
 ) -> dict[str, Any]:
     registry = registry_payload or council_job_source_registry_payload()
-    candidates = _endpoint_candidate_sources(registry)
-    if candidate_limit > 0:
-        candidates = candidates[:candidate_limit]
+    available_candidates = _endpoint_candidate_sources(registry)
+    candidates = available_candidates[:candidate_limit] if candidate_limit > 0 else available_candidates
     fetch = fetcher or (lambda url: fetch_listing_html(url, timeout=timeout))
     source_results: list[dict[str, Any]] = []
     jobs: list[dict[str, Any]] = []
     workers = max(1, min(max_workers, len(candidates) or 1))
+    # Generated candidates cluster on a few vendor hosts; interleave them and
+    # share the listing per-host cap so councils on other hosts keep moving.
+    listing_fetch = _HostSlots(LISTING_FETCH_PER_HOST_LIMIT).limit(fetch)
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {executor.submit(_scrape_source, source, fetch): source for source in candidates}
+        futures = {
+            executor.submit(_scrape_source, source, listing_fetch): source
+            for source in _interleave_by_host(candidates, lambda source: source.get("listing_url"))
+        }
         for future in as_completed(futures):
             result = future.result()
             source_result = result["source_result"]
@@ -1969,7 +2912,7 @@ def job_intake_endpoint_resolution_preview(
             "max_workers": workers,
         },
         "summary": {
-            "candidates_available": len(_endpoint_candidate_sources(registry)),
+            "candidates_available": len(available_candidates),
             "candidates_checked": len(source_results),
             "sources_resolved": len(successful_sources),
             "jobs": len(jobs),
@@ -1979,6 +2922,7 @@ def job_intake_endpoint_resolution_preview(
     }
 
 
+@_host_memo_run()
 def job_intake_secondary_preview(
     *,
     source_limit: int = 0,
@@ -2006,22 +2950,19 @@ def job_intake_secondary_preview(
     jobs: list[dict[str, Any]] = []
     source_results: list[dict[str, Any]] = []
     workers = max(1, min(max_workers, len(sources) or 1))
+    listing_fetch = _HostSlots(LISTING_FETCH_PER_HOST_LIMIT).limit(fetch)
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {executor.submit(_scrape_secondary_source, source, fetch): source for source in sources}
+        futures = {
+            executor.submit(_scrape_secondary_source, source, listing_fetch): source
+            for source in _interleave_by_host(sources, lambda source: source.get("url"))
+        }
         for future in as_completed(futures):
             result = future.result()
             source_results.append(result["source_result"])
             jobs.extend(result["jobs"])
     jobs = _dedupe_jobs(jobs)
     jobs = [normalize_council_job_record({**job, "fetched_at": job.get("fetched_at") or fetched_at}) for job in jobs]
-    detail_enrichment = {
-        "attempted": 0,
-        "succeeded": 0,
-        "details_parsed": 0,
-        "document_attempted": 0,
-        "document_succeeded": 0,
-        "documents_parsed": 0,
-    }
+    detail_enrichment = dict(EMPTY_DETAIL_ENRICHMENT_SUMMARY)
     if enrich_details:
         jobs, detail_enrichment = _enrich_jobs_from_detail_pages(
             jobs,
@@ -2029,7 +2970,7 @@ def job_intake_secondary_preview(
             binary_fetcher=fetch_binary,
             detail_job_limit=detail_job_limit,
             attachment_job_limit=0,
-            max_workers=workers,
+            max_workers=max_workers,
             fetch_linked_documents=False,
         )
     jobs = _infer_missing_councils_from_job_text(jobs, registry)
@@ -2112,8 +3053,14 @@ def _endpoint_candidate_sources(registry: dict[str, Any]) -> list[dict[str, Any]
 def _scrape_source(
     source: dict[str, Any],
     fetcher: Callable[[str], tuple[str, dict[str, Any]]],
+    visited_urls: set[str] | None = None,
 ) -> dict[str, Any]:
     listing_url = source.get("listing_url") or ""
+    # One set is shared by reference down the embedded-board recursion, so a
+    # board embedded by two siblings, or one that embeds its parent back, is
+    # only scraped once per source.
+    if visited_urls is None:
+        visited_urls = {canonicalize_job_url(listing_url)}
     base_result = {
         "short_name": source.get("short_name"),
         "council_name": source.get("council_name"),
@@ -2123,9 +3070,23 @@ def _scrape_source(
         "candidate_pattern_id": source.get("candidate_pattern_id"),
         "candidate_notes": source.get("candidate_notes"),
     }
+    max_jobs = _source_max_jobs(source)
     try:
+        # Pulse tenancies serve the same jobs as JSON; when the feed answers
+        # at its default location the listing HTML is not needed at all.
+        direct_api_url = _pulse_api_url(source, "") if source.get("platform_family") == "pulse" else ""
+        if direct_api_url:
+            jobs, fetch_meta = _fetch_pulse_jobs_from_api(source, direct_api_url, fetcher, max_jobs=max_jobs)
+            if jobs:
+                return _scraped_source_result(source, jobs, {**base_result, **fetch_meta}, max_jobs=max_jobs)
         html, fetch_meta = fetcher(listing_url)
-        jobs = _extract_pulse_jobs_from_listing_api(source, html, fetcher) if source.get("platform_family") == "pulse" else []
+        jobs = _extract_pulse_jobs_from_listing_api(
+            source,
+            html,
+            fetcher,
+            attempted_api_url=direct_api_url,
+            max_jobs=max_jobs,
+        ) if source.get("platform_family") == "pulse" else []
         if not jobs and source.get("platform_family") == "smartrecruiters":
             jobs = _extract_smartrecruiters_jobs_from_listing_api(source, html, fetcher)
         if not jobs and source.get("platform_family") == "elmo_talent":
@@ -2137,27 +3098,40 @@ def _scrape_source(
         if not jobs and source.get("platform_family") == "oracle_hcm":
             jobs = _extract_oracle_hcm_jobs_from_listing_api(source, html, fetcher)
         if not jobs:
-            jobs = extract_job_summaries_from_listing(source, html)
-        embedded_sources = _embedded_listing_sources(source, html)
-        if not jobs and embedded_sources:
-            for embedded_source in embedded_sources:
-                embedded_result = _scrape_source(embedded_source, fetcher)
+            jobs = extract_job_summaries_from_listing(source, html, max_jobs=max_jobs)
+        # Embedded boards are only followed when the page itself listed no
+        # jobs, so a page that already did is not scanned for them at all.
+        embedded_sources = [] if jobs else _claim_embedded_sources(
+            _embedded_listing_sources(source, html),
+            visited_urls,
+        )
+        if embedded_sources:
+            # Embedded ATS boards are usually on other hosts; scrape them side
+            # by side and keep their jobs in discovery order.
+            if len(embedded_sources) > 1:
+                with ThreadPoolExecutor(max_workers=min(len(embedded_sources), EMBEDDED_SOURCE_WORKERS)) as executor:
+                    embedded_results = list(executor.map(
+                        lambda embedded_source: _scrape_source(embedded_source, fetcher, visited_urls),
+                        embedded_sources,
+                    ))
+            else:
+                embedded_results = [
+                    _scrape_source(embedded_source, fetcher, visited_urls)
+                    for embedded_source in embedded_sources
+                ]
+            for embedded_result in embedded_results:
                 jobs.extend(embedded_result.get("jobs") or [])
         source_rejection_reason = _source_rejection_reason(source, html, jobs)
         if source_rejection_reason:
             jobs = []
-        jobs = [normalize_council_job_record(job) for job in jobs]
-        return {
-            "jobs": jobs,
-            "source_result": {
-                **base_result,
-                **fetch_meta,
-                "status": "ok",
-                "parsed_jobs": len(jobs),
-                "embedded_sources_attempted": len(embedded_sources),
-                "source_rejection_reason": source_rejection_reason or None,
-            },
-        }
+        return _scraped_source_result(
+            source,
+            jobs,
+            {**base_result, **fetch_meta},
+            max_jobs=max_jobs,
+            embedded_sources_attempted=len(embedded_sources),
+            source_rejection_reason=source_rejection_reason,
+        )
     except RequestException as error:
         return {
             "jobs": [],
@@ -2180,6 +3154,55 @@ def _scrape_source(
         }
 
 
+_EMBEDDED_VISIT_LOCK = Lock()
+
+
+def _claim_embedded_sources(
+    embedded_sources: list[dict[str, Any]],
+    visited_urls: set[str],
+) -> list[dict[str, Any]]:
+    # Sibling boards scraped side by side share visited_urls; checking and
+    # adding under one lock stops two of them claiming the same nested board.
+    with _EMBEDDED_VISIT_LOCK:
+        claimed = [
+            embedded_source for embedded_source in embedded_sources
+            if embedded_source["listing_url"] not in visited_urls
+        ]
+        visited_urls.update(embedded_source["listing_url"] for embedded_source in claimed)
+    return claimed
+
+
+def _scraped_source_result(
+    source: dict[str, Any],
+    jobs: list[dict[str, Any]],
+    base_result: dict[str, Any],
+    *,
+    max_jobs: int,
+    embedded_sources_attempted: int = 0,
+    source_rejection_reason: str = "",
+) -> dict[str, Any]:
+    if max_jobs > 0:
+        jobs = jobs[:max_jobs]
+    jobs = [normalize_council_job_record(job) for job in jobs]
+    return {
+        "jobs": jobs,
+        "source_result": {
+            **base_result,
+            "status": "ok",
+            "parsed_jobs": len(jobs),
+            "embedded_sources_attempted": embedded_sources_attempted,
+            "source_rejection_reason": source_rejection_reason or None,
+        },
+    }
+
+
+def _source_max_jobs(source: dict[str, Any]) -> int:
+    try:
+        return max(0, int(source.get("max_jobs") or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
 def _source_rejection_reason(source: dict[str, Any], html: str, jobs: list[dict[str, Any]]) -> str:
     if not jobs:
         return ""
@@ -2333,10 +3356,9 @@ def _careers_at_council_council_page_sources(registry_payload: dict[str, Any]) -
 
 def _careers_at_council_slug(council_name: str) -> str:
     text = normalize_whitespace(council_name)
-    text = re.sub(r"\bCouncil\b$", "", text, flags=re.I).strip()
-    text = re.sub(r"&", " and ", text)
-    slug = re.sub(r"[^A-Za-z0-9]+", "-", text.lower()).strip("-")
-    return slug
+    text = _TRAILING_COUNCIL_RE.sub("", text).strip()
+    text = text.replace("&", " and ")
+    return _NON_ALNUM_RE.sub("-", text.lower()).strip("-")
 
 
 def _jora_council_search_sources(registry_payload: dict[str, Any]) -> list[dict[str, Any]]:
@@ -2386,7 +3408,7 @@ def _jora_council_query_slugs(council_name: str, short_name: str = "") -> list[s
 def _jora_slug(value: str) -> str:
     text = normalize_whitespace(value)
     text = text.replace("&", " and ")
-    return re.sub(r"[^A-Za-z0-9]+", "-", text).strip("-")
+    return _NON_ALNUM_RE.sub("-", text).strip("-")
 
 
 def _local_government_jobs_council_search_sources(registry_payload: dict[str, Any]) -> list[dict[str, Any]]:
@@ -2489,9 +3511,8 @@ def _extract_careers_at_council_jobs(source: dict[str, Any], html: str) -> list[
             continue
         job_url = canonicalize_job_url(href)
         year = _year_from_job_url(job_url) or current_date.year
-        month_name = r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
-        posted_match = re.search(rf"\bPosted:\s*((?:\d+\s+days?\s+ago)|(?:\d{{1,2}}\s+{month_name}))\b", dates_text, re.I)
-        closing_match = re.search(rf"\bCloses:\s*(\d{{1,2}}\s+{month_name})\b", dates_text, re.I)
+        posted_match = _CAREERS_AT_COUNCIL_POSTED_RE.search(dates_text)
+        closing_match = _CAREERS_AT_COUNCIL_CLOSES_RE.search(dates_text)
         jobs.append(normalize_council_job_record({
             "job_uid": _job_uid({"short_name": source.get("source_id")}, job_url),
             "job_title": title,
@@ -2522,15 +3543,15 @@ def _extract_local_government_jobs(source: dict[str, Any], html: str) -> list[di
     card_pattern = re.compile(r'<li class="[^"]*fade-in-bottom[^"]*"[^>]*>(?P<body>.*?)</li>', re.I | re.S)
     for match in card_pattern.finditer(html or ""):
         body = match.group("body")
-        href_match = re.search(r'href="(?P<href>https://www\.localgovernmentjobs\.com\.au/job/(?!autocomplete)[^"]+)"', body, re.I)
+        href_match = _LGJ_CARD_HREF_RE.search(body)
         if not href_match:
             continue
         title_html = _html_class_text(body, "post-main-title")
-        title = _clean_job_title(re.sub(r"\b(?:Full Time|Part Time|Casual|Contractual|Expression of Interest)\b", "", title_html, flags=re.I))
+        title = _clean_job_title(_WORK_TYPE_RE.sub("", title_html))
         card_text = html_to_text(body)
         if source.get("strict_council_match") and not _source_council_mentioned_in_text(source, card_text):
             continue
-        salary_match = re.search(r"\b(?:Salary\s+)?((?:Competitive)|(?:\$[\d,]+(?:\s*(?:-|to)\s*\$?[\d,]+)?(?:\s*(?:pa|per annum|p/a|hour|weekly|fortnightly|monthly))?))\b", card_text, re.I)
+        salary_match = _LGJ_CARD_SALARY_RE.search(card_text)
         if not title:
             continue
         job_url = canonicalize_job_url(href_match.group("href"))
@@ -2563,17 +3584,18 @@ def _extract_jora_jobs(source: dict[str, Any], html: str) -> list[dict[str, Any]
         return []
     jobs: list[dict[str, Any]] = []
     current_date = datetime.now().date()
+    base_url = str(source.get("url") or "https://au.jora.com")
     for href, body, metadata in _jora_card_blocks(html):
         title = _clean_job_title(metadata.get("job_title") or _html_class_text(body, "job-title"))
         company = normalize_whitespace(metadata.get("company_name") or _html_class_text(body, "job-company"))
         card_text = html_to_text(body)
         if not title or not _jora_company_matches_council(source, company, card_text):
             continue
-        job_url = _canonicalize_jora_job_url(urljoin(str(source.get("url") or "https://au.jora.com"), unescape(href)))
+        job_url = _canonicalize_jora_job_url(urljoin(base_url, unescape(href)))
         if not job_url:
             continue
         posted_text = ""
-        posted_match = re.search(r"\bPosted\s+((?:\d+\s*(?:d|day|days)|\d+\s*(?:mo|month|months))\s+ago)\b", card_text, re.I)
+        posted_match = _JORA_POSTED_RE.search(card_text)
         if posted_match:
             posted_text = _relative_posted_date_text(posted_match.group(1), current_date)
         salary_text = _extract_jora_salary_text(card_text)
@@ -2607,16 +3629,17 @@ def _extract_council_direct_jobs(source: dict[str, Any], html: str) -> list[dict
     parser = ListingLinkParser()
     parser.feed(html or "")
     seen_urls: set[str] = set()
+    base_url = str(source.get("url") or "")
     for link in parser.links:
-        absolute_url = canonicalize_job_url(urljoin(str(source.get("url") or ""), unescape(link.href)))
+        absolute_url = canonicalize_job_url(urljoin(base_url, unescape(link.href)))
         if "councildirect.com.au/job/" not in absolute_url or absolute_url in seen_urls:
             continue
         text = normalize_whitespace(unescape(link.text))
         if "VIC (Victoria)" not in text:
             continue
         seen_urls.add(absolute_url)
-        work_type_match = re.search(r"\b(Full Time|Part Time|Contractual|Casual|Expression of Interest)\b", text, re.I)
-        title_text = text[:work_type_match.start()] if work_type_match else re.split(r"\bSalary:\s*", text, maxsplit=1, flags=re.I)[0]
+        work_type_match = _WORK_TYPE_RE.search(text)
+        title_text = text[:work_type_match.start()] if work_type_match else _SALARY_LABEL_RE.split(text, maxsplit=1)[0]
         salary_text = ""
         council_name = ""
         council_match = re.search(
@@ -2631,7 +3654,7 @@ def _extract_council_direct_jobs(source: dict[str, Any], html: str) -> list[dict
         else:
             council_name = normalize_whitespace(str(source.get("council_name") or source.get("short_name") or ""))
         if not salary_text:
-            salary_match = re.search(r"\bSalary:\s*(?P<salary>.*?)(?:\s+VIC\s+\(Victoria\)|$)", text, re.I)
+            salary_match = _COUNCIL_DIRECT_SALARY_RE.search(text)
             if salary_match:
                 salary_text = normalize_whitespace(salary_match.group("salary"))
         salary_text = _clean_council_direct_salary_text(salary_text, council_name, source)
@@ -2723,8 +3746,8 @@ def _infer_missing_councils_from_job_text(
     return inferred_jobs
 
 
-def _council_text_patterns(registry_payload: dict[str, Any]) -> list[dict[str, str]]:
-    rows: list[dict[str, str]] = []
+def _council_text_patterns(registry_payload: dict[str, Any]) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
     for row in registry_payload.get("rows") or []:
         short_name = normalize_whitespace(str(row.get("short_name") or ""))
         council_name = normalize_whitespace(str(row.get("council_name") or short_name))
@@ -2744,6 +3767,8 @@ def _council_text_patterns(registry_payload: dict[str, Any]) -> list[dict[str, s
                 continue
             rows.append({
                 "phrase": phrase,
+                "needle": phrase.lower(),
+                "pattern": re.compile(rf"(?<![A-Za-z0-9]){re.escape(phrase)}(?![A-Za-z0-9])", re.I),
                 "short_name": short_name or council_name,
                 "council_name": council_name or short_name,
             })
@@ -2752,13 +3777,15 @@ def _council_text_patterns(registry_payload: dict[str, Any]) -> list[dict[str, s
 
 def _match_council_text(
     text: str,
-    council_patterns: list[dict[str, str]],
-) -> dict[str, str] | None:
+    council_patterns: list[dict[str, Any]],
+) -> dict[str, Any] | None:
     if not text:
         return None
+    # A plain substring scan rules out almost every phrase; only the few that
+    # occur at all need the word-boundary regex.
+    lowered = text.lower()
     for item in council_patterns:
-        phrase = item["phrase"]
-        if re.search(rf"(?<![A-Za-z0-9]){re.escape(phrase)}(?![A-Za-z0-9])", text, re.I):
+        if item["needle"] in lowered and item["pattern"].search(text):
             return item
     return None
 
@@ -2802,7 +3829,7 @@ def _jora_card_blocks(html: str) -> list[tuple[str, str, dict[str, str]]]:
         body = text[marker.start():end]
         attrs = marker.group(0)
         metadata: dict[str, str] = {}
-        metadata_match = re.search(r'data-braze-job-panel-view=["\'](?P<json>[^"\']+)["\']', attrs, re.I | re.S)
+        metadata_match = _JORA_PANEL_METADATA_RE.search(attrs)
         if metadata_match:
             try:
                 decoded = json.loads(unescape(metadata_match.group("json")))
@@ -2841,28 +3868,30 @@ def _html_element_end(html: str, start: int, tag_name: str) -> int | None:
 
 
 def _html_class_texts(html: str, class_name: str) -> list[str]:
-    pattern = re.compile(
+    if not _html_mentions_class(html, class_name):
+        return []
+    texts = (
+        normalize_whitespace(html_to_text(match.group("body")))
+        for match in _html_class_texts_pattern(class_name).finditer(html or "")
+    )
+    return [text for text in texts if text]
+
+
+@lru_cache(maxsize=64)
+def _html_class_texts_pattern(class_name: str) -> re.Pattern[str]:
+    return re.compile(
         rf'<[^>]+class=["\'][^"\']*\b{re.escape(class_name)}\b[^"\']*["\'][^>]*>(?P<body>.*?)</[^>]+>',
         re.I | re.S,
     )
-    return [
-        normalize_whitespace(html_to_text(match.group("body")))
-        for match in pattern.finditer(html or "")
-        if normalize_whitespace(html_to_text(match.group("body")))
-    ]
 
 
 def _looks_like_salary_text(value: str) -> bool:
     text = normalize_whitespace(value)
-    return bool(re.search(r"\$|salary|remuneration|per annum|\bpa\b|\bp/a\b", text, re.I))
+    return bool(_SALARY_HINT_RE.search(text))
 
 
 def _extract_jora_salary_text(card_text: str) -> str:
-    match = re.search(
-        r"\$[\d,]+(?:\.\d{1,2})?(?:\s*(?:-|to|–|—)\s*\$?[\d,]+(?:\.\d{1,2})?)?\s*(?:a year|per annum|pa|p/a|an hour|per hour|hour|weekly|per week)?",
-        card_text or "",
-        re.I,
-    )
+    match = _JORA_SALARY_RE.search(card_text or "")
     return normalize_whitespace(match.group(0)) if match else ""
 
 
@@ -2884,10 +3913,18 @@ def _source_council_mentioned_in_text(source: dict[str, Any], text: str) -> bool
     haystack = normalize_whitespace(text).lower()
     if not haystack:
         return False
-    for phrase in _source_council_phrases(source):
-        if re.search(rf"(?<![a-z0-9]){re.escape(phrase.lower())}(?![a-z0-9])", haystack):
-            return True
-    return False
+    pattern = _council_mention_pattern(tuple(_source_council_phrases(source)))
+    return bool(pattern and pattern.search(haystack))
+
+
+@lru_cache(maxsize=256)
+def _council_mention_pattern(phrases: tuple[str, ...]) -> re.Pattern[str] | None:
+    # Every card from a council-scoped board is checked against the same
+    # phrases; one alternation scans the card once instead of once per phrase.
+    if not phrases:
+        return None
+    alternation = "|".join(re.escape(phrase.lower()) for phrase in phrases)
+    return re.compile(rf"(?<![a-z0-9])(?:{alternation})(?![a-z0-9])")
 
 
 def _source_council_phrases(source: dict[str, Any]) -> list[str]:
@@ -2909,7 +3946,7 @@ def _source_council_phrases(source: dict[str, Any]) -> list[str]:
 
 
 def _year_from_job_url(url: str) -> int | None:
-    match = re.search(r"(?<!\d)(20\d{2})(?:[01]\d[0-3]\d)?(?!\d)", url or "")
+    match = _JOB_URL_YEAR_RE.search(url or "")
     if not match:
         return None
     try:
@@ -2922,21 +3959,36 @@ def _careers_at_council_date_text(value: str, year: int, current_date: datetime.
     return _relative_posted_date_text(value, current_date, default_year=year)
 
 
+@lru_cache(maxsize=1024)
 def _relative_posted_date_text(value: str, current_date: datetime.date, *, default_year: int | None = None) -> str:
+    # Board cards share a handful of "N days ago" / "12 May" strings per run,
+    # and the scrape's date is part of the key.
     text = normalize_whitespace(value)
-    days_match = re.fullmatch(r"(\d+)\s*(?:d|day|days)\s+ago", text, re.I)
+    days_match = _DAYS_AGO_RE.fullmatch(text)
     if days_match:
         posted_date = current_date - timedelta(days=int(days_match.group(1)))
         return posted_date.strftime("%d %b %Y")
-    months_match = re.fullmatch(r"(\d+)\s*(?:mo|month|months)\s+ago", text, re.I)
+    months_match = _MONTHS_AGO_RE.fullmatch(text)
     if months_match:
         posted_date = current_date - timedelta(days=int(months_match.group(1)) * 30)
         return posted_date.strftime("%d %b %Y")
-    if re.search(r"\b20\d{2}\b", text):
+    if _YEAR_RE.search(text):
         return text
     return f"{text} {default_year or current_date.year}"
 
 
+def _detail_enrichment_candidates(
+    jobs: list[dict[str, Any]],
+    detail_job_limit: int,
+) -> list[tuple[int, dict[str, Any]]]:
+    candidates = [
+        (index, job) for index, job in enumerate(jobs)
+        if _job_needs_detail_enrichment(job) and _job_detail_is_fetchable(job)
+    ]
+    limit = max(0, detail_job_limit)
+    return candidates[:limit] if limit > 0 else candidates
+
+
 def _enrich_jobs_from_detail_pages(
     jobs: list[dict[str, Any]],
     *,
@@ -2946,29 +3998,18 @@ def _enrich_jobs_from_detail_pages(
     attachment_job_limit: int,
     max_workers: int,
     fetch_linked_documents: bool,
+    per_host_limit: int = DETAIL_FETCH_PER_HOST_LIMIT,
 ) -> tuple[list[dict[str, Any]], dict[str, int]]:
     enriched_jobs: list[dict[str, Any]] = list(jobs)
-    limit = max(0, detail_job_limit)
-    candidates = [
-        (index, job) for index, job in enumerate(jobs)
-        if _job_needs_detail_enrichment(job)
-    ]
-    if limit > 0:
-        candidates = candidates[:limit]
+    candidates = _detail_enrichment_candidates(jobs, detail_job_limit)
     if not candidates:
-        return enriched_jobs, {
-            "attempted": 0,
-            "succeeded": 0,
-            "details_parsed": 0,
-            "document_attempted": 0,
-            "document_succeeded": 0,
-            "documents_parsed": 0,
-        }
+        return enriched_jobs, dict(EMPTY_DETAIL_ENRICHMENT_SUMMARY)
 
     document_budget = {"remaining": max(0, attachment_job_limit), "lock": Lock()}
+    detail_fetch = _HostSlots(per_host_limit).limit(fetcher)
 
     def enrich_one(job: dict[str, Any]) -> dict[str, Any]:
-        detail_html, _fetch_meta = fetcher(str(job.get("job_url") or ""))
+        detail_html, _fetch_meta = detail_fetch(str(job.get("job_url") or ""))
         limited_binary_fetcher = None
         if fetch_linked_documents:
             limited_binary_fetcher = lambda url: _budgeted_binary_fetch(url, binary_fetcher, document_budget)
@@ -2979,12 +4020,13 @@ def _enrich_jobs_from_detail_pages(
             binary_fetcher=None,
         )
         normalized = normalize_council_job_record(enriched)
-        if limited_binary_fetcher and _job_needs_document_enrichment(normalized):
-            normalized = normalize_council_job_record(enrich_job_from_detail_page(
-                normalized,
-                normalized,
-                detail_html,
-                binary_fetcher=limited_binary_fetcher,
+        attachments = normalized.get("attachments") if isinstance(normalized.get("attachments"), list) else []
+        if limited_binary_fetcher and attachments and _job_needs_document_enrichment(normalized):
+            # Reuse the attachments parsed above rather than re-reading the detail HTML.
+            normalized = normalize_council_job_record(_enrich_job_from_attachments(
+                dict(normalized),
+                attachments,
+                limited_binary_fetcher,
             ))
         return normalized
 
@@ -2997,7 +4039,7 @@ def _enrich_jobs_from_detail_pages(
     with ThreadPoolExecutor(max_workers=workers) as executor:
         futures = {
             executor.submit(enrich_one, job): index
-            for index, job in candidates
+            for index, job in _interleave_by_host(candidates, lambda candidate: candidate[1].get("job_url"))
         }
         for future in as_completed(futures):
             index = futures[future]
@@ -3040,6 +4082,89 @@ def _enrich_jobs_from_detail_pages(
     }
 
 
+class _HostSlots:
+    """Cap in-flight requests per host while a pool fetches many hosts at once."""
+
+    def __init__(self, per_host_limit: int) -> None:
+        self._per_host_limit = max(1, per_host_limit)
+        self._slots: dict[str, BoundedSemaphore] = {}
+        self._lock = Lock()
+
+    def _slot(self, url: str) -> BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = BoundedSemaphore(self._per_host_limit)
+            return self._slots[host]
+
+    def limit(self, fetch: Callable[[str], Any]) -> Callable[[str], Any]:
+        def limited_fetch(url: str) -> Any:
+            with self._slot(url):
+                return fetch(url)
+        return limited_fetch
+
+
+class _DetailPrefetch:
+    """Start detail-page fetches for jobs as their listings come back."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], tuple[str, dict[str, Any]]],
+        executor: ThreadPoolExecutor,
+        *,
+        host_slots: _HostSlots,
+        limit: int,
+    ) -> None:
+        self._fetch = fetch
+        self._limited_fetch = host_slots.limit(fetch)
+        self._executor = executor
+        self._remaining = max(0, limit)
+        self._started: set[str] = set()
+        self._futures: dict[str, Future] = {}
+        self._lock = Lock()
+
+    def start(self, jobs: list[dict[str, Any]]) -> None:
+        for job in jobs:
+            url = str(job.get("job_url") or "")
+            if self._remaining <= 0:
+                return
+            if url in self._started or not _job_needs_detail_enrichment(job) or not _job_detail_is_fetchable(job):
+                continue
+            self._started.add(url)
+            self._remaining -= 1
+            future = self._executor.submit(self._limited_fetch, url)
+            with self._lock:
+                self._futures[url] = future
+
+    def fetch(self, url: str) -> tuple[str, dict[str, Any]]:
+        # Each prefetched page is handed over once and then dropped, so the
+        # detail phase does not keep every page alive until the run ends.
+        with self._lock:
+            future = self._futures.pop(url, None)
+        if future is None:
+            return self._fetch(url)
+        return future.result()
+
+    def retain(self, urls: set[str]) -> None:
+        # Prefetches start on raw listing rows. Rows deduped away, past the
+        # detail limit or already banded once normalised never reach fetch(),
+        # so cancel them before the executor spends a request on each.
+        with self._lock:
+            for url in [url for url in self._futures if url not in urls]:
+                self._futures.pop(url).cancel()
+
+
+def _interleave_by_host(items: list[Any], url_for: Callable[[Any], Any]) -> list[Any]:
+    by_host: dict[str, list[Any]] = {}
+    for item in items:
+        by_host.setdefault(urlsplit(str(url_for(item) or "")).netloc.lower(), []).append(item)
+    queues = list(by_host.values())
+    interleaved: list[Any] = []
+    for position in range(max((len(queue) for queue in queues), default=0)):
+        interleaved.extend(queue[position] for queue in queues if position < len(queue))
+    return interleaved
+
+
 def _budgeted_binary_fetch(
     url: str,
     binary_fetcher: Callable[[str], tuple[bytes, dict[str, Any]]],
@@ -3060,6 +4185,20 @@ def _job_needs_detail_enrichment(job: dict[str, Any]) -> bool:
     )
 
 
+def _job_detail_is_fetchable(job: dict[str, Any]) -> bool:
+    # Untitled or placeholder rows, links that are not http(s) pages (mailto:,
+    # javascript:, bare anchors) and links straight at images, fonts or media
+    # can only fail or carry no job detail; never spend a detail slot on them.
+    title = normalize_whitespace(str(job.get("job_title") or "")).lower()
+    if title in {"", "n/a", "na", "-"}:
+        return False
+    url = str(job.get("job_url") or "").strip()
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in {"http", "https"} or not parts.netloc:
+        return False
+    return not _url_is_non_document_resource(url)
+
+
 def _job_needs_document_enrichment(job: dict[str, Any]) -> bool:
     attachments = job.get("attachments") if isinstance(job.get("attachments"), list) else []
     if not attachments and not job.get("position_description_url"):
@@ -3169,38 +4308,20 @@ def _completion_summary(jobs: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def _looks_like_job_attachment_link(text: str, url: str) -> bool:
-    label = normalize_whitespace(text).lower()
+def _looks_like_job_attachment_link(label: str, url: str) -> bool:
     parsed = urlsplit(url)
     if parsed.scheme.lower() in {"javascript", "mailto", "tel"}:
         return False
+    if _is_third_party_link_host(parsed.hostname or ""):
+        return False
     url_text = f"{parsed.path} {parsed.query}".lower()
-    strong_labels = (
-        "position description",
-        "position profile",
-        "position document",
-        "role description",
-        "job description",
-        "candidate pack",
-        "information pack",
-    )
-    if any(token in label for token in strong_labels):
+    if _ATTACHMENT_LABEL_RE.search(label):
         return True
     if not _url_looks_like_document(url):
         return False
-    if re.search(r"\bpd\b", label) and re.search(r"\b(pd|position|description)\b", url_text):
+    if _PD_LABEL_RE.search(label) and _PD_URL_WORD_RE.search(url_text):
         return True
-    return any(token in url_text for token in (
-        "position-description",
-        "role-description",
-        "job-description",
-        "candidate-pack",
-        "information-pack",
-        "position_profile",
-        "position-profile",
-        "/pd-",
-        "pd_",
-    ))
+    return bool(_ATTACHMENT_URL_TOKEN_RE.search(url_text))
 
 
 def _embedded_document_urls(html: str, base_url: str) -> list[str]:
@@ -3208,20 +4329,29 @@ def _embedded_document_urls(html: str, base_url: str) -> list[str]:
         return []
     decoded = unescape(html)
     candidates: list[str] = []
-    url_pattern = re.compile(
-        r"""(?P<url>(?:https?:)?//[^\s"'<>]+?(?:\.pdf|\.docx?|\.rtf|TransferFile\.ashx|gf-download=)[^\s"'<>]*)""",
-        re.I,
+    base_scheme = urlsplit(base_url).scheme or "https"
+    # The same document is usually linked several times (anchor, button,
+    # data attribute); normalise each distinct raw URL once.
+    raw_urls = dict.fromkeys(
+        match.group("url").strip(" \t\r\n)")
+        for match in _EMBEDDED_DOCUMENT_URL_RE.finditer(decoded)
     )
-    for match in url_pattern.finditer(decoded):
-        raw_url = match.group("url").strip(" \t\r\n)")
+    for raw_url in raw_urls:
         if raw_url.startswith("//"):
-            raw_url = f"{urlsplit(base_url).scheme or 'https'}:{raw_url}"
+            raw_url = f"{base_scheme}:{raw_url}"
         absolute_url = _normalize_document_url(urljoin(base_url, raw_url), base_url)
-        if _url_looks_like_document(absolute_url):
+        if _url_looks_like_document(absolute_url) and not _is_third_party_link_host(urlsplit(absolute_url).hostname or ""):
             candidates.append(absolute_url)
     return list(dict.fromkeys(candidates))
 
 
+def _is_third_party_link_host(host: str) -> bool:
+    return any(
+        host == suffix or host.endswith(f".{suffix}")
+        for suffix in _THIRD_PARTY_LINK_HOST_SUFFIXES
+    )
+
+
 def _normalize_document_url(url: str, base_url: str = "") -> str:
     absolute_url = canonicalize_job_url(url)
     parsed = urlsplit(absolute_url)
@@ -3240,30 +4370,21 @@ def _normalize_document_url(url: str, base_url: str = "") -> str:
     return urlunsplit((parsed.scheme, parsed.netloc, normalized_path, parsed.query, ""))
 
 
-def _attachment_kind(text: str, url: str) -> str:
-    label = normalize_whitespace(text).lower()
-    url_text = f"{urlsplit(url).path} {urlsplit(url).query}".lower()
-    if (
-        "position description" in label
-        or "position-description" in url_text
-        or re.search(r"\bpd\b", label)
-        or "pd-" in url_text
-        or "pd_" in url_text
-        or re.search(r"(?:^|[/&=?._-])pd[-_]", url_text)
-    ):
-        return "position_description"
-    if "role description" in label or "role-description" in url_text:
+def _attachment_kind(label: str, url: str) -> str:
+    parsed = urlsplit(url)
+    url_text = f"{parsed.path} {parsed.query}".lower()
+    if _POSITION_DESCRIPTION_LABEL_RE.search(label) or _POSITION_DESCRIPTION_URL_RE.search(url_text):
         return "position_description"
     return "job_attachment"
 
 
 def _attachment_label_from_url(url: str) -> str:
     parsed = urlsplit(url)
-    query_match = re.search(r"(?:^|[?&])gf-download=([^&]+)", parsed.query)
+    query_match = _GF_DOWNLOAD_QUERY_RE.search(parsed.query)
     raw = query_match.group(1) if query_match else parsed.path.rsplit("/", 1)[-1]
     raw = unescape(raw).split("/")[-1]
-    raw = re.sub(r"\.(?:pdf|docx?|rtf)$", "", raw, flags=re.I)
-    raw = re.sub(r"[-_]+", " ", raw)
+    raw = _DOCUMENT_EXTENSION_RE.sub("", raw)
+    raw = _SLUG_SEPARATOR_RE.sub(" ", raw)
     return normalize_whitespace(raw) or "Job attachment"
 
 
@@ -3292,8 +4413,14 @@ def _url_looks_like_document(url: str) -> bool:
     return any(token in haystack for token in (".pdf", ".docx", ".doc", ".rtf", "transferfile.ashx", "gf-download=", "/file/recadvert/"))
 
 
+def _url_is_non_document_resource(url: str) -> bool:
+    return urlsplit(url).path.lower().endswith(NON_DOCUMENT_URL_SUFFIXES)
+
+
 def _should_fetch_attachment(attachment: dict[str, Any]) -> bool:
     url = str(attachment.get("url") or "")
+    if _url_is_non_document_resource(url):
+        return False
     return attachment.get("kind") == "position_description" or _url_looks_like_document(url)
 
 
@@ -3336,30 +4463,30 @@ def _looks_like_job_detail_url(platform: str, source: dict[str, Any], url: str)
     if not parsed.netloc or path == listing_path:
         return False
     if platform == "pageup":
-        return bool(re.search(r"/(?:cw/[a-z]{2}/|[a-z]{2}/)job/\d+/", path))
+        return bool(_PAGEUP_DETAIL_PATH_RE.search(path))
     if platform == "pulse":
         return "/Pulse/job/" in path
     if platform == "recruitmenthub":
-        return bool(re.search(r"/(?:Vacancies|Current-vacancies)/\d+/title/", path))
+        return bool(_RECRUITMENTHUB_DETAIL_PATH_RE.search(path))
     if platform == "applynow":
         host = parsed.netloc.lower()
         if "applynow.net.au" not in host or "/assets/" in path:
             return False
-        return bool(re.search(r"/jobs/(?:ni/)?[A-Za-z0-9]+(?:-[^/]+)?$", path))
+        return bool(_APPLYNOW_DETAIL_PATH_RE.search(path))
     if platform == "employmenthero":
         return parsed.netloc.lower() == "employmenthero.com" and path.startswith("/jobs/position/")
     if platform == "smartrecruiters":
-        return parsed.netloc.lower() == "jobs.smartrecruiters.com" and bool(re.search(r"/[^/]+/\d+", path))
+        return parsed.netloc.lower() == "jobs.smartrecruiters.com" and bool(_SMARTRECRUITERS_DETAIL_PATH_RE.search(path))
     if platform == "elmo_talent":
-        return "elmotalent.com.au" in parsed.netloc.lower() and bool(re.search(r"/careers/[^/]+/job/view/[^/]+", path))
+        return "elmotalent.com.au" in parsed.netloc.lower() and bool(_ELMO_DETAIL_PATH_RE.search(path))
     if platform == "aurion_selfservice":
-        return bool(re.search(r"/(?:jobs/)?vacancies/[^/]+/edit$", path))
+        return bool(_AURION_DETAIL_PATH_RE.search(path))
     if platform == "bigredsky":
         return parsed.netloc.lower() == listing_host and path == "/page.php" and "AdvertID=" in parsed.query
     if platform == "oracle_hcm":
-        return bool(re.search(r"/hcmUI/CandidateExperience/.+/job/[^/]+$", path))
+        return bool(_ORACLE_HCM_DETAIL_PATH_RE.search(path))
     if platform == "dayforce":
-        return "dayforcehcm.com" in parsed.netloc.lower() and bool(re.search(r"/jobs/[^/]+$", path))
+        return "dayforcehcm.com" in parsed.netloc.lower() and bool(_DAYFORCE_DETAIL_PATH_RE.search(path))
     if platform == "successfactors":
         return "successfactors.com" in parsed.netloc.lower() and path == "/sfcareer/jobreqcareer"
     if platform == "adlogic_martianlogic":
@@ -3372,28 +4499,58 @@ def _looks_like_job_detail_url(platform: str, source: dict[str, Any], url: str)
             return path.startswith(pattern_prefix)
         listing_prefix = listing_path.rstrip("/") + "/"
         return path.startswith(listing_prefix) and not path.endswith("#main-content")
-    return any(token in path for token in ("/job/", "/jobs/", "/Vacancies/", "/current-vacancies/"))
+    lowered_path = path.lower()
+    return any(token in lowered_path for token in ("/job/", "/jobs/", "/vacancies/", "/current-vacancies/"))
 
 
 def _extract_pulse_jobs_from_listing_api(
     source: dict[str, Any],
     html: str,
     fetcher: Callable[[str], tuple[str, dict[str, Any]]],
+    *,
+    attempted_api_url: str = "",
+    max_jobs: int = 0,
 ) -> list[dict[str, Any]]:
     api_url = _pulse_api_url(source, html)
-    if not api_url:
+    if not api_url or api_url == attempted_api_url:
         return []
+    jobs, _fetch_meta = _fetch_pulse_jobs_from_api(source, api_url, fetcher, max_jobs=max_jobs)
+    return jobs
+
+
+def _fetch_pulse_jobs_from_api(
+    source: dict[str, Any],
+    api_url: str,
+    fetcher: Callable[[str], tuple[str, dict[str, Any]]],
+    *,
+    max_jobs: int = 0,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
     try:
-        payload_text, _fetch_meta = fetcher(api_url)
+        payload_text, fetch_meta = fetcher(api_url)
         payload = json.loads(payload_text)
     except Exception:
-        return []
+        return [], {}
+    if not isinstance(payload, dict):
+        return [], {}
     jobs: list[dict[str, Any]] = []
+    # Tenancy-level fields are identical for every job in the feed.
+    tenancy = urlsplit(source.get("listing_url") or "")
+    tenancy_fields = {
+        "council_name": source.get("council_name"),
+        "short_name": source.get("short_name"),
+        "council_grouping": source.get("council_grouping"),
+        "poll_tier": source.get("poll_tier"),
+        "source_family": source.get("platform_family") or "pulse",
+        "source_name": f"{source.get('short_name')} job intake",
+        "listing_url": source.get("listing_url"),
+    }
     for item in payload.get("Jobs", []):
+        if max_jobs > 0 and len(jobs) >= max_jobs:
+            break
         job_info = item.get("JobInfo") or {}
         title = _clean_job_title(job_info.get("Title") or "")
         link_id = str(item.get("LinkId") or "").strip()
-        job_url = _pulse_job_url(source, item, title)
+        job_url = _pulse_job_url(tenancy, item, title)
         if not title or not job_url:
             continue
         absolute_url = canonicalize_job_url(job_url)
@@ -3402,13 +4559,7 @@ def _extract_pulse_jobs_from_listing_api(
             "job_title": title,
             "job_url": absolute_url,
             "source_job_id": link_id or _source_job_id("pulse", absolute_url),
-            "council_name": source.get("council_name"),
-            "short_name": source.get("short_name"),
-            "council_grouping": source.get("council_grouping"),
-            "poll_tier": source.get("poll_tier"),
-            "source_family": source.get("platform_family") or "pulse",
-            "source_name": f"{source.get('short_name')} job intake",
-            "listing_url": source.get("listing_url"),
+            **tenancy_fields,
             "location_text": job_info.get("Location"),
             "department": job_info.get("Department"),
             "work_type": job_info.get("EmploymentType"),
@@ -3429,7 +4580,7 @@ def _extract_pulse_jobs_from_listing_api(
                 "description_text": "pulse_json",
             },
         })
-    return jobs
+    return jobs, {**fetch_meta, "listing_fetch_mode": "pulse_json_api"}
 
 
 def _extract_smartrecruiters_jobs_from_listing_api(
@@ -3542,7 +4693,7 @@ def _smartrecruiters_company_name(item: dict[str, Any]) -> str:
 
 def _smartrecruiters_job_url(company_identifier: str, job_id: str, title_or_slug: Any) -> str:
     slug = str(title_or_slug or "")
-    slug = re.sub(r"[^A-Za-z0-9]+", "-", slug).strip("-").lower() or "job"
+    slug = _NON_ALNUM_RE.sub("-", slug).strip("-").lower() or "job"
     return f"https://jobs.smartrecruiters.com/{company_identifier}/{job_id}-{slug}"
 
 
@@ -3761,20 +4912,13 @@ def _extract_elmo_talent_jobs_from_listing(
 
 
 def _extract_elmo_talent_jobs_from_portal(source: dict[str, Any], html: str, portal_url: str) -> list[dict[str, Any]]:
-    blocks = re.findall(
-        r"<li\b(?=[^>]*\blist-group-item\b)[^>]*>(?P<body>.*?)</li>",
-        html or "",
-        re.I | re.S,
-    )
+    blocks = _ELMO_LIST_GROUP_ITEM_RE.findall(html or "")
     if not blocks and "section-list" in (html or ""):
-        section = _first_html_match(
-            html,
-            r"<div[^>]+id=[\"']section-list[\"'][^>]*>(?P<body>.*?)</div>\s*<div[^>]+class=[\"'][^\"']*\belmo-pagination\b",
-        )
-        blocks = re.findall(r"<li[^>]*>(?P<body>.*?)</li>", section or "", re.I | re.S)
+        section = _first_html_match(html, _ELMO_SECTION_LIST_RE)
+        blocks = _HTML_LIST_ITEM_RE.findall(section or "")
     jobs_by_url: dict[str, dict[str, Any]] = {}
     for block in blocks:
-        link_match = re.search(r"<a\s+[^>]*href=[\"'](?P<href>[^\"']+)[\"'][^>]*>(?P<title>.*?)</a>", block, re.I | re.S)
+        link_match = _ANCHOR_HREF_TITLE_RE.search(block)
         if not link_match:
             continue
         absolute_url = canonicalize_job_url(urljoin(portal_url, unescape(link_match.group("href"))))
@@ -3818,14 +4962,10 @@ def _extract_elmo_talent_jobs_from_portal(source: dict[str, Any], html: str, por
 
 def _elmo_talent_card_fields(html: str) -> dict[str, str]:
     values = [
-        html_to_text(match)
-        for match in re.findall(
-            r"<div[^>]+class=[\"'][^\"']*\bcol-md-10\b[^\"']*\bcol-sm-10\b[^\"']*\bcol-xs-10\b[^\"']*[\"'][^>]*>(?P<body>.*?)</div>",
-            html or "",
-            re.I | re.S,
-        )
+        value
+        for match in _ELMO_CARD_FIELD_RE.findall(html or "")
+        if (value := html_to_text(match))
     ]
-    values = [normalize_whitespace(value) for value in values if normalize_whitespace(value)]
     return {
         "location_text": values[0] if len(values) > 0 else "",
         "work_type": values[1] if len(values) > 1 else "",
@@ -3834,10 +4974,7 @@ def _elmo_talent_card_fields(html: str) -> dict[str, str]:
 
 
 def _elmo_talent_card_summary(html: str, title: str) -> str:
-    left_column = _first_html_match(
-        html,
-        r"<div[^>]+class=[\"'][^\"']*\bcol-md-8\b[^\"']*\brt-editor\b[^\"']*[\"'][^>]*>(?P<body>.*?)</div>\s*<div[^>]+class=[\"'][^\"']*\bcol-md-4\b",
-    )
+    left_column = _first_html_match(html, _ELMO_SUMMARY_COLUMN_RE)
     if not left_column:
         return ""
     text = html_to_text(left_column)
@@ -3850,20 +4987,24 @@ def _elmo_talent_embed_url(source: dict[str, Any], html: str, base_url: str) ->
     explicit = str(source.get("embed_url") or "").strip()
     if explicit:
         return explicit
-    match = re.search(r"<iframe[^>]+src=[\"'](?P<src>[^\"']*elmotalent\.com\.au[^\"']*)[\"']", html or "", re.I)
+    match = _ELMO_IFRAME_SRC_RE.search(html or "")
     if match:
         return urljoin(base_url, unescape(match.group("src")))
     return ""
 
 
 def _extract_labelled_inline_value(text: str, labels: tuple[str, ...]) -> str | None:
+    match = _labelled_inline_value_pattern(labels).search(normalize_whitespace(text))
+    return match.group("value").strip(" -|") if match else None
+
+
+@lru_cache(maxsize=16)
+def _labelled_inline_value_pattern(labels: tuple[str, ...]) -> re.Pattern[str]:
     label_pattern = "|".join(re.escape(label) for label in labels)
-    match = re.search(
+    return re.compile(
         rf"\b(?:{label_pattern})\s*:?\s*(?P<value>.+?)(?=\s+(?:Location|Job Location|Job Type|Employment Type|Closing Date|Applications close|Closes)\s*:|$)",
-        normalize_whitespace(text),
         re.I,
     )
-    return match.group("value").strip(" -|") if match else None
 
 
 def _extract_aurion_jobs_from_listing(source: dict[str, Any], html: str) -> list[dict[str, Any]]:
@@ -3875,10 +5016,10 @@ def _extract_aurion_jobs_from_listing(source: dict[str, Any], html: str) -> list
     )
     for match in row_pattern.finditer(html or ""):
         body = match.group("body")
-        title_match = re.search(r'data-th="Position"[^>]*>(?P<title>.*?)</td>', body, re.I | re.S)
+        title_match = _AURION_POSITION_CELL_RE.search(body)
         if not title_match:
             continue
-        title = _clean_job_title(re.sub(r"<[^>]+>", " ", unescape(title_match.group("title"))))
+        title = _clean_job_title(_HTML_TAG_RE.sub(" ", unescape(title_match.group("title"))))
         if not title:
             continue
         job_url = canonicalize_job_url(urljoin(listing_url, unescape(match.group("url"))))
@@ -3915,7 +5056,7 @@ def _extract_bigredsky_jobs_from_listing(source: dict[str, Any], html: str) -> l
         link_match = link_pattern.search(row_body)
         if not link_match:
             continue
-        title = _clean_job_title(re.sub(r"<[^>]+>", " ", unescape(link_match.group("title"))))
+        title = _clean_job_title(_HTML_TAG_RE.sub(" ", unescape(link_match.group("title"))))
         if not title or _is_non_job_navigation_title("native_council", title):
             continue
         job_url = canonicalize_job_url(urljoin(listing_url, unescape(link_match.group("href"))))
@@ -3923,8 +5064,8 @@ def _extract_bigredsky_jobs_from_listing(source: dict[str, Any], html: str) -> l
             continue
         seen_urls.add(job_url)
         cells = [
-            normalize_whitespace(re.sub(r"<[^>]+>", " ", unescape(cell.group("body"))))
-            for cell in re.finditer(r"<td\b[^>]*>(?P<body>.*?)</td>", row_body, re.I | re.S)
+            normalize_whitespace(_HTML_TAG_RE.sub(" ", unescape(cell.group("body"))))
+            for cell in _TABLE_CELL_RE.finditer(row_body)
         ]
         closing_text = cells[0] if cells else ""
         location_text = cells[2] if len(cells) >= 3 else ""
@@ -3956,7 +5097,7 @@ def _extract_bigredsky_jobs_from_listing(source: dict[str, Any], html: str) -> l
         })
 
     for match in link_pattern.finditer(html or ""):
-        title = _clean_job_title(re.sub(r"<[^>]+>", " ", unescape(match.group("title"))))
+        title = _clean_job_title(_HTML_TAG_RE.sub(" ", unescape(match.group("title"))))
         if not title or _is_non_job_navigation_title("native_council", title):
             continue
         job_url = canonicalize_job_url(urljoin(listing_url, unescape(match.group("href"))))
@@ -3982,7 +5123,7 @@ def _extract_bigredsky_jobs_from_listing(source: dict[str, Any], html: str) -> l
 
 
 def _pulse_api_url(source: dict[str, Any], html: str) -> str:
-    match = re.search(r"_webServiceUrl\s*=\s*['\"]([^'\"]+)", html or "")
+    match = _PULSE_WEB_SERVICE_URL_RE.search(html or "")
     if match:
         base = match.group(1).rstrip("/") + "/"
     else:
@@ -3990,7 +5131,7 @@ def _pulse_api_url(source: dict[str, Any], html: str) -> str:
         if not parsed.netloc:
             return ""
         base = urlunsplit((parsed.scheme or "https", parsed.netloc, "/WebServices/", "", ""))
-    return urljoin(base, "RCM/Jobs/Jobs?internalOnly=false&workArrangement=&employmentType=")
+    return base + _PULSE_JOBS_API_PATH
 
 
 def _embedded_listing_sources(source: dict[str, Any], html: str) -> list[dict[str, Any]]:
@@ -3998,12 +5139,16 @@ def _embedded_listing_sources(source: dict[str, Any], html: str) -> list[dict[st
     listing_host = urlsplit(listing_url).netloc.lower()
     sources: list[dict[str, Any]] = []
     seen_urls: set[str] = set()
-    attr_pattern = re.compile(
-        r"\b(?:src|href|data-src|data-url)=['\"](?P<url>[^'\"]+)['\"]",
-        re.I,
-    )
-    for match in attr_pattern.finditer(html or ""):
-        absolute_url = canonicalize_job_url(urljoin(listing_url, unescape(match.group("url"))))
+    # A page repeats the same few hundred hrefs and srcs, and almost none name
+    # an ATS host. Collect the distinct values in one pass and only resolve
+    # and canonicalise the ones that could; relative links resolve onto the
+    # listing host, which is skipped anyway.
+    raw_urls = dict.fromkeys(unescape(match.group("url")) for match in _EMBED_ATTR_URL_RE.finditer(html or ""))
+    for raw_url in raw_urls:
+        lowered = raw_url.lower()
+        if not any(marker in lowered for marker in _EMBEDDED_ATS_HOST_MARKERS):
+            continue
+        absolute_url = canonicalize_job_url(urljoin(listing_url, raw_url))
         if not absolute_url or absolute_url in seen_urls:
             continue
         parsed = urlsplit(absolute_url)
@@ -4029,6 +5174,22 @@ def _embedded_listing_sources(source: dict[str, Any], html: str) -> list[dict[st
     return sources
 
 
+_EMBED_ATTR_URL_RE = re.compile(r"\b(?:src|href|data-src|data-url)=['\"](?P<url>[^'\"]+)['\"]", re.I)
+# Every host fragment _embedded_platform_family recognises; keep the two in step.
+_EMBEDDED_ATS_HOST_MARKERS = (
+    "applynow.net.au",
+    "pulsesoftware.com",
+    "recruitmenthub.com.au",
+    "bigredsky.com",
+    "aurion.cloud",
+    "selfservice",
+    "elmotalent.com.au",
+    "pageuppeople.com",
+    "smartrecruiters.com",
+    "dayforcehcm.com",
+)
+
+
 def _embedded_platform_family(host: str, path: str) -> str:
     if "applynow.net.au" in host:
         return "applynow"
@@ -4088,16 +5249,15 @@ def _embedded_detail_pattern(platform: str) -> str:
     }.get(platform, "/jobs/{slug}")
 
 
-def _pulse_job_url(source: dict[str, Any], item: dict[str, Any], title: str) -> str:
+def _pulse_job_url(tenancy: SplitResult, item: dict[str, Any], title: str) -> str:
     apply_url = str(item.get("ApplyUrl") or "")
     link_id = str(item.get("LinkId") or "").strip()
     if apply_url:
         return apply_url.replace("/Pulse/apply/", "/Pulse/job/")
-    parsed = urlsplit(source.get("listing_url") or "")
-    if not parsed.netloc or not link_id:
+    if not tenancy.netloc or not link_id:
         return ""
-    slug = re.sub(r"[^A-Za-z0-9]+", "-", title).strip("-") or "job"
-    return urlunsplit((parsed.scheme or "https", parsed.netloc, f"/Pulse/job/{link_id}/{slug}", "source=public", ""))
+    slug = _PULSE_SLUG_RE.sub("-", title).strip("-") or "job"
+    return urlunsplit((tenancy.scheme or "https", tenancy.netloc, f"/Pulse/job/{link_id}/{slug}", "source=public", ""))
 
 
 def _detail_pattern_prefix(detail_pattern: Any) -> str:
@@ -4110,54 +5270,64 @@ def _detail_pattern_prefix(detail_pattern: Any) -> str:
 
 def _clean_job_title(value: str) -> str:
     text = " ".join(str(value or "").split())
-    text = re.sub(r"^Image\s+", "", text, flags=re.I)
-    text = re.sub(r"\b(Read more|Apply now|View details|View Job|View)\b", "", text, flags=re.I)
-    text = re.split(r"\s+Applications?\s+clos(?:e|ing)\s+on\b", text, maxsplit=1, flags=re.I)[0]
-    text = re.split(r"\s+(?:Are you|We are|Council is seeking)\b", text, maxsplit=1)[0]
-    text = re.split(r"\s+(?:Type|Duration|Salary)\s+", text, maxsplit=1)[0]
-    text = re.split(r"\s+at\s+.+?•", text, maxsplit=1)[0]
+    text = _TITLE_IMAGE_PREFIX_RE.sub("", text)
+    text = _TITLE_CALL_TO_ACTION_RE.sub("", text)
+    for cut_pattern in _TITLE_CUT_RES:
+        match = cut_pattern.search(text)
+        if match:
+            text = text[:match.start()]
+    # Only scan for an "at <employer> •" suffix when a bullet is present; the
+    # lazy span otherwise rescans the rest of the title from every " at ".
+    if "•" in text:
+        match = _TITLE_EMPLOYER_SUFFIX_RE.search(text)
+        if match:
+            text = text[:match.start()]
     text = " ".join(text.split(" - ")) if text.lower() in {"read more", "apply now", "view"} else text
     text = " ".join(text.split()).strip(" -|")
     return "" if text in {"()", "( )"} else text
 
 
 def _html_class_text(html: str, class_name: str) -> str:
-    pattern = re.compile(
-        rf'<[^>]+class="[^"]*\b{re.escape(class_name)}\b[^"]*"[^>]*>(?P<body>.*?)</[^>]+>',
-        re.I | re.S,
-    )
-    match = pattern.search(html or "")
+    if not _html_mentions_class(html, class_name):
+        return ""
+    match = _html_class_text_pattern(class_name).search(html or "")
     if not match:
         return ""
     return html_to_text(match.group("body"))
 
 
+def _html_mentions_class(html: str, class_name: str) -> bool:
+    # The class-anchored patterns try every tag in the fragment; a substring
+    # check settles the common "class not on this card" case first.
+    if not html:
+        return False
+    return class_name in html or class_name.lower() in html.lower()
+
+
+@lru_cache(maxsize=64)
+def _html_class_text_pattern(class_name: str) -> re.Pattern[str]:
+    return re.compile(
+        rf'<[^>]+class="[^"]*\b{re.escape(class_name)}\b[^"]*"[^>]*>(?P<body>.*?)</[^>]+>',
+        re.I | re.S,
+    )
+
+
 def _extract_opencities_job_list_jobs(source: dict[str, Any], html: str) -> list[dict[str, Any]]:
     platform = source.get("platform_family") or "unknown_official"
     if platform not in {"native_council", "unknown_official"} or "job-list-container" not in (html or ""):
         return []
     listing_url = source.get("listing_url") or source.get("official_careers_entry_url") or ""
     jobs_by_url: dict[str, dict[str, Any]] = {}
-    article_pattern = re.compile(
-        r"<article[^>]*>\s*<a\s+href=[\"'](?P<href>[^\"']+)[\"'][^>]*>(?P<body>.*?)</a>\s*</article>",
-        re.I | re.S,
-    )
-    for match in article_pattern.finditer(html or ""):
+    for match in _OPENCITIES_ARTICLE_RE.finditer(html or ""):
         absolute_url = canonicalize_job_url(_normalize_job_detail_url(platform, urljoin(listing_url, unescape(match.group("href")))))
         if not _looks_like_job_detail_url(platform, source, absolute_url):
             continue
         body = match.group("body")
-        title_html = _first_html_match(
-            body,
-            r"<h[1-6][^>]*class=[\"'][^\"']*\blist-item-title\b[^\"']*[\"'][^>]*>(?P<body>.*?)</h[1-6]>",
-        )
+        title_html = _first_html_match(body, _OPENCITIES_TITLE_RE)
         title = _clean_job_title(html_to_text(title_html) if title_html else html_to_text(body))
         if not title or _is_non_job_navigation_link(platform, title, absolute_url):
             continue
-        closing_html = _first_html_match(
-            body,
-            r"<p[^>]*class=[\"'][^\"']*\bapplications-closing\b[^\"']*[\"'][^>]*>(?P<body>.*?)</p>",
-        )
+        closing_html = _first_html_match(body, _OPENCITIES_CLOSING_RE)
         description_text = _opencities_card_description_text(body)
         job_number = _opencities_job_number(absolute_url)
         jobs_by_url[absolute_url] = {
@@ -4187,154 +5357,163 @@ def _extract_opencities_job_list_jobs(source: dict[str, Any], html: str) -> list
     return list(jobs_by_url.values())
 
 
-def _first_html_match(html: str, pattern: str) -> str:
-    match = re.search(pattern, html or "", re.I | re.S)
+def _first_html_match(html: str, pattern: re.Pattern[str]) -> str:
+    match = pattern.search(html or "")
     return match.group("body") if match else ""
 
 
 def _opencities_card_description_text(html: str) -> str:
-    paragraphs = re.findall(r"<p(?![^>]*\bapplications-closing\b)[^>]*>(.*?)</p>", html or "", re.I | re.S)
+    paragraphs = _OPENCITIES_DESCRIPTION_PARAGRAPH_RE.findall(html or "")
     return normalize_whitespace(" ".join(html_to_text(paragraph) for paragraph in paragraphs if paragraph))
 
 
 def _opencities_closing_text(html: str) -> str:
     text = html_to_text(html)
-    return re.sub(r"^Applications?\s+clos(?:e|ing)\s+on\s+", "", text, flags=re.I).strip()
+    return _OPENCITIES_CLOSING_PREFIX_RE.sub("", text).strip()
 
 
 def _opencities_job_number(url: str) -> str | None:
-    match = re.search(r"(R\d+)(?:/?$|[?#])", url, re.I)
+    match = _R_NUMBER_JOB_ID_RE.search(url)
     return match.group(1).upper() if match else None
 
 
+_NAVIGATION_FILTER_PLATFORMS = frozenset({"native_council", "unknown_official"})
+_NAVIGATION_TEXT_RE = re.compile(r"[^a-z0-9]+")
+_NON_JOB_NAVIGATION_TITLES = frozenset({
+    "all vacancies",
+    "application process",
+    "applying for a position",
+    "back to top",
+    "career job opportunities",
+    "careers",
+    "current vacancies",
+    "current vacancies portal",
+    "early years application information",
+    "employee benefits",
+    "explore our jobs",
+    "employment pathways",
+    "faq",
+    "help",
+    "key selection criteria",
+    "job search",
+    "jobs",
+    "login",
+    "print",
+    "register",
+    "recruitment and selection",
+    "search jobs",
+    "student placement and work experience",
+    "student placements",
+    "traineeships and apprenticeships",
+    "inclusive employment in wyndham",
+    "opportunity wyndham find work",
+    "volunteers",
+    "volunteering and work experience",
+    "work experience",
+    "view all job vacancies",
+    "view all jobs",
+    "view our current job opportunities",
+    "view current roles",
+    "volunteering at wyndham city council",
+    "why choose wyndham city",
+    "your recruitment journey",
+})
+_NON_JOB_NAVIGATION_TITLE_FRAGMENTS = (
+    "application process",
+    "apply for a job",
+    "apply for a position",
+    "applying for a position",
+    "applying for a job",
+    "benefits of working",
+    "careers in early years",
+    "choose team",
+    "click for a list",
+    "current opportunities",
+    "early years application information",
+    "employee benefits",
+    "employment opportunities",
+    "how to apply",
+    "information for applicants",
+    "learn about careers",
+    "our benefits",
+    "our recruitment process",
+    "positions vacant",
+    "recruitment and selection",
+    "select this as your preferred language",
+    "skip to main content",
+    "staff benefits",
+    "student placement",
+    "student placements",
+    "traineeships and apprenticeships",
+    "volunteering",
+    "work experience",
+    "working at northern grampians",
+    "working at team",
+    "why join",
+)
+_NON_JOB_NAVIGATION_SLUGS = frozenset({
+    "application-process",
+    "apply-for-a-job",
+    "apply-for-a-job-with-us",
+    "applying-for-a-position",
+    "applying-for-a-job-with-us",
+    "career-job-opportunities",
+    "career-opportunities",
+    "careers",
+    "careers-in-early-years",
+    "current-opportunities",
+    "current-vacancies",
+    "current-vacancies-portal",
+    "early-years-application-information",
+    "employee-benefits",
+    "employment",
+    "employment-opportunities",
+    "how-to-apply",
+    "addressing-the-key-selection-criteria",
+    "positions-vacant",
+    "our-benefits",
+    "recruitment-and-selection",
+    "staff-benefits",
+    "student-placement-and-work-experience",
+    "traineeships-and-apprenticeships",
+    "volunteer",
+    "volunteering",
+    "volunteering-opportunities",
+    "why-join-benalla-rural-city-council",
+    "why-work-at-stonnington",
+    "why-work-with-us",
+    "work-experience",
+    "work-experience-and-student-placements",
+    "working-at-northern-grampians-shire-council",
+    "working-at-team-baw-baw",
+    "working-with-us",
+})
+
+
 def _is_non_job_navigation_title(platform: str, title: str) -> bool:
-    if platform not in {"native_council", "unknown_official"}:
-        return False
-    normalized = re.sub(r"[^a-z0-9]+", " ", str(title or "").lower()).strip()
-    if not normalized:
+    if platform not in _NAVIGATION_FILTER_PLATFORMS:
         return False
-    blocked_exact = {
-        "all vacancies",
-        "application process",
-        "applying for a position",
-        "back to top",
-        "career job opportunities",
-        "careers",
-        "current vacancies",
-        "current vacancies portal",
-        "early years application information",
-        "employee benefits",
-        "explore our jobs",
-        "employment pathways",
-        "faq",
-        "help",
-        "key selection criteria",
-        "job search",
-        "jobs",
-        "login",
-        "print",
-        "register",
-        "recruitment and selection",
-        "search jobs",
-        "student placement and work experience",
-        "student placements",
-        "traineeships and apprenticeships",
-        "inclusive employment in wyndham",
-        "opportunity wyndham find work",
-        "volunteers",
-        "volunteering and work experience",
-        "work experience",
-        "view all job vacancies",
-        "view all jobs",
-        "view our current job opportunities",
-        "view current roles",
-        "volunteering at wyndham city council",
-        "why choose wyndham city",
-        "your recruitment journey",
-    }
-    return normalized in blocked_exact or normalized.startswith("why work")
+    return _is_blocked_navigation_title(_navigation_text(title))
 
 
 def _is_non_job_navigation_link(platform: str, title: str, url: str) -> bool:
-    if _is_non_job_navigation_title(platform, title):
-        return True
-    if platform not in {"native_council", "unknown_official"}:
+    if platform not in _NAVIGATION_FILTER_PLATFORMS:
         return False
-    normalized_title = re.sub(r"[^a-z0-9]+", " ", str(title or "").lower()).strip()
-    blocked_title_fragments = (
-        "application process",
-        "apply for a job",
-        "apply for a position",
-        "applying for a position",
-        "applying for a job",
-        "benefits of working",
-        "careers in early years",
-        "choose team",
-        "click for a list",
-        "current opportunities",
-        "early years application information",
-        "employee benefits",
-        "employment opportunities",
-        "how to apply",
-        "information for applicants",
-        "learn about careers",
-        "our benefits",
-        "our recruitment process",
-        "positions vacant",
-        "recruitment and selection",
-        "select this as your preferred language",
-        "skip to main content",
-        "staff benefits",
-        "student placement",
-        "student placements",
-        "traineeships and apprenticeships",
-        "volunteering",
-        "work experience",
-        "working at northern grampians",
-        "working at team",
-        "why join",
-    )
-    if any(fragment in normalized_title for fragment in blocked_title_fragments):
+    normalized_title = _navigation_text(title)
+    if _is_blocked_navigation_title(normalized_title):
         return True
-    slug = re.sub(r"[^a-z0-9]+", "-", urlsplit(url).path.rstrip("/").split("/")[-1].lower()).strip("-")
-    blocked_slugs = {
-        "application-process",
-        "apply-for-a-job",
-        "apply-for-a-job-with-us",
-        "applying-for-a-position",
-        "applying-for-a-job-with-us",
-        "career-job-opportunities",
-        "career-opportunities",
-        "careers",
-        "careers-in-early-years",
-        "current-opportunities",
-        "current-vacancies",
-        "current-vacancies-portal",
-        "early-years-application-information",
-        "employee-benefits",
-        "employment",
-        "employment-opportunities",
-        "how-to-apply",
-        "addressing-the-key-selection-criteria",
-        "positions-vacant",
-        "our-benefits",
-        "recruitment-and-selection",
-        "staff-benefits",
-        "student-placement-and-work-experience",
-        "traineeships-and-apprenticeships",
-        "volunteer",
-        "volunteering",
-        "volunteering-opportunities",
-        "why-join-benalla-rural-city-council",
-        "why-work-at-stonnington",
-        "why-work-with-us",
-        "work-experience",
-        "work-experience-and-student-placements",
-        "working-at-northern-grampians-shire-council",
-        "working-at-team-baw-baw",
-        "working-with-us",
-    }
-    return slug in blocked_slugs
+    if any(fragment in normalized_title for fragment in _NON_JOB_NAVIGATION_TITLE_FRAGMENTS):
+        return True
+    slug = _NAVIGATION_TEXT_RE.sub("-", urlsplit(url).path.rstrip("/").split("/")[-1].lower()).strip("-")
+    return slug in _NON_JOB_NAVIGATION_SLUGS
+
+
+def _navigation_text(title: str) -> str:
+    return _NAVIGATION_TEXT_RE.sub(" ", str(title or "").lower()).strip()
+
+
+def _is_blocked_navigation_title(normalized_title: str) -> bool:
+    return normalized_title in _NON_JOB_NAVIGATION_TITLES or normalized_title.startswith("why work")
 
 
 def _normalize_job_detail_url(platform: str, url: str) -> str:
@@ -4347,8 +5526,8 @@ def _normalize_job_detail_url(platform: str, url: str) -> str:
 
 def _title_from_url(url: str) -> str:
     slug = urlsplit(url).path.rstrip("/").split("/")[-1]
-    slug = re.sub(r"^[A-Za-z]{1,6}\d{2,}-", "", slug)
-    words = [word for word in re.split(r"[-_+]+", slug) if word and not word.isdigit()]
+    slug = _URL_SLUG_REFERENCE_PREFIX_RE.sub("", slug)
+    words = [word for word in slug.replace("_", "-").replace("+", "-").split("-") if word and not word.isdigit()]
     return " ".join(word.capitalize() for word in words) or "Untitled job"
 
 
@@ -4369,10 +5548,10 @@ def _source_job_id(platform: str, url: str) -> str | None:
     }
     pattern = patterns.get(platform)
     if platform == "successfactors":
-        match = re.search(r"(?:^|[?&])jobId=([^&]+)", urlsplit(url).query)
+        match = _JOB_ID_QUERY_RE.search(urlsplit(url).query)
         return match.group(1) if match else None
     if platform == "bigredsky":
-        match = re.search(r"(?:^|[?&])AdvertID=([^&]+)", urlsplit(url).query)
+        match = _ADVERT_ID_QUERY_RE.search(urlsplit(url).query)
         return match.group(1) if match else None
     if platform == "secondary_job_slug":
         slug = path.rstrip("/").rsplit("/", 1)[-1]
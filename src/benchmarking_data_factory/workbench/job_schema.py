@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 from html import unescape
 from html.parser import HTMLParser
 import re
@@ -15,8 +16,104 @@ try:
 except ZoneInfoNotFoundError:  # Windows test environments may not ship tzdata.
     VICTORIA_TZ = timezone(timedelta(hours=10), "AEST")
 
+_UNPAID_ROLE_RE = re.compile(r"\b(volunteer|voluntary|work experience|student placement|unpaid)\b")
+_SENIOR_BAND_RE = re.compile(r"\bband\s*(?:9|10|11|12)\b")
+_SENIOR_ROLE_RE = re.compile(r"\b(chief executive officer|chief executive|ceo|senior officer)\b")
+_CLASSIFICATION_BAND_RE = re.compile(r"\bBand\s*(?P<band>[1-9](?:[A-Z])?)\b", re.I)
+_BAND_DIGIT_RE = re.compile(r"[1-9]")
+_STANDARD_BAND_RE = re.compile(r"\bBand\s*(?P<band>[1-9])(?:[A-Z])?\b", re.I)
+_SALARY_TEXT_RE = re.compile(
+    r"(?P<salary>(?:Hourly Rate\s+)?AUD\s*)?\$[\d,]+(?:\.\d{1,2})?\s*k?"
+    r"(?:\s*(?:-|to|\u2013|\u2014)\s*\$?[\d,]+(?:\.\d{1,2})?\s*k?)?"
+    r"(?:\s*(?:per|p/?a|pa|annum|hour|year|weekly|week)[^.;<]*)?",
+    re.I,
+)
+_SALARY_VALUE_RE = re.compile(
+    r"(?P<dollar>\$?)\s*(?P<value>\d{2,3}(?:,\d{3})+(?:\.\d{1,2})?|\d{2,3}\.\d{1,2}|\d{2,3})\s*(?P<k>k)?\b",
+    re.I,
+)
+_HOURLY_PERIOD_RE = re.compile(r"\b(hour|hourly|p/h|per hour)\b")
+_WEEKLY_PERIOD_RE = re.compile(r"\b(week|weekly|per week)\b")
+_FORTNIGHTLY_PERIOD_RE = re.compile(r"\b(fortnight|fortnightly)\b")
+_ANNUAL_PERIOD_RE = re.compile(r"\b(year|annual|annum|pa|p/a|per annum)\b")
+_APPLICATION_DEADLINE_RE = re.compile(
+    r"\bApplications?\b.{0,80}?\bby\s+(?:(?P<time>\d{1,2}(?::\d{2})?\s*(?:am|pm))\s*)?"
+    r"(?:on\s*)?(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s*)?"
+    r"(?P<date>\d{1,2}\s+[A-Z][a-z]+\s+\d{4}|\d{1,2}(?:/|-)\d{1,2}(?:/|-)\d{4})",
+    re.I,
+)
+_LABELED_REFERENCE_RE = re.compile(
+    r"\b(?:reference(?:\s+number)?|job\s*(?:no|number|ref)|ref(?:erence)?)\b\s*:?\s*(?P<ref>[A-Z]{1,8}[-/A-Z0-9]{1,24})\b",
+    re.I,
+)
+# Every word that can open a posted/closing date, application deadline or
+# reference label, so those patterns only need trying where one starts.
+_EVIDENCE_LABEL_START_RE = re.compile(r"\b(?=posted|advertised|date|clos|application|job|ref)", re.I)
+_COUNCIL_NEEDLE_NOISE_RE = re.compile(r"\b(city|shire|rural|borough|council|city council|shire council)\b")
+_AUD_TOKEN_RE = re.compile(r"\bAUD\b", re.I)
+_NUMBER_TOKEN_RE = re.compile(r"[-+]?\d+(?:\.\d+)?\s*k?\b", re.I)
+_TIMEZONE_NAME_RE = re.compile(r"\b(AUS Eastern Standard Time|AEST|AEDT)\b", re.I)
+_ORDINAL_SUFFIX_RE = re.compile(r"(\d)(st|nd|rd|th)\b", re.I)
+_WEEKDAY_PREFIX_RE = re.compile(r"\b(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+", re.I)
+_JOB_DATETIME_FORMATS = tuple(
+    (fmt, "%H" in fmt or "%I" in fmt)
+    for fmt in (
+        "%d/%m/%Y %I:%M %p",
+        "%d/%m/%Y %H:%M",
+        "%d/%m/%Y",
+        "%d %B %Y %I:%M %p",
+        "%d %B %Y %H:%M",
+        "%d %B %Y",
+        "%d %b %Y",
+        "%B %d %Y %I:%M %p",
+        "%B %d %Y %H:%M",
+        "%B %d %Y",
+        "%b %d %Y",
+        "%Y-%m-%d",
+    )
+)
+# Each failed strptime raises, so only try the formats whose leading shape
+# (slash date, month name first, ISO, day then month name) fits the text.
+_SLASH_DATETIME_FORMATS = tuple(item for item in _JOB_DATETIME_FORMATS if "/" in item[0])
+_MONTH_FIRST_DATETIME_FORMATS = tuple(item for item in _JOB_DATETIME_FORMATS if item[0].startswith(("%B", "%b")))
+_ISO_DATETIME_FORMATS = tuple(item for item in _JOB_DATETIME_FORMATS if item[0].startswith("%Y"))
+_DAY_FIRST_DATETIME_FORMATS = tuple(item for item in _JOB_DATETIME_FORMATS if item[0].startswith("%d "))
+_TIME_TEXT_RE = re.compile(r"(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>am|pm)", re.I)
+# Date-only values ("5 May 2026", "05/05/2026", "2026-05-05") dominate, so
+# build those directly and leave strptime for the shapes that carry a time.
+_DAY_MONTH_NAME_YEAR_RE = re.compile(r"(\d{1,2}) ([A-Za-z]+) (\d{4})")
+_DAY_SLASH_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+# The date extractors accept "14-05-2026" as well as "14/05/2026"; rewrite the
+# dashed day-first form once so the slash fast path and formats cover it.
+_DAY_DASH_DATE_PREFIX_RE = re.compile(r"^(\d{1,2})-(\d{1,2})-(\d{4})\b")
+# Every accepted shape carries a day or year number; "Ongoing", "N/A" and
+# "Applications welcome" closing text is rejected before any rewriting.
+_DATE_DIGIT_RE = re.compile(r"\d")
+_MONTH_NUMBERS = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("january", "jan"),
+            ("february", "feb"),
+            ("march", "mar"),
+            ("april", "apr"),
+            ("may",),
+            ("june", "jun"),
+            ("july", "jul"),
+            ("august", "aug"),
+            ("september", "sep"),
+            ("october", "oct"),
+            ("november", "nov"),
+            ("december", "dec"),
+        ),
+        start=1,
+    )
+    for name in names
+}
 
-class _TextExtractor(HTMLParser):
+
+class HtmlTextExtractor(HTMLParser):
     def __init__(self) -> None:
         super().__init__()
         self.parts: list[str] = []
@@ -73,58 +170,90 @@ def normalize_council_job_record(record: dict[str, Any]) -> dict[str, Any]:
         "linked_document",
     )
 
-    evidence_text = normalize_whitespace(" ".join(str(value or "") for value in (
+    # Keyed on the stripped text so a description repeated verbatim in the
+    # detail page is only scanned once.
+    evidence_parts = dict.fromkeys(text for value in (
         record.get("job_title"),
         record.get("classification_band"),
         record.get("salary_text"),
         record.get("work_type"),
-        record.get("description_text"),
         description_text,
         detail_text,
         linked_document_text,
-        html_to_text(description_html) if description_html and not description_text else "",
-    )))
-    detail_classification_band = extract_classification_band(detail_text)
-    document_classification_band = extract_classification_band(linked_document_text)
-    detail_classification_band_raw = _extract_classification_band_raw(detail_text)
-    document_classification_band_raw = _extract_classification_band_raw(linked_document_text)
+    ) if (text := str(value or "").strip()))
+    evidence_text = normalize_whitespace(" ".join(evidence_parts))
+    # Records are normalised again after each enrichment step, so the text
+    # extractors below only scan when the field is still missing; a record
+    # that already carries its band, dates and reference skips them all.
+    detail_classification_band_raw = document_classification_band_raw = None
+    detail_classification_band = document_classification_band = None
+    if not record.get("classification_band"):
+        detail_classification_band_raw = _extract_classification_band_raw(detail_text)
+        document_classification_band_raw = _extract_classification_band_raw(linked_document_text)
+        detail_classification_band = _classification_band_from_raw(detail_classification_band_raw)
+        document_classification_band = _classification_band_from_raw(document_classification_band_raw)
     classification_band_raw = first_present(
         record.get("classification_band_raw"),
         record.get("classification_band"),
         document_classification_band_raw,
         detail_classification_band_raw,
-        _extract_classification_band_raw(evidence_text),
-    )
-    detail_salary_text = extract_salary_text(detail_text)
-    document_salary_text = extract_salary_text(linked_document_text)
-
-    posted_at_text = first_present(
-        record.get("posted_at_text"),
-        record.get("posted_date_text"),
-        _extract_labeled_date(evidence_text, ("posted", "advertised", "date posted")),
     )
+    # The whole-evidence band scan is only a fallback; when it finds nothing
+    # the standard-band pattern below cannot match that text either.
+    evidence_band_scanned = classification_band_raw in (None, "")
+    if evidence_band_scanned:
+        classification_band_raw = _extract_classification_band_raw(evidence_text)
+    posted_at_text = first_present(record.get("posted_at_text"), record.get("posted_date_text"))
     closing_at_text = first_present(
         record.get("closing_at_text"),
         record.get("closing_date_text"),
         record.get("closing_date"),
-        _extract_labeled_date(evidence_text, ("closing date", "closing", "applications close", "closes")),
-        _extract_application_deadline(evidence_text),
-    )
-    job_number = first_present(
-        record.get("job_number"),
-        _extract_labeled_reference(evidence_text),
     )
+    job_number = first_present(record.get("job_number"))
+    # The posted, closing, deadline and reference patterns all start at a
+    # label word, so find every label start in one pass and only try the
+    # patterns there instead of searching the whole evidence four times.
+    label_starts = None
+    if posted_at_text is None or closing_at_text is None or job_number is None:
+        label_starts = _evidence_label_starts(evidence_text)
+    if posted_at_text is None:
+        posted_at_text = first_present(
+            _extract_labeled_date(evidence_text, ("posted", "advertised", "date posted"), starts=label_starts),
+        )
+    if closing_at_text is None:
+        closing_at_text = first_present(
+            _extract_labeled_date(
+                evidence_text,
+                ("closing date", "closing", "applications close", "closes"),
+                starts=label_starts,
+            ),
+        )
+    if closing_at_text is None:
+        closing_at_text = first_present(_extract_application_deadline(evidence_text, starts=label_starts))
+    if job_number is None:
+        job_number = first_present(_extract_labeled_reference(evidence_text, starts=label_starts))
     posted_at = record.get("posted_at") or parse_job_datetime(posted_at_text, end_of_day=False)
     closing_at = record.get("closing_at") or parse_job_datetime(closing_at_text, end_of_day=True)
 
     classification_band = extract_classification_band(str(classification_band_raw or ""))
-    standard_band_number = extract_standard_band_number(classification_band or evidence_text)
-    salary_text = first_present(
-        record.get("salary_text"),
-        document_salary_text,
-        detail_salary_text,
-        extract_salary_text(evidence_text),
-    )
+    if classification_band:
+        standard_band_number = extract_standard_band_number(classification_band)
+    elif evidence_band_scanned:
+        standard_band_number = None
+    else:
+        standard_band_number = extract_standard_band_number(evidence_text)
+    # Salary sources are tried in priority order and each text is only
+    # scanned once an earlier source has come up empty.
+    document_salary_text = detail_salary_text = None
+    salary_text = first_present(record.get("salary_text"))
+    if salary_text is None:
+        document_salary_text = extract_salary_text(linked_document_text)
+        salary_text = first_present(document_salary_text)
+    if salary_text is None:
+        detail_salary_text = extract_salary_text(detail_text)
+        salary_text = first_present(detail_salary_text)
+    if salary_text is None:
+        salary_text = first_present(extract_salary_text(evidence_text))
     salary = extract_salary_range(salary_text) if salary_text else {}
     scope = classify_standard_band_scope(
         title=str(record.get("job_title") or ""),
@@ -361,7 +490,7 @@ def classify_standard_band_scope(
 ) -> dict[str, str]:
     haystack = normalize_whitespace(" ".join([title, work_type, evidence_text])).lower()
     role_scope_text = normalize_whitespace(" ".join([title, work_type])).lower()
-    if re.search(r"\b(volunteer|voluntary|work experience|student placement|unpaid)\b", role_scope_text):
+    if _UNPAID_ROLE_RE.search(role_scope_text):
         return {
             "band_scope": "non_standard_or_unpaid",
             "governance_status": "auto_excluded",
@@ -373,7 +502,7 @@ def classify_standard_band_scope(
             "governance_status": "auto_included",
             "governance_notes": f"Included because source text references Band {standard_band_number}.",
         }
-    if re.search(r"\bband\s*(?:9|10|11|12)\b", haystack) or re.search(r"\b(chief executive officer|chief executive|ceo|senior officer)\b", role_scope_text):
+    if _SENIOR_BAND_RE.search(haystack) or _SENIOR_ROLE_RE.search(role_scope_text):
         return {
             "band_scope": "non_standard_or_unpaid",
             "governance_status": "auto_excluded",
@@ -387,47 +516,38 @@ def classify_standard_band_scope(
 
 
 def extract_classification_band(text: str) -> str | None:
-    match = re.search(r"\bBand\s*(?P<band>[1-9](?:[A-Z])?)\b", text or "", re.I)
-    if not match:
-        return None
-    number_match = re.search(r"[1-9]", match.group("band") or "")
+    return _classification_band_from_raw(_extract_classification_band_raw(text))
+
+
+def _classification_band_from_raw(band_raw: str | None) -> str | None:
+    number_match = _BAND_DIGIT_RE.search(band_raw or "")
     if not number_match:
         return None
     return f"Band {number_match.group(0)}"
 
 
 def _extract_classification_band_raw(text: str) -> str | None:
-    match = re.search(r"\bBand\s*(?P<band>[1-9](?:[A-Z])?)\b", text or "", re.I)
+    match = _CLASSIFICATION_BAND_RE.search(text or "")
     if not match:
         return None
     return f"Band {match.group('band').upper()}"
 
 
 def extract_standard_band_number(text: str | None) -> int | None:
-    match = re.search(r"\bBand\s*(?P<band>[1-9])(?:[A-Z])?\b", text or "", re.I)
+    match = _STANDARD_BAND_RE.search(text or "")
     if not match:
         return None
     return int(match.group("band"))
 
 
 def extract_salary_text(text: str) -> str | None:
-    match = re.search(
-        r"(?P<salary>(?:Hourly Rate\s+)?AUD\s*)?\$[\d,]+(?:\.\d{1,2})?\s*k?"
-        r"(?:\s*(?:-|to|\u2013|\u2014)\s*\$?[\d,]+(?:\.\d{1,2})?\s*k?)?"
-        r"(?:\s*(?:per|p/?a|pa|annum|hour|year|weekly|week)[^.;<]*)?",
-        text or "",
-        re.I,
-    )
+    match = _SALARY_TEXT_RE.search(text or "")
     return normalize_whitespace(match.group(0)) if match else None
 
 
 def extract_salary_range(text: str) -> dict[str, Any]:
     values: list[float] = []
-    for match in re.finditer(
-        r"(?P<dollar>\$?)\s*(?P<value>\d{2,3}(?:,\d{3})+(?:\.\d{1,2})?|\d{2,3}\.\d{1,2}|\d{2,3})\s*(?P<k>k)?\b",
-        text or "",
-        re.I,
-    ):
+    for match in _SALARY_VALUE_RE.finditer(text or ""):
         if not match.group("dollar") and not match.group("k"):
             continue
         value = float(match.group("value").replace(",", ""))
@@ -438,9 +558,9 @@ def extract_salary_range(text: str) -> dict[str, Any]:
         return {}
     period = "year"
     lowered = (text or "").lower()
-    if re.search(r"\b(hour|hourly|per hour|p/h)\b", lowered):
+    if _HOURLY_PERIOD_RE.search(lowered):
         period = "hour"
-    elif re.search(r"\b(week|weekly|per week)\b", lowered):
+    elif _WEEKLY_PERIOD_RE.search(lowered):
         period = "week"
     salary_min = min(values)
     salary_max = max(values)
@@ -471,82 +591,117 @@ def _normalize_salary_period(period: Any) -> str:
     text = normalize_whitespace(str(period or "")).lower()
     if not text:
         return ""
-    if re.search(r"\b(hour|hourly|p/h|per hour)\b", text):
+    if _HOURLY_PERIOD_RE.search(text):
         return "hour"
-    if re.search(r"\b(year|annual|annum|pa|p/a|per annum)\b", text):
+    if _ANNUAL_PERIOD_RE.search(text):
         return "year"
-    if re.search(r"\b(fortnight|fortnightly)\b", text):
+    if _FORTNIGHTLY_PERIOD_RE.search(text):
         return "fortnight"
-    if re.search(r"\b(week|weekly|per week)\b", text):
+    if _WEEKLY_PERIOD_RE.search(text):
         return "week"
     return text
 
 
 def parse_job_datetime(value: Any, *, end_of_day: bool) -> str | None:
-    text = normalize_whitespace(str(value or ""))
-    if not text:
+    return _parse_job_datetime_text(normalize_whitespace(str(value or "")), end_of_day)
+
+
+@lru_cache(maxsize=2048)
+def _parse_job_datetime_text(text: str, end_of_day: bool) -> str | None:
+    # Closing and posted dates repeat heavily across a council's listings.
+    if not text or not _DATE_DIGIT_RE.search(text):
         return None
-    text = re.sub(r"\b(AUS Eastern Standard Time|AEST|AEDT)\b", "", text, flags=re.I).strip()
-    text = re.sub(r"(\d)(st|nd|rd|th)\b", r"\1", text, flags=re.I)
-    text = re.sub(r"\b(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+", "", text, flags=re.I)
-    formats = (
-        "%d/%m/%Y %I:%M %p",
-        "%d/%m/%Y %H:%M",
-        "%d/%m/%Y",
-        "%d %B %Y %I:%M %p",
-        "%d %B %Y %H:%M",
-        "%d %B %Y",
-        "%d %b %Y",
-        "%B %d %Y %I:%M %p",
-        "%B %d %Y %H:%M",
-        "%B %d %Y",
-        "%b %d %Y",
-        "%Y-%m-%d",
-    )
-    for fmt in formats:
+    text = _TIMEZONE_NAME_RE.sub("", text).strip()
+    text = _ORDINAL_SUFFIX_RE.sub(r"\1", text)
+    text = _WEEKDAY_PREFIX_RE.sub("", text)
+    text = _DAY_DASH_DATE_PREFIX_RE.sub(r"\1/\2/\3", text)
+    plain_date = _plain_job_date(text)
+    if plain_date is not None:
+        parsed = datetime.combine(plain_date, time(23, 59) if end_of_day else time(0, 0))
+        return parsed.replace(tzinfo=VICTORIA_TZ).isoformat()
+    for fmt, has_time in _job_datetime_formats_for(text):
         try:
             parsed = datetime.strptime(text, fmt)
-            if "%H" not in fmt and "%I" not in fmt:
-                parsed = datetime.combine(parsed.date(), time(23, 59) if end_of_day else time(0, 0))
-            return parsed.replace(tzinfo=VICTORIA_TZ).isoformat()
         except ValueError:
             continue
+        if not has_time:
+            parsed = datetime.combine(parsed.date(), time(23, 59) if end_of_day else time(0, 0))
+        return parsed.replace(tzinfo=VICTORIA_TZ).isoformat()
     return None
 
 
-def _extract_labeled_date(text: str, labels: tuple[str, ...]) -> str | None:
-    label_pattern = "|".join(re.escape(label) for label in labels)
-    match = re.search(
-        rf"\b(?:{label_pattern})(?:ing)?\b\s*(?:on)?\s*:?\s*(?P<date>\d{{1,2}}(?:/|-)\d{{1,2}}(?:/|-)\d{{4}}|\d{{1,2}}\s+[A-Z][a-z]+\s+\d{{4}}|[A-Z][a-z]+\s+\d{{1,2}}\s+\d{{4}})(?:,?\s*(?P<time>\d{{1,2}}(?::\d{{2}})?\s*(?:am|pm)))?",
-        text or "",
-        re.I,
-    )
+def _plain_job_date(text: str) -> date | None:
+    if match := _DAY_MONTH_NAME_YEAR_RE.fullmatch(text):
+        day, month, year = int(match.group(1)), _MONTH_NUMBERS.get(match.group(2).lower()), int(match.group(3))
+    elif match := _DAY_SLASH_DATE_RE.fullmatch(text):
+        day, month, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    elif match := _ISO_DATE_RE.fullmatch(text):
+        year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    else:
+        return None
+    if month is None:
+        return None
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _job_datetime_formats_for(text: str) -> tuple[tuple[str, bool], ...]:
+    if "/" in text:
+        return _SLASH_DATETIME_FORMATS
+    if text[:1].isalpha():
+        return _MONTH_FIRST_DATETIME_FORMATS
+    if text[4:5] == "-":
+        return _ISO_DATETIME_FORMATS
+    return _DAY_FIRST_DATETIME_FORMATS
+
+
+def _evidence_label_starts(text: str) -> list[int]:
+    return [match.start() for match in _EVIDENCE_LABEL_START_RE.finditer(text or "")]
+
+
+def _search_from_label_starts(
+    pattern: re.Pattern[str],
+    text: str,
+    starts: list[int] | None,
+) -> re.Match[str] | None:
+    if starts is None:
+        return pattern.search(text)
+    for start in starts:
+        match = pattern.match(text, start)
+        if match:
+            return match
+    return None
+
+
+def _extract_labeled_date(text: str, labels: tuple[str, ...], *, starts: list[int] | None = None) -> str | None:
+    match = _search_from_label_starts(_labeled_date_pattern(labels), text or "", starts)
     if not match:
         return None
     time_text = _normalize_time_text(match.groupdict().get("time"))
     return normalize_whitespace(f"{match.group('date')} {time_text or ''}")
 
 
-def _extract_application_deadline(text: str) -> str | None:
-    match = re.search(
-        r"\bApplications?\b.{0,80}?\bby\s+(?:(?P<time>\d{1,2}(?::\d{2})?\s*(?:am|pm))\s*)?"
-        r"(?:on\s*)?(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s*)?"
-        r"(?P<date>\d{1,2}\s+[A-Z][a-z]+\s+\d{4}|\d{1,2}(?:/|-)\d{1,2}(?:/|-)\d{4})",
-        text or "",
+@lru_cache(maxsize=16)
+def _labeled_date_pattern(labels: tuple[str, ...]) -> re.Pattern[str]:
+    label_pattern = "|".join(re.escape(label) for label in labels)
+    return re.compile(
+        rf"\b(?:{label_pattern})(?:ing)?\b\s*(?:on)?\s*:?\s*(?P<date>\d{{1,2}}(?:/|-)\d{{1,2}}(?:/|-)\d{{4}}|\d{{1,2}}\s+[A-Z][a-z]+\s+\d{{4}}|[A-Z][a-z]+\s+\d{{1,2}}\s+\d{{4}})(?:,?\s*(?P<time>\d{{1,2}}(?::\d{{2}})?\s*(?:am|pm)))?",
         re.I,
     )
+
+
+def _extract_application_deadline(text: str, *, starts: list[int] | None = None) -> str | None:
+    match = _search_from_label_starts(_APPLICATION_DEADLINE_RE, text or "", starts)
     if not match:
         return None
     time_text = _normalize_time_text(match.groupdict().get("time"))
     return normalize_whitespace(f"{match.group('date')} {time_text or ''}")
 
 
-def _extract_labeled_reference(text: str) -> str | None:
-    match = re.search(
-        r"\b(?:reference(?:\s+number)?|job\s*(?:no|number|ref)|ref(?:erence)?)\b\s*:?\s*(?P<ref>[A-Z]{1,8}[-/A-Z0-9]{1,24})\b",
-        text or "",
-        re.I,
-    )
+def _extract_labeled_reference(text: str, *, starts: list[int] | None = None) -> str | None:
+    match = _search_from_label_starts(_LABELED_REFERENCE_RE, text or "", starts)
     if not match:
         return None
     return match.group("ref").upper()
@@ -556,14 +711,14 @@ def _normalize_time_text(value: str | None) -> str | None:
     text = normalize_whitespace(value or "")
     if not text:
         return None
-    match = re.fullmatch(r"(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>am|pm)", text, re.I)
+    match = _TIME_TEXT_RE.fullmatch(text)
     if not match:
         return text
     return f"{match.group('hour')}:{match.group('minute') or '00'} {match.group('ampm').upper()}"
 
 
 def html_to_text(html: str) -> str:
-    parser = _TextExtractor()
+    parser = HtmlTextExtractor()
     parser.feed(html or "")
     return parser.text()
 
@@ -611,9 +766,10 @@ def _canonical_reference_date(
     for source, value in candidates:
         parsed = _date_from_any(value)
         if parsed:
+            parsed_iso = parsed.isoformat()
             return {
-                "date": parsed.isoformat(),
-                "month": parsed.isoformat()[:7],
+                "date": parsed_iso,
+                "month": parsed_iso[:7],
                 "source": source,
             }
     return None
@@ -626,16 +782,24 @@ def _date_from_any(value: Any) -> date | None:
         return value.date()
     if isinstance(value, date):
         return value
-    text = normalize_whitespace(str(value))
+    return _date_from_text(normalize_whitespace(str(value)))
+
+
+@lru_cache(maxsize=4096)
+def _date_from_text(text: str) -> date | None:
+    # Reference dates are resolved for every job and again for its pay-row
+    # window; the same posted/fetched/closing strings recur across a run.
     if not text:
         return None
-    text = text.replace("Z", "+00:00")
+    # Stored timestamps are ISO-8601, whose leading ten characters are the
+    # calendar date, so read that slice before building a full datetime.
     try:
-        return datetime.fromisoformat(text).date()
+        return date.fromisoformat(text[:10])
     except ValueError:
         pass
+    text = text.replace("Z", "+00:00")
     try:
-        return date.fromisoformat(text[:10])
+        return datetime.fromisoformat(text).date()
     except ValueError:
         pass
     parsed = parse_job_datetime(text, end_of_day=False)
@@ -755,9 +919,10 @@ def _effective_council_pay_rows(job: dict[str, Any], pay_rows: list[dict[str, An
         job.get("closing_at"),
     ))
     if reference_date:
+        reference_day = reference_date.toordinal()
         eligible = [
             row for row in rows
-            if _pay_row_operates_on(row, reference_date)
+            if _pay_row_operates_on(row, reference_day)
         ]
         if not eligible:
             return []
@@ -767,12 +932,28 @@ def _effective_council_pay_rows(job: dict[str, Any], pay_rows: list[dict[str, An
     return [row for row in rows if str(row.get("effective_from") or "") == latest_effective]
 
 
-def _pay_row_operates_on(row: dict[str, Any], reference_date: date) -> bool:
-    effective_from = _date_from_any(row.get("effective_from"))
-    if effective_from is None or effective_from > reference_date:
+def _pay_row_operates_on(row: dict[str, Any], reference_day: int) -> bool:
+    effective_from = row.get("effective_from")
+    effective_to = first_present(row.get("to_date"), row.get("effective_to"), row.get("expires_at"))
+    window = _operative_day_window(
+        None if effective_from is None else str(effective_from),
+        None if effective_to is None else str(effective_to),
+    )
+    if window is None:
         return False
-    effective_to = _date_from_any(first_present(row.get("to_date"), row.get("effective_to"), row.get("expires_at")))
-    return effective_to is None or reference_date <= effective_to
+    first_day, last_day = window
+    return first_day <= reference_day and (last_day is None or reference_day <= last_day)
+
+
+@lru_cache(maxsize=4096)
+def _operative_day_window(effective_from: str | None, effective_to: str | None) -> tuple[int, int | None] | None:
+    # Pay rows repeat the same few effective dates; parse each pair once and
+    # compare day ordinals per job.
+    first_date = _date_from_any(effective_from)
+    if first_date is None:
+        return None
+    last_date = _date_from_any(effective_to)
+    return first_date.toordinal(), last_date.toordinal() if last_date else None
 
 
 def _enterprise_agreement_salary_from_rows(rows: list[dict[str, Any]]) -> dict[str, Any]:
@@ -836,7 +1017,7 @@ def _pay_row_matches_council(row: dict[str, Any], council_needle: str) -> bool:
         row.get("lga_short_name"),
     ]
     haystack = " ".join(normalize_whitespace(str(value or "")).lower() for value in candidates)
-    compact_needle = re.sub(r"\b(city|shire|rural|borough|council|city council|shire council)\b", "", council_needle).strip()
+    compact_needle = _COUNCIL_NEEDLE_NOISE_RE.sub("", council_needle).strip()
     return council_needle in haystack or (compact_needle and compact_needle in haystack)
 
 
@@ -851,8 +1032,8 @@ def _to_float(value: Any) -> float | None:
     if not text:
         return None
     text = text.replace("$", "").replace(",", "")
-    text = re.sub(r"\bAUD\b", "", text, flags=re.I).strip()
-    match = re.search(r"[-+]?\d+(?:\.\d+)?\s*k?\b", text, re.I)
+    text = _AUD_TOKEN_RE.sub("", text).strip()
+    match = _NUMBER_TOKEN_RE.search(text)
     if not match:
         return None
     try:
@@ -52,17 +52,17 @@ def _scenario_compact_result(result: Any) -> dict[str, Any]:
     return payload
 
 
-def _is_future_iso_date(value: str | None) -> bool:
+def _is_future_iso_date(value: str | None, *, today: date | None = None) -> bool:
     if not value:
         return False
     try:
-        return date.fromisoformat(value) > date.today()
+        return date.fromisoformat(value) > (today or date.today())
     except ValueError:
         return False
 
 
-def _future_trigger_date(period_effective_from: str | None) -> str:
-    review_date = date.today() + timedelta(days=30)
+def _future_trigger_date(period_effective_from: str | None, *, today: date | None = None) -> str:
+    review_date = (today or date.today()) + timedelta(days=30)
     if period_effective_from:
         try:
             effective_date = date.fromisoformat(period_effective_from)
@@ -73,7 +73,7 @@ def _future_trigger_date(period_effective_from: str | None) -> str:
     return review_date.isoformat()
 
 
-def _scenario_future_trigger(result: Any) -> dict[str, Any] | None:
+def _scenario_future_trigger(result: Any, *, today: date | None = None) -> dict[str, Any] | None:
     status = getattr(result, "status", "")
     sub_status = getattr(result, "sub_status", "")
     period_effective_from = getattr(result, "period_effective_from", "")
@@ -84,15 +84,15 @@ def _scenario_future_trigger(result: Any) -> dict[str, Any] | None:
         return {
             **_scenario_compact_result(result),
             "trigger_type": "pending_external_dependency",
-            "trigger_date": _future_trigger_date(period_effective_from),
+            "trigger_date": _future_trigger_date(period_effective_from, today=today),
             "external_deps": [asdict(dep) for dep in external_deps],
         }
 
-    if status == "awaiting_input" and _is_future_iso_date(period_effective_from):
+    if status == "awaiting_input" and _is_future_iso_date(period_effective_from, today=today):
         return {
             **_scenario_compact_result(result),
             "trigger_type": "future_external_input",
-            "trigger_date": _future_trigger_date(period_effective_from),
+            "trigger_date": _future_trigger_date(period_effective_from, today=today),
             "external_deps": [asdict(dep) for dep in external_deps],
         }
 
@@ -115,10 +115,13 @@ def _scenario_section_resolution(results: list[Any], run_at: str) -> tuple[str,
             or "rule did not cover any cells" in reason
         )
 
+    # Trigger dates are relative to the day of the run, not the moment each
+    # result is inspected; read the clock once for the whole section.
+    today = date.today()
     for result in results:
         status = getattr(result, "status", "")
         summary[status] = summary.get(status, 0) + 1
-        future_trigger = _scenario_future_trigger(result)
+        future_trigger = _scenario_future_trigger(result, today=today)
         if future_trigger:
             future_triggers.append(future_trigger)
             continue
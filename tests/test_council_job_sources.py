@@ -1,10 +1,17 @@
 import json
+import os
+import threading
+import time
+
+import pytest
+import requests
 
 from benchmarking_data_factory.reference.council_jobs import (
     canonicalize_job_url,
     council_job_source_registry_payload,
     endpoint_discovery_candidates,
 )
+from benchmarking_data_factory.workbench import job_intake
 from benchmarking_data_factory.workbench.job_intake import (
     accumulate_checked_jobs_from_payload,
     accumulate_checked_jobs_from_snapshot,
@@ -16,6 +23,7 @@ from benchmarking_data_factory.workbench.job_intake import (
     job_intake_secondary_preview,
     job_intake_scrape_preview,
     load_checked_job_accumulator,
+    save_checked_job_accumulator,
     load_job_intake_snapshot,
     save_job_intake_snapshot,
     _council_direct_council_page_sources,
@@ -30,6 +38,15 @@ from benchmarking_data_factory.workbench.job_schema import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_host_memos():
+    # fetch_listing_html remembers TLS, header and browser-fallback hosts for
+    # the whole process; clear them around every test so order cannot leak.
+    job_intake._reset_host_memos()
+    yield
+    job_intake._reset_host_memos()
+
+
 def test_council_job_source_registry_covers_all_victorian_councils():
     payload = council_job_source_registry_payload()
 
@@ -40,6 +57,17 @@ def test_council_job_source_registry_covers_all_victorian_councils():
     assert payload["summary"]["poll_tiers"] == {"A": 41, "B": 19, "C": 19}
 
 
+def test_council_job_source_registry_returns_an_independent_copy_each_call():
+    payload = council_job_source_registry_payload()
+    payload["rows"][0]["listing_url"] = "https://example.invalid/jobs"
+    payload["summary"]["councils"] = 0
+
+    fresh = council_job_source_registry_payload()
+
+    assert fresh["rows"][0]["listing_url"] != "https://example.invalid/jobs"
+    assert fresh["summary"]["councils"] == 79
+
+
 def test_council_job_source_registry_marks_verified_official_sources():
     rows = {row["short_name"]: row for row in council_job_source_registry_payload()["rows"]}
 
@@ -247,6 +275,47 @@ def test_extract_job_summaries_from_server_rendered_listing_links():
     assert jobs[0]["job_url"] == "https://jobs.yarracity.vic.gov.au/cw/en/job/496802/north-carlton-team-leader"
 
 
+def test_extract_job_summaries_matches_generic_job_paths_case_insensitively():
+    source = {
+        "short_name": "Moira",
+        "council_name": "Moira Shire Council",
+        "platform_family": "unknown_official",
+        "listing_url": "https://www.moira.vic.gov.au/careers",
+    }
+    html = """
+    <a href="/careers/vacancies/team-leader-parks">Team Leader Parks</a>
+    <a href="/Jobs/customer-service-officer">Customer Service Officer</a>
+    <a href="/Current-Vacancies/planning-officer">Planning Officer</a>
+    """
+
+    jobs = extract_job_summaries_from_listing(source, html)
+
+    assert [job["job_title"] for job in jobs] == [
+        "Team Leader Parks",
+        "Customer Service Officer",
+        "Planning Officer",
+    ]
+
+
+def test_extract_job_summaries_stops_at_source_max_jobs():
+    source = {
+        "short_name": "Yarra",
+        "council_name": "Yarra City Council",
+        "platform_family": "pageup",
+        "listing_url": "https://jobs.yarracity.vic.gov.au/cw/en/listing/",
+    }
+    html = """
+    <a href="/cw/en/job/496802/north-carlton-team-leader">North Carlton Team Leader</a>
+    <a href="/cw/en/job/496802/north-carlton-team-leader">North Carlton Team Leader</a>
+    <a href="/cw/en/job/496803/rates-officer">Rates Officer</a>
+    <a href="/cw/en/job/496804/planning-officer">Planning Officer</a>
+    """
+
+    jobs = extract_job_summaries_from_listing(source, html, max_jobs=2)
+
+    assert [job["source_job_id"] for job in jobs] == ["496802", "496803"]
+
+
 def test_extract_job_summaries_from_benalla_positions_vacant_cards():
     source = {
         "short_name": "Benalla",
@@ -433,6 +502,133 @@ def test_job_intake_scrape_preview_reports_jobs_and_source_statuses():
     assert payload["tier_explainer"][0]["tier"] == "A"
 
 
+def test_job_intake_scrape_preview_fetches_details_while_slower_listings_load():
+    fast_listing = "https://jobs.fast.vic.gov.au/jobs"
+    slow_listing = "https://careers.slow.vic.gov.au/jobs"
+    fast_detail = "https://jobs.fast.vic.gov.au/jobs/parks-officer"
+    registry = {
+        "rows": [
+            {
+                "short_name": short_name,
+                "council_name": f"{short_name} Shire Council",
+                "poll_tier": "A",
+                "platform_family": "native_council_custom",
+                "monitoring_status": "ready",
+                "listing_url": listing_url,
+            }
+            for short_name, listing_url in (("Fast", fast_listing), ("Slow", slow_listing))
+        ]
+    }
+    fast_detail_requested = threading.Event()
+    order = []
+
+    def fetcher(url):
+        if url == fast_listing:
+            return '<a href="/jobs/parks-officer">Parks Officer</a>', {"http_status": 200}
+        if url == slow_listing:
+            fast_detail_requested.wait(timeout=5)
+            order.append("slow_listing_done")
+            return "<p>No current vacancies</p>", {"http_status": 200}
+        order.append(url)
+        fast_detail_requested.set()
+        return "<p>Band 5 $80,000 per annum</p>", {"http_status": 200}
+
+    payload = job_intake_scrape_preview(registry_payload=registry, fetcher=fetcher, max_workers=2)
+
+    assert order == [fast_detail, "slow_listing_done"]
+    assert payload["rows"][0]["classification_band"] == "Band 5"
+
+
+def test_job_intake_scrape_preview_cancels_prefetches_the_detail_phase_does_not_use(monkeypatch):
+    listing = "https://jobs.fast.vic.gov.au/jobs"
+    parks_detail = "https://jobs.fast.vic.gov.au/jobs/parks-officer"
+    registry = {
+        "rows": [
+            {
+                "short_name": "Fast",
+                "council_name": "Fast Shire Council",
+                "poll_tier": "A",
+                "platform_family": "native_council_custom",
+                "monitoring_status": "ready",
+                "listing_url": listing,
+            }
+        ]
+    }
+    # The planner row needs a detail page as listed, but normalisation reads
+    # its band and salary from the title, so the detail phase never uses it.
+    listing_html = (
+        '<a href="/jobs/parks-officer">Parks Officer</a>'
+        '<a href="/jobs/planner-band-5">Planner Band 5 $90,000 per annum</a>'
+    )
+    unused_dropped = threading.Event()
+    original_retain = job_intake._DetailPrefetch.retain
+
+    def retain(self, urls):
+        original_retain(self, urls)
+        unused_dropped.set()
+
+    detail_fetches = []
+
+    def fetcher(url):
+        if url == listing:
+            return listing_html, {"http_status": 200}
+        # Hold the single prefetch worker so the planner prefetch is still
+        # queued when the detail candidates are known.
+        unused_dropped.wait(timeout=5)
+        detail_fetches.append(url)
+        return "<p>Band 4 $70,000 per annum</p>", {"http_status": 200}
+
+    monkeypatch.setattr(job_intake._DetailPrefetch, "retain", retain)
+
+    payload = job_intake.job_intake_scrape_preview(registry_payload=registry, fetcher=fetcher, max_workers=1)
+
+    assert detail_fetches == [parks_detail]
+    assert payload["summary"]["jobs"] == 2
+
+
+def test_job_intake_scrape_preview_reads_pulse_json_feed_without_listing_html():
+    registry = {
+        "rows": [
+            {
+                "short_name": "Ballarat",
+                "council_name": "Ballarat City Council",
+                "council_grouping": "regional_city",
+                "poll_tier": "A",
+                "platform_family": "pulse",
+                "monitoring_status": "ready",
+                "listing_url": "https://ballarat.pulsesoftware.com/Pulse/jobs",
+            },
+        ]
+    }
+    fetched_urls = []
+
+    def fetcher(url):
+        fetched_urls.append(url)
+        assert url.startswith("https://ballarat.pulsesoftware.com/WebServices/RCM/Jobs/Jobs?")
+        return (
+            json.dumps({
+                "Jobs": [
+                    {
+                        "LinkId": "AbC123",
+                        "JobInfo": {
+                            "Title": "Rates Officer",
+                            "ClosingDate": "30 May 2026",
+                            "Compensation": "Band 4 $78,000 - $84,000",
+                        },
+                    }
+                ]
+            }),
+            {"http_status": 200, "final_url": url, "bytes": 200},
+        )
+
+    payload = job_intake_scrape_preview(registry_payload=registry, fetcher=fetcher, enrich_details=False)
+
+    assert len(fetched_urls) == 1
+    assert payload["rows"][0]["job_title"] == "Rates Officer"
+    assert payload["rows"][0]["job_url"] == "https://ballarat.pulsesoftware.com/Pulse/job/AbC123/Rates-Officer"
+    assert payload["source_results"][0]["listing_fetch_mode"] == "pulse_json_api"
+
+
 def test_job_intake_scrape_preview_follows_embedded_applynow_iframe():
     registry = {
         "rows": [
@@ -469,6 +665,113 @@ def test_job_intake_scrape_preview_follows_embedded_applynow_iframe():
     assert payload["source_results"][0]["embedded_sources_attempted"] == 1
 
 
+def test_job_intake_scrape_preview_scrapes_each_embedded_board_once():
+    registry = {
+        "rows": [
+            {
+                "short_name": "Greater Bendigo",
+                "council_name": "Greater Bendigo City Council",
+                "poll_tier": "A",
+                "platform_family": "unknown_official",
+                "monitoring_status": "ready",
+                "listing_url": "https://www.bendigo.vic.gov.au/about-us/working-city",
+            },
+        ]
+    }
+    applynow_url = "https://city-of-bendigo.applynow.net.au/"
+    pageup_url = "https://careers.pageuppeople.com/123/cw/en/listing"
+    fetched = []
+
+    def fetcher(url):
+        fetched.append(url)
+        # Each board embeds the other, plus the council page embeds both.
+        if url == "https://www.bendigo.vic.gov.au/about-us/working-city":
+            html = f'<iframe src="{applynow_url}"></iframe><a href="{pageup_url}">Jobs</a>'
+        elif url == applynow_url:
+            html = f'<a href="{pageup_url}">More jobs</a>'
+        elif url == pageup_url:
+            html = f'<a href="{applynow_url}">More jobs</a>'
+        else:
+            raise AssertionError(f"unexpected url {url}")
+        return html, {"http_status": 200, "bytes": len(html)}
+
+    payload = job_intake_scrape_preview(registry_payload=registry, fetcher=fetcher, enrich_details=False)
+
+    assert sorted(fetched) == sorted([
+        "https://www.bendigo.vic.gov.au/about-us/working-city",
+        applynow_url,
+        pageup_url,
+    ])
+    assert payload["source_results"][0]["embedded_sources_attempted"] == 2
+
+
+def test_scrape_source_claims_shared_nested_board_once_across_sibling_boards():
+    source = {
+        "short_name": "Greater Bendigo",
+        "council_name": "Greater Bendigo City Council",
+        "platform_family": "unknown_official",
+        "listing_url": "https://www.bendigo.vic.gov.au/about-us/working-city",
+    }
+    applynow_url = "https://city-of-bendigo.applynow.net.au/"
+    pageup_url = "https://careers.pageuppeople.com/123/cw/en/listing"
+    shared_url = "https://bendigo.bigredsky.com/page.php?pageID=160"
+    both_siblings_fetching = threading.Barrier(2, timeout=5)
+    both_siblings_checking = threading.Barrier(2)
+    fetched = []
+
+    class RacyVisitedUrls(set):
+        def __contains__(self, url):
+            # Hold each sibling's answer until the other has checked too. Under
+            # a claim lock the second never gets to check and the wait times out.
+            seen = super().__contains__(url)
+            if url == shared_url:
+                try:
+                    both_siblings_checking.wait(timeout=0.5)
+                except threading.BrokenBarrierError:
+                    pass
+            return seen
+
+    def fetcher(url):
+        fetched.append(url)
+        if url == source["listing_url"]:
+            html = f'<iframe src="{applynow_url}"></iframe><a href="{pageup_url}">Jobs</a>'
+        elif url in {applynow_url, pageup_url}:
+            both_siblings_fetching.wait()
+            html = f'<a href="{shared_url}">More jobs</a>'
+        elif url == shared_url:
+            html = "<p>No current vacancies</p>"
+        else:
+            raise AssertionError(f"unexpected url {url}")
+        return html, {"http_status": 200, "bytes": len(html)}
+
+    job_intake._scrape_source(source, fetcher, RacyVisitedUrls({source["listing_url"]}))
+
+    assert fetched.count(shared_url) == 1
+
+
+def test_scrape_source_skips_embedded_board_scan_when_listing_has_jobs(monkeypatch):
+    source = {
+        "short_name": "Greater Bendigo",
+        "council_name": "Greater Bendigo City Council",
+        "platform_family": "unknown_official",
+        "listing_url": "https://www.bendigo.vic.gov.au/careers",
+    }
+    html = (
+        '<a href="https://www.bendigo.vic.gov.au/careers/jobs/6040526-project-manager">Project Manager (Capital Works)</a>'
+        '<iframe src="https://city-of-bendigo.applynow.net.au"></iframe>'
+    )
+
+    def fail_scan(source, html):
+        raise AssertionError("embedded boards should not be scanned")
+
+    monkeypatch.setattr(job_intake, "_embedded_listing_sources", fail_scan)
+
+    result = job_intake._scrape_source(source, lambda url: (html, {"http_status": 200, "bytes": len(html)}))
+
+    assert [job["job_title"] for job in result["jobs"]] == ["Project Manager (Capital Works)"]
+    assert result["source_result"]["embedded_sources_attempted"] == 0
+
+
 def test_generated_applynow_probe_rejects_generic_employment_office_board():
     listing_url = "https://ballaratcity-external.applynow.net.au/"
     registry = {
@@ -732,6 +1035,416 @@ def test_job_intake_snapshot_persists_preview_payload(tmp_path):
     assert loaded["source_payload_set_id"] == "job_intake_scrape_preview"
     assert loaded["summary"]["jobs"] == 1
     assert loaded["scope"]["refresh_policy"] == "manual_button_only"
+    assert snapshot_path.read_text(encoding="utf-8") == json.dumps(saved, sort_keys=True, separators=(",", ":"))
+
+
+def test_job_intake_snapshot_round_trips_non_ascii_rows_with_sorted_keys(tmp_path, monkeypatch):
+    snapshot_path = tmp_path / "job-intake-snapshot.json"
+    rows = [{"job_title": "Caf\u00e9 Coordinator \u2013 Band 5", "council_name": "Moira Shire", "salary_min": 1e16}]
+    payload = {"set_id": "job_intake_scrape_preview", "rows": rows, "source_results": [], "fetched_at": "2026-05-01"}
+
+    saved = save_job_intake_snapshot(payload, snapshot_path=snapshot_path)
+    loaded = load_job_intake_snapshot(snapshot_path=snapshot_path)
+    written_bytes = snapshot_path.read_bytes()
+    written = json.loads(written_bytes)
+    monkeypatch.setattr(job_intake, "orjson", None)
+    job_intake._write_json_atomically(snapshot_path, saved)
+
+    assert loaded["rows"] == rows
+    assert written == json.loads(json.dumps(saved))
+    assert list(written) == sorted(written)
+    assert list(written["rows"][0]) == sorted(rows[0])
+    # The saved bytes do not depend on whether orjson is installed.
+    assert snapshot_path.read_bytes() == written_bytes
+
+
+def test_intake_json_helpers_fall_back_to_stdlib_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_intake, "orjson", None)
+    entry = {"html": "<p>Caf\u00e9 Coordinator \u2013 Band 5</p>", "headers": {"etag": '"v1"'}, "stored_at": 1.5}
+    cache_path = tmp_path / "entry.json"
+    cache_path.write_bytes(job_intake._dump_json_bytes(entry))
+    snapshot_path = tmp_path / "job-intake-snapshot.json"
+    rows = [{"job_title": "Caf\u00e9 Coordinator", "salary_min": 1e-05}]
+    job_intake.save_job_intake_snapshot({"rows": rows}, snapshot_path=snapshot_path)
+
+    assert job_intake._read_json_file(cache_path) == entry
+    assert job_intake._parse_json_bytes(b'{"rows": [1, 2]}') == {"rows": [1, 2]}
+    assert job_intake.load_job_intake_snapshot(snapshot_path=snapshot_path)["rows"] == rows
+
+
+class _FakeListingResponse:
+    def __init__(
+        self,
+        status_code=200,
+        text="<a href='/careers/job-1'>Job 1</a>",
+        *,
+        content=None,
+        headers=None,
+        url="https://example.vic.gov.au/careers",
+    ):
+        self.status_code = status_code
+        self._content = text.encode("utf-8") if content is None else content
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.url = url
+        self.body_read = False
+        self.closed = False
+
+    @property
+    def content(self):
+        self.body_read = True
+        return self._content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeListingGet:
+    def __init__(self):
+        self.respond = lambda url, **kwargs: _FakeListingResponse()
+        self.calls = []
+        self.responses = []
+
+    def __call__(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        response = self.respond(url, **kwargs)
+        self.responses.append(response)
+        return response
+
+
+@pytest.fixture
+def fake_listing_get(monkeypatch, tmp_path):
+    # Stands in for the HTTP layer under fetch_listing_html and
+    # fetch_binary_content, with a throwaway cache; tests swap in their own
+    # respond(url, **kwargs).
+    fake_get = _FakeListingGet()
+    monkeypatch.setattr(job_intake, "JOB_INTAKE_HTTP_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(job_intake, "_requests_get", fake_get)
+    return fake_get
+
+
+def test_fetch_listing_html_revalidates_cached_listing_with_etag(monkeypatch, fake_listing_get):
+    def respond(url, **kwargs):
+        if kwargs["headers"].get("If-None-Match") == '"v1"':
+            return _FakeListingResponse(304, "")
+        return _FakeListingResponse(headers={"etag": '"v1"'})
+
+    fake_listing_get.respond = respond
+    url = "https://example.vic.gov.au/careers"
+
+    first_html, first_meta = job_intake.fetch_listing_html(url)
+    fresh_html, fresh_meta = job_intake.fetch_listing_html(url)
+    cache_path = job_intake._http_cache_path(url)
+    cached_text = cache_path.read_text(encoding="utf-8")
+    os.utime(cache_path, (0, 0))
+    monkeypatch.setattr(job_intake, "JOB_INTAKE_HTTP_CACHE_FRESH_SECONDS", 0)
+    revalidated_html, revalidated_meta = job_intake.fetch_listing_html(url)
+
+    assert first_meta["http_status"] == 200
+    assert "cache_status" not in first_meta
+    assert fresh_html == first_html
+    assert fresh_meta["cache_status"] == "fresh"
+    assert revalidated_html == first_html
+    assert revalidated_meta["cache_status"] == "revalidated"
+    assert fake_listing_get.responses[-1].closed is True
+    assert len(fake_listing_get.calls) == 2
+    assert fake_listing_get.calls[-1][1]["headers"]["If-None-Match"] == '"v1"'
+    assert cache_path.read_text(encoding="utf-8") == cached_text
+    assert cache_path.stat().st_mtime > 0
+
+
+def test_fetch_binary_content_skips_non_document_bodies(fake_listing_get):
+    fake_listing_get.respond = lambda url, **kwargs: _FakeListingResponse(
+        content=b"\x89PNG",
+        headers={"content-type": "image/png"},
+        url=url,
+    )
+
+    content, meta = job_intake.fetch_binary_content("https://example.vic.gov.au/files/banner.png")
+
+    assert content == b""
+    assert meta["skipped_reason"] == "non_document_content_type"
+    assert meta["bytes"] == 0
+    assert fake_listing_get.calls[0][1]["stream"] is True
+    assert fake_listing_get.responses[0].body_read is False
+    assert fake_listing_get.responses[0].closed is True
+
+
+def test_requests_get_backs_off_on_throttled_responses(monkeypatch):
+    responses = [
+        _FakeListingResponse(429, headers={"retry-after": "3"}),
+        _FakeListingResponse(503),
+        _FakeListingResponse(200),
+    ]
+    sent = []
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            sent.append((url, kwargs["timeout"]))
+            return responses[len(sent) - 1]
+
+    clock = [100.0]
+    slept = []
+
+    def fake_sleep(seconds):
+        slept.append(round(seconds, 2))
+        clock[0] += seconds
+
+    monkeypatch.setattr(job_intake, "_http_session", lambda: FakeSession())
+    monkeypatch.setattr(job_intake, "_HOST_RETRY_NOT_BEFORE", {})
+    monkeypatch.setattr(job_intake.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(job_intake.time, "sleep", fake_sleep)
+
+    response = job_intake._requests_get("https://jobs.example.vic.gov.au/detail/1", timeout=8)
+
+    assert response.status_code == 200
+    assert len(sent) == 3
+    assert sent[0][1] == (job_intake.HTTP_CONNECT_TIMEOUT_SECONDS, 8)
+    assert slept == [3.0, 2.0]
+    assert responses[0].closed and responses[1].closed
+
+
+def test_requests_get_returns_throttled_response_when_retry_after_exceeds_wait_cap(monkeypatch):
+    sent = []
+    slept = []
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            sent.append(url)
+            return _FakeListingResponse(429, headers={"retry-after": "120"})
+
+    monkeypatch.setattr(job_intake, "_http_session", lambda: FakeSession())
+    monkeypatch.setattr(job_intake, "_HOST_RETRY_NOT_BEFORE", {})
+    monkeypatch.setattr(job_intake.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(job_intake.time, "sleep", slept.append)
+
+    response = job_intake._requests_get("https://jobs.example.vic.gov.au/detail/1", timeout=8)
+
+    assert response.status_code == 429
+    assert sent == ["https://jobs.example.vic.gov.au/detail/1"]
+    assert slept == []
+    assert job_intake._HOST_RETRY_NOT_BEFORE["jobs.example.vic.gov.au"] == 100.0 + job_intake.HTTP_RETRY_MAX_WAIT_SECONDS
+
+
+def test_fetch_binary_content_revalidates_cached_documents(fake_listing_get):
+    def respond(url, **kwargs):
+        if kwargs["headers"].get("If-None-Match") == '"pd-v1"':
+            return _FakeListingResponse(304, "", headers={"content-type": "application/pdf"}, url=url)
+        return _FakeListingResponse(
+            content=b"%PDF-1.4 body",
+            headers={"content-type": "application/pdf", "etag": '"pd-v1"'},
+            url=url,
+        )
+
+    fake_listing_get.respond = respond
+    url = "https://example.vic.gov.au/files/pd.pdf"
+
+    first_content, first_meta = job_intake.fetch_binary_content(url)
+    fresh_content, fresh_meta = job_intake.fetch_binary_content(url)
+    entry_path, _body_path = job_intake._document_cache_paths(url)
+    os.utime(entry_path, (0, 0))
+    revalidated_content, revalidated_meta = job_intake.fetch_binary_content(url)
+
+    assert first_content == b"%PDF-1.4 body"
+    assert "cache_status" not in first_meta
+    assert fresh_content == first_content
+    assert fresh_meta["cache_status"] == "fresh"
+    assert revalidated_content == first_content
+    assert revalidated_meta["cache_status"] == "revalidated"
+    assert revalidated_meta["bytes"] == len(first_content)
+    assert len(fake_listing_get.calls) == 2
+    assert fake_listing_get.calls[-1][1]["headers"]["If-None-Match"] == '"pd-v1"'
+    assert entry_path.stat().st_mtime > 0
+
+
+def test_fetch_listing_html_refetches_over_damaged_cache_entries(fake_listing_get):
+    url = "https://example.vic.gov.au/careers"
+    cache_path = job_intake._http_cache_path(url)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    for damaged in (b'{"url": "caf\xe9"}', b"[1, 2]"):
+        cache_path.write_bytes(damaged)
+
+        html, meta = job_intake.fetch_listing_html(url)
+
+        assert "Job 1" in html
+        assert "cache_status" not in meta
+        assert job_intake._load_http_cache_entry(url)["text"] == html
+    assert len(fake_listing_get.calls) == 2
+
+
+def test_fetch_binary_content_refetches_over_damaged_cache_entries(fake_listing_get):
+    url = "https://example.vic.gov.au/files/pd.pdf"
+    entry_path, body_path = job_intake._document_cache_paths(url)
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+    body_path.write_bytes(b"%PDF-1.4 old")
+
+    for damaged in (b'{"url": "caf\xe9"}', b'"not an entry"'):
+        entry_path.write_bytes(damaged)
+
+        content, meta = job_intake.fetch_binary_content(url)
+
+        assert content == fake_listing_get.responses[-1].content
+        assert "cache_status" not in meta
+        assert job_intake._load_document_cache_entry(url)["content"] == content
+
+
+def test_http_cache_prune_drops_entries_untouched_past_max_age(monkeypatch, tmp_path):
+    monkeypatch.setattr(job_intake, "JOB_INTAKE_HTTP_CACHE_DIR", tmp_path)
+    expired = time.time() - job_intake.JOB_INTAKE_HTTP_CACHE_MAX_AGE_SECONDS - 60
+    old_page = job_intake._http_cache_path("https://example.vic.gov.au/careers/old")
+    recent_page = job_intake._http_cache_path("https://example.vic.gov.au/careers/recent")
+    old_entry, old_body = job_intake._document_cache_paths("https://example.vic.gov.au/files/old.pdf")
+    revalidated_entry, revalidated_body = job_intake._document_cache_paths("https://example.vic.gov.au/files/pd.pdf")
+    for path in (old_page, recent_page, old_entry, old_body, revalidated_entry, revalidated_body):
+        path.write_bytes(b"{}")
+    for path in (old_page, old_entry, old_body, revalidated_body):
+        os.utime(path, (expired, expired))
+
+    job_intake._prune_http_cache()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        path.name for path in (recent_page, revalidated_entry, revalidated_body)
+    )
+
+
+def test_fetch_listing_html_skips_job_links_that_serve_images(fake_listing_get):
+    fake_listing_get.respond = lambda url, **kwargs: _FakeListingResponse(
+        content=b"\xff\xd8\xff",
+        headers={"content-type": "image/jpeg"},
+        url=url,
+    )
+
+    html, meta = job_intake.fetch_listing_html("https://example.vic.gov.au/careers/job-1")
+
+    assert html == ""
+    assert meta["skipped_reason"] == "non_document_content_type"
+    assert meta["bytes"] == 0
+    assert fake_listing_get.calls[0][1]["stream"] is True
+    assert fake_listing_get.responses[0].body_read is False
+    assert fake_listing_get.responses[0].closed is True
+    assert not job_intake._http_cache_path("https://example.vic.gov.au/careers/job-1").exists()
+
+
+def test_fetch_listing_html_remembers_hosts_that_fail_tls_verification(fake_listing_get):
+    def respond(url, **kwargs):
+        if kwargs["verify"]:
+            raise requests.exceptions.SSLError("certificate verify failed")
+        return _FakeListingResponse()
+
+    fake_listing_get.respond = respond
+
+    with job_intake._host_memo_run():
+        _, first_meta = job_intake.fetch_listing_html("https://example.vic.gov.au/careers")
+        with job_intake._host_memo_run():
+            _, second_meta = job_intake.fetch_listing_html("https://example.vic.gov.au/careers/job-1")
+    with job_intake._host_memo_run():
+        _, next_run_meta = job_intake.fetch_listing_html("https://example.vic.gov.au/careers/job-2")
+
+    assert first_meta["ssl_verify"] is False
+    assert second_meta["ssl_verify"] is False
+    assert next_run_meta["ssl_verify"] is False
+    assert [kwargs["verify"] for _, kwargs in fake_listing_get.calls] == [True, False, False, True, False]
+
+
+def test_fetch_listing_html_remembers_hosts_that_need_browser_headers(fake_listing_get):
+    def respond(url, **kwargs):
+        if kwargs["headers"]["User-Agent"] == job_intake.JOB_INTAKE_USER_AGENT:
+            return _FakeListingResponse(403)
+        return _FakeListingResponse()
+
+    fake_listing_get.respond = respond
+
+    with job_intake._host_memo_run():
+        _, first_meta = job_intake.fetch_listing_html("https://example.vic.gov.au/careers")
+        _, second_meta = job_intake.fetch_listing_html("https://example.vic.gov.au/careers/job-1")
+    with job_intake._host_memo_run():
+        job_intake.fetch_listing_html("https://example.vic.gov.au/careers/job-2")
+
+    assert first_meta["user_agent_mode"] == "browser_compat"
+    assert second_meta["user_agent_mode"] == "browser_compat"
+    assert [kwargs["headers"]["User-Agent"] for _, kwargs in fake_listing_get.calls] == [
+        job_intake.JOB_INTAKE_USER_AGENT,
+        job_intake.BROWSER_COMPAT_HEADERS["User-Agent"],
+        job_intake.BROWSER_COMPAT_HEADERS["User-Agent"],
+        job_intake.JOB_INTAKE_USER_AGENT,
+        job_intake.BROWSER_COMPAT_HEADERS["User-Agent"],
+    ]
+
+
+def test_fetch_listing_html_skips_browser_fallback_after_it_fails_for_a_host(monkeypatch, fake_listing_get):
+    fallback_urls = []
+
+    def fake_fallback(url, **kwargs):
+        fallback_urls.append(url)
+        return None
+
+    fake_listing_get.respond = lambda url, **kwargs: _FakeListingResponse(403, "<title>Just a moment...</title>")
+    monkeypatch.setattr(job_intake, "_run_powershell_browser_fetch", fake_fallback)
+
+    runs = (
+        ("https://example.vic.gov.au/careers", "https://example.vic.gov.au/careers/job-1"),
+        ("https://example.vic.gov.au/careers/job-2",),
+    )
+    for urls in runs:
+        with job_intake._host_memo_run():
+            for url in urls:
+                try:
+                    job_intake.fetch_listing_html(url)
+                except requests.HTTPError:
+                    pass
+
+    assert fallback_urls == ["https://example.vic.gov.au/careers", "https://example.vic.gov.au/careers/job-2"]
+
+
+def test_fetch_listing_html_sends_later_pages_straight_to_browser_fallback(monkeypatch, fake_listing_get):
+    fallback_urls = []
+
+    def fake_fallback(url, **kwargs):
+        fallback_urls.append(url)
+        return "<a href='/careers/job-1'>Job 1</a>", {"http_status": 200, "final_url": url}
+
+    fake_listing_get.respond = lambda url, **kwargs: _FakeListingResponse(403, "<title>Just a moment...</title>")
+    monkeypatch.setattr(job_intake, "_run_powershell_browser_fetch", fake_fallback)
+
+    with job_intake._host_memo_run():
+        job_intake.fetch_listing_html("https://example.vic.gov.au/careers")
+        html, _ = job_intake.fetch_listing_html("https://example.vic.gov.au/careers/job-1")
+    with job_intake._host_memo_run():
+        job_intake.fetch_listing_html("https://example.vic.gov.au/careers/job-2")
+
+    assert "Job 1" in html
+    assert all(response.closed for response in fake_listing_get.responses)
+    assert [url for url, _ in fake_listing_get.calls] == [
+        "https://example.vic.gov.au/careers",
+        "https://example.vic.gov.au/careers",
+        "https://example.vic.gov.au/careers/job-2",
+        "https://example.vic.gov.au/careers/job-2",
+    ]
+    assert fallback_urls == [
+        "https://example.vic.gov.au/careers",
+        "https://example.vic.gov.au/careers/job-1",
+        "https://example.vic.gov.au/careers/job-2",
+    ]
+
+
+def test_streamed_fetches_close_error_responses_before_raising(fake_listing_get):
+    # A 429 reaches here once its Retry-After is longer than a run will wait.
+    for status_code in (429, 500):
+        fake_listing_get.respond = lambda url, **kwargs: _FakeListingResponse(status_code)
+        for fetch in (job_intake.fetch_listing_html, job_intake.fetch_binary_content):
+            with pytest.raises(requests.HTTPError):
+                fetch("https://example.vic.gov.au/careers")
+
+    assert len(fake_listing_get.responses) == 4
+    assert all(response.closed for response in fake_listing_get.responses)
 
 
 def test_checked_job_accumulator_dedupes_on_council_title_band_month(tmp_path):
@@ -861,6 +1574,47 @@ def test_checked_job_accumulator_merges_secondary_conflicting_band_into_official
     ]
 
 
+def test_refresh_checked_job_accumulator_saves_secondary_snapshot_alongside_merge(tmp_path, monkeypatch):
+    registry = {
+        "rows": [
+            {"short_name": "Banyule", "council_name": "Banyule City Council", "poll_tier": "A"},
+        ]
+    }
+    job = {
+        "job_title": "Sports Turf Groundsperson & Tractor Operator",
+        "short_name": "Banyule",
+        "council_name": "Banyule City Council",
+        "classification_band": "Band 4",
+        "canonical_reference_month": "2026-05",
+    }
+    official_payload = {
+        "set_id": "official",
+        "fetched_at": "2026-05-22T00:00:00+00:00",
+        "rows": [{**job, "job_url": "https://banyule.pulsesoftware.com/Pulse/job/65FSB9/Sports-Turf"}],
+    }
+    secondary_payload = {
+        "set_id": "secondary",
+        "fetched_at": "2026-05-22T01:00:00+00:00",
+        "rows": [{**job, "job_url": "https://www.councildirect.com.au/job/sports-turf"}],
+    }
+    secondary_snapshot_path = tmp_path / "secondary-snapshot.json"
+    monkeypatch.setattr(job_intake, "JOB_INTAKE_SECONDARY_SNAPSHOT_PATH", secondary_snapshot_path)
+    monkeypatch.setattr(job_intake, "job_intake_wide_fetch_preview", lambda **_kwargs: official_payload)
+    monkeypatch.setattr(job_intake, "job_intake_secondary_preview", lambda **_kwargs: secondary_payload)
+
+    accumulated = job_intake.refresh_checked_job_accumulator(
+        registry_payload=registry,
+        snapshot_path=tmp_path / "snapshot.json",
+        accumulator_path=tmp_path / "checked-jobs.json",
+    )
+
+    assert accumulated["rows"][0]["source_kinds_seen"] == ["official", "secondary"]
+    saved = job_intake.load_job_intake_snapshot(snapshot_path=secondary_snapshot_path)
+    assert saved["snapshot_exists"] is True
+    assert [row["job_url"] for row in saved["rows"]] == ["https://www.councildirect.com.au/job/sports-turf"]
+    assert accumulated["refresh_summary"]["secondary"] == saved["summary"]
+
+
 def test_checked_job_accumulator_keeps_distinct_official_same_title_jobs(tmp_path):
     accumulator_path = tmp_path / "checked-jobs.json"
     registry = {
@@ -969,6 +1723,136 @@ def test_checked_job_accumulator_keeps_history_when_official_job_disappears(tmp_
     assert accumulated["summary"]["current_official_jobs"] == 1
     assert accumulated["summary"]["historical_jobs"] == 1
 
+    journal_path = accumulator_path.with_suffix(".jsonl")
+    journal_lines = len(journal_path.read_text(encoding="utf-8").splitlines()) if journal_path.exists() else 0
+    third = accumulate_checked_jobs_from_payload(
+        {**second_payload, "fetched_at": "2026-06-15T00:00:00+00:00"},
+        accumulator_path=accumulator_path,
+        registry_payload=registry,
+        source_kind="official",
+        mark_missing_historical=True,
+    )
+
+    reloaded = load_checked_job_accumulator(accumulator_path=accumulator_path, registry_payload=registry)
+    for payload in (third, reloaded):
+        works_officer = next(row for row in payload["rows"] if row["job_title"] == "Works Officer")
+        assert works_officer["observed_status"] == "historical_not_seen_latest"
+        assert works_officer["first_absent_at"] == "2026-05-15T00:00:00+00:00"
+        assert works_officer["last_absent_at"] == "2026-06-15T00:00:00+00:00"
+    # Only the re-seen row and the run header are journalled.
+    assert len(journal_path.read_text(encoding="utf-8").splitlines()) == journal_lines + 2
+
+
+def test_checked_job_accumulator_appends_later_runs_to_journal(tmp_path):
+    accumulator_path = tmp_path / "checked-jobs.json"
+    registry = {
+        "rows": [
+            {"short_name": "Example", "council_name": "Example City Council", "poll_tier": "A"},
+        ]
+    }
+
+    def payload(fetched_at, titles):
+        return {
+            "set_id": "job_intake_scrape_preview",
+            "fetched_at": fetched_at,
+            "rows": [
+                {
+                    "job_title": title,
+                    "job_url": f"https://example.test/jobs/{index}",
+                    "short_name": "Example",
+                    "council_name": "Example City Council",
+                    "classification_band": "Band 5",
+                    "canonical_reference_month": "2026-04",
+                }
+                for index, title in enumerate(titles, start=1)
+            ],
+        }
+
+    accumulate_checked_jobs_from_payload(
+        payload("2026-04-15T00:00:00+00:00", ["Governance Officer", "Works Officer", "Planning Officer"]),
+        accumulator_path=accumulator_path,
+        registry_payload=registry,
+    )
+    base_text = accumulator_path.read_text(encoding="utf-8")
+    accumulated = accumulate_checked_jobs_from_payload(
+        payload("2026-05-15T00:00:00+00:00", ["Library Officer"]),
+        accumulator_path=accumulator_path,
+        registry_payload=registry,
+    )
+    loaded = load_checked_job_accumulator(
+        accumulator_path=accumulator_path,
+        registry_payload=registry,
+    )
+
+    journal_path = accumulator_path.with_suffix(".jsonl")
+    assert accumulator_path.read_text(encoding="utf-8") == base_text
+    assert len(journal_path.read_text(encoding="utf-8").splitlines()) == 2
+    assert [row["job_title"] for row in loaded["rows"]] == [row["job_title"] for row in accumulated["rows"]]
+    assert loaded["summary"]["checked_classified_jobs"] == 4
+    assert loaded["latest_run_id"] == accumulated["latest_run_id"]
+
+    with journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"row": {"dedupe_key"')
+    assert load_checked_job_accumulator(
+        accumulator_path=accumulator_path,
+        registry_payload=registry,
+    )["summary"]["checked_classified_jobs"] == 4
+
+    with journal_path.open("ab") as handle:
+        handle.write('\n{"row": {"job_title": "Caf\u00e9'.encode("utf-8")[:-1])
+    assert load_checked_job_accumulator(
+        accumulator_path=accumulator_path,
+        registry_payload=registry,
+    )["summary"]["checked_classified_jobs"] == 4
+
+
+def test_checked_job_accumulator_ignores_journal_left_over_from_a_full_save(tmp_path):
+    accumulator_path = tmp_path / "checked-jobs.json"
+    journal_path = accumulator_path.with_suffix(".jsonl")
+    registry = {
+        "rows": [
+            {"short_name": "Example", "council_name": "Example City Council", "poll_tier": "A"},
+        ]
+    }
+
+    for fetched_at, title in (
+        ("2026-04-15T00:00:00+00:00", "Governance Officer"),
+        ("2026-05-15T00:00:00+00:00", "Library Officer"),
+    ):
+        accumulate_checked_jobs_from_payload(
+            {
+                "set_id": "job_intake_scrape_preview",
+                "fetched_at": fetched_at,
+                "rows": [
+                    {
+                        "job_title": title,
+                        "job_url": "https://example.test/jobs/1",
+                        "short_name": "Example",
+                        "council_name": "Example City Council",
+                        "classification_band": "Band 5",
+                        "canonical_reference_month": "2026-04",
+                    }
+                ],
+            },
+            accumulator_path=accumulator_path,
+            registry_payload=registry,
+        )
+    stale_journal = journal_path.read_bytes()
+    assert b"Library Officer" in stale_journal
+
+    loaded = load_checked_job_accumulator(accumulator_path=accumulator_path, registry_payload=registry)
+    loaded["latest_run_id"] = "full-save-run"
+    for row in loaded["rows"]:
+        row["review_note"] = "checked by hand"
+    save_checked_job_accumulator(loaded, accumulator_path=accumulator_path, registry_payload=registry)
+    # The save stopped after writing the new base and before deleting the journal.
+    journal_path.write_bytes(stale_journal)
+
+    reloaded = load_checked_job_accumulator(accumulator_path=accumulator_path, registry_payload=registry)
+
+    assert reloaded["latest_run_id"] == "full-save-run"
+    assert [row["review_note"] for row in reloaded["rows"]] == ["checked by hand", "checked by hand"]
+
 
 def test_checked_job_accumulator_ingests_saved_snapshot(tmp_path):
     snapshot_path = tmp_path / "job-intake-snapshot.json"
@@ -1357,6 +2241,37 @@ def test_normalized_job_schema_keeps_advertised_and_reference_lanes_explicit():
     assert job["canonical_reference_date_source"] == "fetched_at"
 
 
+def test_normalized_job_schema_reads_salary_from_a_repeated_description_once():
+    description = "Closes 20/05/2026 Posted 3 May 2026 $45.50 per hour"
+    for detail_text, salary_text in ((description, "$45.50 per hour"), ("Level 5", "$45.50 per hour Level 5")):
+        job = normalize_council_job_record({
+            "job_title": "School Crossing Supervisor",
+            "job_url": "https://example.test/jobs/school-crossing-supervisor",
+            "description_text": description,
+            "detail_text": detail_text,
+        })
+
+        # The salary tail stops at the end of the evidence, not part-way into
+        # a second copy of the description.
+        assert job["salary_text"] == salary_text
+        assert job["salary_min"] == 45.5
+        assert job["salary_max"] == 45.5
+
+
+def test_normalized_job_schema_leaves_open_ended_closing_text_undated():
+    for closing_text in ("Ongoing", "N/A", "Applications welcome until position filled"):
+        job = normalize_council_job_record({
+            "job_title": "School Crossing Supervisor",
+            "job_url": "https://example.test/jobs/school-crossing-supervisor",
+            "posted_at_text": "4 May 2026",
+            "closing_at_text": closing_text,
+        })
+
+        assert job.get("closing_at") is None
+        assert job["closing_at_text"] == closing_text
+        assert job["canonical_reference_date_source"] == "posted_at"
+
+
 def test_salary_parser_expands_k_salary_ranges():
     salary_text = extract_salary_text("Permanent Full time Opportunity $126k - $140k per annum plus Superannuation")
 
@@ -1393,6 +2308,31 @@ def test_normalized_schema_extracts_reference_number_from_detail_text():
     assert job["standard_band_number"] == 6
 
 
+def test_normalized_schema_ignores_labels_inside_longer_words():
+    job = normalize_council_job_record({
+        "job_title": "Library Officer",
+        "job_url": "https://www.example.vic.gov.au/careers/library-officer",
+        "description_text": (
+            "Role reposted 1 May 2026 after xref: ZZ99. Posted 3 May 2026. "
+            "Closing date: 17 May 2026 5pm. Job No: LIB-204"
+        ),
+    })
+
+    assert job["posted_at"].startswith("2026-05-03")
+    assert job["closing_at"].startswith("2026-05-17T17:00:00")
+    assert job["job_number"] == "LIB-204"
+
+
+def test_normalized_schema_parses_dashed_day_first_closing_date():
+    job = normalize_council_job_record({
+        "job_title": "Maternal Child Health Nurse",
+        "job_url": "https://www.example.vic.gov.au/careers/mch-nurse",
+        "description_text": "Applications close 14-05-2026 5:00pm. Band 6.",
+    })
+
+    assert job["closing_at"].startswith("2026-05-14T17:00:00")
+
+
 def test_normalized_schema_extracts_bayside_month_first_closing_date():
     job = normalize_council_job_record({
         "job_title": "Domestic Cleaner",
@@ -1543,6 +2483,8 @@ def test_linked_position_description_pdf_becomes_schema_evidence():
     assert normalized["salary_max"] == 116244.43
     assert normalized["salary_period"] == "year"
     assert normalized["governance_status"] == "auto_included"
+    # The scrape preview relies on this: enriched jobs are not renormalised.
+    assert normalize_council_job_record(normalized) == normalized
 
 
 def test_position_description_gateway_pdf_becomes_schema_evidence():
@@ -1585,6 +2527,36 @@ def test_position_description_gateway_pdf_becomes_schema_evidence():
     assert normalized["governance_status"] == "auto_included"
 
 
+def test_detail_enrichment_skips_placeholder_and_non_page_job_links():
+    jobs = [
+        {"job_title": "N/A", "job_url": "https://jobs.example.vic.gov.au/jobs/1"},
+        {"job_title": "Planner", "job_url": "mailto:hr@example.vic.gov.au"},
+        {"job_title": "Engineer", "job_url": "javascript:void(0)"},
+        {"job_title": "Ranger", "job_url": "#apply"},
+        {"job_title": "Librarian", "job_url": "https://jobs.example.vic.gov.au/jobs/banner.png"},
+        {"job_title": "Arborist", "job_url": "https://jobs.example.vic.gov.au/jobs/arborist"},
+    ]
+    fetched = []
+
+    def fetcher(url):
+        fetched.append(url)
+        return "<p>Band 4 $70,000 per annum</p>", {"http_status": 200}
+
+    enriched, summary = job_intake._enrich_jobs_from_detail_pages(
+        jobs,
+        fetcher=fetcher,
+        binary_fetcher=lambda url: (b"", {}),
+        detail_job_limit=1,
+        attachment_job_limit=0,
+        max_workers=2,
+        fetch_linked_documents=False,
+    )
+
+    assert fetched == ["https://jobs.example.vic.gov.au/jobs/arborist"]
+    assert enriched[5]["classification_band"] == "Band 4"
+    assert enriched[0] is jobs[0]
+
+
 def test_scrape_preview_fetches_position_description_pdf_even_when_detail_has_band():
     pdf_bytes = _pdf_bytes_with_text(
         "Position Description\n"
@@ -1698,6 +2670,21 @@ def test_docx_information_pack_links_are_attachment_candidates():
     assert links[0]["content_type"] == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
 
+def test_image_linked_as_position_description_is_not_downloaded():
+    def binary_fetcher(url):
+        raise AssertionError(f"unexpected download of {url}")
+
+    enriched = enrich_job_from_detail_page(
+        {"job_title": "Planner", "job_url": "https://example.vic.gov.au/careers/planner"},
+        {"listing_url": "https://example.vic.gov.au/careers"},
+        '<a href="/files/position-description-banner.png">Position Description</a>',
+        binary_fetcher=binary_fetcher,
+    )
+
+    assert enriched["attachments"][0]["kind"] == "position_description"
+    assert "position_description_text" not in enriched
+
+
 def test_embedded_document_urls_are_attachment_candidates():
     pdf_url = "https://forms.boroondara.vic.gov.au/index.php?gf-download=2026%2F05%2FPD-CT-Data-Visualisation-Specialist-.pdf&form-id=146"
 
@@ -1711,6 +2698,20 @@ def test_embedded_document_urls_are_attachment_candidates():
     assert links[0]["kind"] == "position_description"
 
 
+def test_share_button_links_to_position_descriptions_are_not_attachment_candidates():
+    pdf_url = "https://www.example.vic.gov.au/files/position-description-planner.pdf"
+
+    links = extract_attachment_links_from_html(
+        f'<a href="{pdf_url}">Position Description</a>'
+        f'<a href="https://www.facebook.com/sharer/sharer.php?u={pdf_url}">Share</a>'
+        f'<a href="https://www.linkedin.com/shareArticle?url={pdf_url}">Position Description</a>'
+        f'<a data-share="//twitter.com/intent/tweet?url={pdf_url}">Tweet</a>',
+        "https://www.example.vic.gov.au/careers/planner",
+    )
+
+    assert [link["url"] for link in links] == [pdf_url]
+
+
 def test_aurion_recadvert_links_are_normalized_to_portal_file_endpoint():
     links = extract_attachment_links_from_html(
         '<a href="file/recadvert/T303~|~2912315474772099~1~|~00H2MEO7RZ1FDPFC~|~PDF~|~2~|~Position Description - 1514 - Business Systems Officer.pdf">Position Description - 1514 - Business Systems Officer.pdf</a>',
@@ -1893,6 +2894,12 @@ def test_scrape_preview_resolves_aurion_band_from_recadvert_pdf():
     assert row["position_description_text_source"] == "position_description_pdf"
 
 
+def test_extract_pdf_text_drops_control_characters():
+    pdf_bytes = _pdf_bytes_with_text("Band\x07 5 Sal\x00ary $1\x1b00")
+
+    assert job_intake.extract_pdf_text(pdf_bytes) == "Band 5 Salary $100"
+
+
 def _pdf_bytes_with_text(text):
     import pytest
 
@@ -3,6 +3,7 @@ import json
 from benchmarking_data_factory.workbench.intake_candidates import (
     build_intake_candidate_rows_from_sources,
     candidate_lgas,
+    clone_json_value,
     intake_acceptance_state,
     load_candidate_rows_from_path,
     load_intake_decisions_from_path,
@@ -83,6 +84,18 @@ def test_build_intake_candidate_rows_marks_source_and_scope_gates():
     assert unmatched["processing_gated"] is True
 
 
+def test_clone_json_value_copies_nested_containers():
+    row = {"Agreement ID": "AE1", "lgas": ["Example"], "scope": {"flags": [1, 2.5, None, True]}}
+
+    cloned = clone_json_value(row)
+    cloned["lgas"].append("Other")
+    cloned["scope"]["flags"].clear()
+
+    assert cloned != row
+    assert row == {"Agreement ID": "AE1", "lgas": ["Example"], "scope": {"flags": [1, 2.5, None, True]}}
+    assert clone_json_value(row) == json.loads(json.dumps(row))
+
+
 def test_load_intake_decisions_accepts_list_and_dict_payloads(tmp_path):
     list_path = tmp_path / "list.json"
     list_path.write_text(json.dumps({"decisions": [{"ae_id": "AE1", "status": "accepted"}]}), encoding="utf-8")
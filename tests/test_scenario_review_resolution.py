@@ -31,3 +31,25 @@ def test_source_table_only_scenario_does_not_block_section_completion():
 
     assert status == "done"
     assert data["blocking_results"] == []
+
+
+def test_future_awaiting_input_scenarios_share_one_trigger_review_date():
+    results = [
+        SimpleNamespace(
+            period_effective_from="2999-07-01",
+            period_label=label,
+            status="awaiting_input",
+            sub_status="",
+            reason="Waiting on a future rate cap.",
+            rule_id=None,
+            rule_quantum=None,
+            external_deps=(),
+        )
+        for label in ("2999-07-01", "3000-07-01")
+    ]
+
+    status, data = _scenario_section_resolution(results, "2026-05-04T00:00:00+00:00")
+
+    assert status == "done"
+    assert [item["trigger_type"] for item in data["future_triggers"]] == ["future_external_input"] * 2
+    assert {item["trigger_date"] for item in data["future_triggers"]} == {"2999-07-01"}